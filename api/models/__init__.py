@@ -1,8 +1,12 @@
-from .database import Base, engine, SessionLocal, get_db, init_db
+from .database import (
+    Base, engine, SessionLocal, get_db, init_db, QueryCounter,
+    async_engine, AsyncSessionLocal, get_async_db
+)
 from .models import Category, Product, Admin, BackgroundImage, FeaturedProduct
 from .schemas import *
 
 __all__ = [
-    'Base', 'engine', 'SessionLocal', 'get_db', 'init_db',
+    'Base', 'engine', 'SessionLocal', 'get_db', 'init_db', 'QueryCounter',
+    'async_engine', 'AsyncSessionLocal', 'get_async_db',
     'Category', 'Product', 'Admin', 'BackgroundImage', 'FeaturedProduct'
 ]
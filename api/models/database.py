@@ -2,23 +2,106 @@
 数据库基础配置
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
-from config.config import DatabaseConfig
+import asyncio
+import time
+from contextlib import AsyncExitStack, ExitStack
+from sqlalchemy import Delete, Insert, Update, create_engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from config.config import DatabaseConfig, DatabaseReplicaConfig
+from .pool_metrics import PoolMetrics, TimedQueuePool, TimedAsyncAdaptedQueuePool
 
 # 创建数据库引擎
 engine = create_engine(
     DatabaseConfig.get_url(),
-    pool_size=10,
-    max_overflow=20,
-    pool_timeout=30,
-    pool_recycle=3600,
+    poolclass=TimedQueuePool,
+    **DatabaseConfig.pool_options(),
     echo=False
 )
+sync_pool_metrics = PoolMetrics("sync")
+sync_pool_metrics.attach(engine)
 
 # 创建会话工厂
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _create_async_engine(url: str):
+    """创建异步引擎（SQLite不使用连接池参数）"""
+    if make_url(url).get_backend_name() == "sqlite":
+        return create_async_engine(url, echo=False)
+    return create_async_engine(
+        url,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        **DatabaseConfig.pool_options(),
+        echo=False
+    )
+
+# 创建异步数据库引擎，供公开读取接口使用
+async_engine = _create_async_engine(DatabaseConfig.get_async_url())
+async_pool_metrics = PoolMetrics("async")
+async_pool_metrics.attach(async_engine.sync_engine)
+
+# 创建异步会话工厂（提交后不使对象过期，避免在事件循环中触发隐式加载）
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+class RoutingSession(Session):
+    """
+    读写分离会话：查询发往从库，刷新和INSERT/UPDATE/DELETE语句发往主库
+    会话写入过一次后（或use_primary为True时）后续查询也走主库，保证读到自己的写入
+    """
+
+    def __init__(self, primary, replica, **kwargs):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica
+        self.use_primary = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            self.use_primary = True
+        return self.primary if self.use_primary else self.replica
+
+# 同步和异步引擎的连接池统计，启用从库时追加从库的连接池
+_pools = [(engine, sync_pool_metrics), (async_engine.sync_engine, async_pool_metrics)]
+
+if DatabaseReplicaConfig.ENABLED:
+    # 从库引擎，供公开读取接口使用（连接池参数与主库相同）
+    replica_engine = create_engine(
+        DatabaseReplicaConfig.get_url(),
+        poolclass=TimedQueuePool,
+        **DatabaseConfig.pool_options(),
+        echo=False
+    )
+    async_replica_engine = _create_async_engine(DatabaseReplicaConfig.get_async_url())
+    for _bound, _name in ((replica_engine, "replica-sync"), (async_replica_engine.sync_engine, "replica-async")):
+        _metrics = PoolMetrics(_name)
+        _metrics.attach(_bound)
+        _pools.append((_bound, _metrics))
+
+    ReadSessionLocal = sessionmaker(
+        class_=RoutingSession, autocommit=False, autoflush=False,
+        primary=engine, replica=replica_engine
+    )
+    AsyncReadSessionLocal = async_sessionmaker(
+        class_=AsyncSession, sync_session_class=RoutingSession, autoflush=False, expire_on_commit=False,
+        primary=async_engine.sync_engine, replica=async_replica_engine.sync_engine
+    )
+else:
+    replica_engine = async_replica_engine = None
+    ReadSessionLocal = SessionLocal
+    AsyncReadSessionLocal = AsyncSessionLocal
+
+def pool_metrics(reset: bool = False) -> list:
+    """返回本进程各连接池（同步、异步及从库）的统计，reset为True时读取后清零累计值"""
+    snapshots = []
+    for bound, metrics in _pools:
+        snapshots.append(metrics.snapshot(bound.pool))
+        if reset:
+            metrics.reset()
+    return snapshots
+
 # 创建基础模型类
 Base = declarative_base()
 
@@ -30,6 +113,75 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """获取异步数据库会话"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def init_db():
     """初始化数据库"""
     Base.metadata.create_all(bind=engine)
+
+# 连接池预热失败后的最长重试间隔（秒）
+WARM_UP_MAX_DELAY = 30
+
+def _warm_up_sync(connections: int):
+    """同时打开多个同步连接后全部归还连接池"""
+    with ExitStack() as stack:
+        for _ in range(connections):
+            stack.enter_context(engine.connect()).execute(text("SELECT 1"))
+
+async def _warm_up_async(connections: int):
+    """同时打开多个异步连接后全部归还连接池"""
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            connection = await stack.enter_async_context(async_engine.connect())
+            await connection.execute(text("SELECT 1"))
+
+async def warm_up_pools(connections: int):
+    """
+    在后台预热同步和异步连接池，使首批请求不必等待建立连接
+    数据库暂时不可用时按指数退避重试，直到成功或任务被取消
+    """
+    if connections <= 0:
+        return
+    delay = 1
+    started = time.perf_counter()
+    while True:
+        try:
+            await asyncio.to_thread(_warm_up_sync, connections)
+            await _warm_up_async(connections)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"🔥 连接池预热完成: 同步和异步各 {connections} 个连接 ({elapsed:.0f}ms)")
+            return
+        except Exception as e:
+            print(f"⚠️ 连接池预热失败，{delay}秒后重试: {str(e)}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARM_UP_MAX_DELAY)
+
+class QueryCounter:
+    """
+    统计代码块内执行的SQL语句数量，用于检测N+1查询
+
+    用法:
+        with QueryCounter() as counter:
+            ...
+        print(counter.count, counter.statements)
+    """
+
+    def __init__(self, bind=None):
+        self.bind = bind if bind is not None else engine
+        self.count = 0
+        self.statements = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.bind, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        event.remove(self.bind, "before_cursor_execute", self._on_execute)
+        return False
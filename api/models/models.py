@@ -2,7 +2,7 @@
 数据库模型定义
 """
 
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
@@ -44,7 +44,7 @@ class Product(Base):
     images = Column(Text, nullable=True, comment="多图片URLs，JSON格式")
     sku = Column(String(100), nullable=True, unique=True, comment="商品编码")
     stock = Column(Integer, default=0, comment="库存数量")
-    sales_count = Column(Integer, default=0, comment="销售数量")
+    sales_count = Column(Integer, nullable=False, default=0, comment="销售数量")
     view_count = Column(Integer, default=0, comment="浏览次数")
     rating = Column(Float, default=0.0, comment="评分")
     tags = Column(String(500), nullable=True, comment="标签，逗号分隔")
@@ -52,13 +52,28 @@ class Product(Base):
     is_active = Column(Boolean, default=True, comment="是否启用")
     sort_order = Column(Integer, default=0, comment="排序")
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False, comment="分类ID")
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="创建时间")
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), comment="创建时间")
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), comment="更新时间")
     
     # 关联关系
     category = relationship("Category", back_populates="products")
     featured_products = relationship("FeaturedProduct", back_populates="product")
     
+    # 全文搜索索引（MySQL ngram分词，支持中文，仅在MySQL上创建）及游标分页排序索引
+    __table_args__ = (
+        Index(
+            "ft_products_search",
+            "name", "name_en", "name_zh",
+            "description", "description_en", "description_zh",
+            "tags",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+        Index("ix_products_active_price", "is_active", "price", "id"),
+        Index("ix_products_active_sales", "is_active", "sales_count", "id"),
+        Index("ix_products_active_created", "is_active", "created_at", "id"),
+    )
+    
     def __repr__(self):
         return f"<Product(id={self.id}, name='{self.name}', price={self.price})>"
 
@@ -0,0 +1,187 @@
+"""
+数据库连接池统计
+记录每个进程中连接池的使用情况：借出/溢出连接数、获取连接的等待时间、连接被占用的时间和连接存活时间，
+用于根据工作进程数调整连接池大小（管理接口 /api/admin/metrics/db-pool）
+"""
+
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 直方图各区间的上限（毫秒），超过最后一个上限的计入 "+Inf"
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+class Histogram:
+    """固定区间的耗时直方图（线程安全）"""
+
+    def __init__(self, bounds=BUCKETS_MS):
+        self.bounds = bounds
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.counts = [0] * (len(self.bounds) + 1)
+            self.total = 0.0
+            self.max = 0.0
+
+    def observe(self, seconds: float):
+        milliseconds = seconds * 1000
+        index = bisect.bisect_left(self.bounds, milliseconds)
+        with self.lock:
+            self.counts[index] += 1
+            self.total += milliseconds
+            if milliseconds > self.max:
+                self.max = milliseconds
+
+    def snapshot(self) -> dict:
+        """返回各区间计数（非累计）、总次数、平均值和最大值（毫秒）"""
+        with self.lock:
+            counts = list(self.counts)
+            total, maximum = self.total, self.max
+        count = sum(counts)
+        labels = [f"<={bound}ms" for bound in self.bounds] + ["+Inf"]
+        return {
+            "count": count,
+            "avg_ms": round(total / count, 2) if count else 0,
+            "max_ms": round(maximum, 2),
+            "buckets": dict(zip(labels, counts)),
+        }
+
+class PoolMetrics:
+    """单个引擎连接池的统计，通过连接池事件采集"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lock = threading.Lock()
+        self.wait = Histogram()
+        self.hold = Histogram()
+        self.connected_at: Dict[int, float] = {}
+        self.reset()
+
+    def reset(self):
+        """清零累计计数和直方图（当前连接的存活时间不受影响）"""
+        with self.lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.connects = 0
+            self.invalidations = 0
+        self.wait.reset()
+        self.hold.reset()
+
+    def attach(self, engine):
+        """在同步引擎（异步引擎传入 sync_engine）上注册连接池事件"""
+        engine.pool.metrics = self
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "detach", self._on_close)
+
+    def observe_wait(self, seconds: float, timed_out: bool = False):
+        """记录一次获取连接的等待时间（由 TimedQueuePool 调用）"""
+        self.wait.observe(seconds)
+        if timed_out:
+            with self.lock:
+                self.timeouts += 1
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self.lock:
+            self.connects += 1
+            self.connected_at[id(connection_record)] = time.monotonic()
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.monotonic()
+        with self.lock:
+            self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            self.hold.observe(time.monotonic() - checked_out_at)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self.lock:
+            self.invalidations += 1
+
+    def _on_close(self, dbapi_connection, connection_record):
+        with self.lock:
+            self.connected_at.pop(id(connection_record), None)
+
+    def snapshot(self, pool) -> dict:
+        """连接池当前状态和累计统计"""
+        now = time.monotonic()
+        with self.lock:
+            ages = [now - connected_at for connected_at in self.connected_at.values()]
+            counters = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+            }
+        return {
+            "name": self.name,
+            "pool_class": type(pool).__name__,
+            "status": _pool_status(pool),
+            **counters,
+            "wait": self.wait.snapshot(),
+            "hold": self.hold.snapshot(),
+            "connection_age": _age_summary(ages),
+        }
+
+def _pool_status(pool) -> dict:
+    """QueuePool的容量和占用情况，其他连接池（如SQLite使用的）只返回能取到的部分"""
+    status = {}
+    for key, method in (("size", "size"), ("checked_out", "checkedout"),
+                        ("checked_in", "checkedin"), ("overflow", "overflow")):
+        if hasattr(pool, method):
+            status[key] = getattr(pool, method)()
+    if hasattr(pool, "_max_overflow"):
+        status["max_overflow"] = pool._max_overflow
+        status["timeout"] = pool.timeout()
+    return status
+
+def _age_summary(ages: List[float]) -> dict:
+    """连接存活时间（秒）的最小、平均、最大值"""
+    if not ages:
+        return {"count": 0, "min_s": 0, "avg_s": 0, "max_s": 0}
+    return {
+        "count": len(ages),
+        "min_s": round(min(ages), 1),
+        "avg_s": round(sum(ages) / len(ages), 1),
+        "max_s": round(max(ages), 1),
+    }
+
+class _TimedPoolMixin:
+    """记录从连接池获取连接的耗时（包括排队等待和新建连接），超时同样计入"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.observe_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() 会重建连接池，沿用原来的统计
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """记录等待时间的同步连接池"""
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """记录等待时间的异步连接池"""
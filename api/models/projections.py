@@ -0,0 +1,36 @@
+"""
+列表接口的列投影
+列表只输出部分字段时按接口选择需要的列，查询结果为轻量的行元组，
+避免加载描述（Text）、图片列表等大字段后再丢弃
+"""
+
+from sqlalchemy import func
+from .models import Product
+
+def language_column(model, field: str, lang_code: str):
+    """
+    多语言接口的本地化列：英文取 {field}_en（为空时回退到默认字段），其他语言取默认字段
+    回退在数据库中完成，每行只返回一列，列名为field
+    """
+    column = getattr(model, field)
+    if lang_code == "en":
+        return func.coalesce(func.nullif(getattr(model, f"{field}_en"), ""), column).label(field)
+    return column.label(field)
+
+def language_product_list_columns(lang_code: str) -> tuple:
+    """/language/{lang}/products 列表输出的列（另含游标分页所需的排序字段）"""
+    return (
+        Product.id,
+        language_column(Product, "name", lang_code),
+        language_column(Product, "description", lang_code),
+        Product.price,
+        Product.original_price,
+        Product.image_url,
+        Product.images,
+        Product.is_featured,
+        Product.rating,
+        Product.sales_count,
+        Product.stock,
+        Product.category_id,
+        Product.created_at,
+    )
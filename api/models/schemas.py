@@ -3,8 +3,9 @@ Pydantic 模型定义
 用于API请求和响应的数据验证
 """
 
+from functools import lru_cache
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from typing import Any, Optional, List, Type
 from datetime import datetime
 
 # 基础模型
@@ -107,13 +108,49 @@ class ProductResponse(ProductBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     category: Optional[CategoryResponse] = None
+    image_variants: Optional[dict] = Field(None, description="主图的响应式版本（srcset），未生成时为空")
     
     class Config:
         from_attributes = True
 
 class ProductListResponse(BaseModel):
     items: List[ProductResponse]
-    pagination: PaginationResponse
+    pagination: Optional[PaginationResponse] = None
+    next_cursor: Optional[str] = Field(None, description="下一页游标（游标分页模式，无更多数据时为空）")
+
+# 快速序列化
+# 按响应模型的字段直接从ORM对象（或查询结果行）读取属性生成字典，不经过pydantic校验，
+# 配合 FastJSONResponse 直接序列化为字节；字段集合由响应模型决定，保证接口结构不变
+
+@lru_cache(maxsize=None)
+def _response_fields(schema: Type[BaseModel]) -> tuple:
+    """响应模型的 (字段名, 默认值) 列表"""
+    return tuple(
+        (name, field.get_default(call_default_factory=True))
+        for name, field in schema.model_fields.items()
+    )
+
+def serialize_row(schema: Type[BaseModel], row: Any, **values) -> dict:
+    """
+    按响应模型字段从row读取属性，row缺少的字段取模型默认值
+    values用于覆盖同名字段（本地化名称、关联对象等派生值）
+    """
+    data = {}
+    for name, default in _response_fields(schema):
+        if name in values:
+            data[name] = values[name]
+        else:
+            data[name] = getattr(row, name, default)
+    return data
+
+def serialize_category(category: Any, **values) -> dict:
+    """分类 -> CategoryResponse 结构的字典"""
+    return serialize_row(CategoryResponse, category, **values)
+
+def serialize_product(product: Any, category: Optional[dict] = None, **values) -> dict:
+    """产品 -> ProductResponse 结构的字典，category为已序列化的分类"""
+    values.setdefault("stock_quantity", product.stock)
+    return serialize_row(ProductResponse, product, category=category, **values)
 
 # 管理员相关模型
 class AdminLogin(BaseModel):
@@ -206,6 +243,7 @@ class BackgroundImageResponse(BackgroundImageBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
+    image_variants: Optional[dict] = Field(None, description="背景图的响应式版本（srcset），未生成时为空")
     
     class Config:
         from_attributes = True
@@ -3,6 +3,7 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -15,33 +16,41 @@ from api.models.schemas import (
     BaseResponse
 )
 from api.utils.auth import get_current_admin
+from api.utils.cache import site_cache, ABOUT_US
+from api.utils.conditional import conditional_get
+from api.utils.read_replica import async_read_db
 
 router = APIRouter(prefix="/about-us", tags=["关于我们"])
 
-@router.get("/", response_model=AboutUsResponse)
-async def get_about_us(db: Session = Depends(get_db)):
+def load_about_us(db: Session):
+    """从数据库加载启用的关于我们信息（无数据时返回默认值）"""
+    about_us = db.query(AboutUs).filter(AboutUs.is_active == True).first()
+    
+    if not about_us:
+        # 如果没有数据，返回默认数据
+        default_data = AboutUs(
+            id=0,
+            title="关于我们",
+            title_en="About Us",
+            title_zh="关于我们",
+            content="我们致力于为客户提供高质量的产品和优质的服务体验。\n\n通过持续的创新和改进，我们不断满足客户的需求，创造更大的价值。",
+            content_en="We are committed to providing customers with high-quality products and excellent service experience.\n\nThrough continuous innovation and improvement, we constantly meet customer needs and create greater value.",
+            content_zh="我们致力为客户提供高质量的产品和优质的服务体验。\n\n通过持续的创新和改进，我们不断满足客户的需求，创造更大的价值。",
+            background_image_url=None,
+            text_color="#333333",
+            background_overlay="rgba(255, 255, 255, 0.8)",
+            is_active=True
+        )
+        return default_data
+    
+    return about_us
+
+@router.get("/", response_model=AboutUsResponse, dependencies=[Depends(conditional_get(ABOUT_US))])
+async def get_about_us(db: AsyncSession = Depends(async_read_db(ABOUT_US))):
     """获取关于我们信息"""
     try:
-        about_us = db.query(AboutUs).filter(AboutUs.is_active == True).first()
-        
-        if not about_us:
-            # 如果没有数据，返回默认数据
-            default_data = AboutUs(
-                id=0,
-                title="关于我们",
-                title_en="About Us",
-                title_zh="关于我们",
-                content="我们致力于为客户提供高质量的产品和优质的服务体验。\n\n通过持续的创新和改进，我们不断满足客户的需求，创造更大的价值。",
-                content_en="We are committed to providing customers with high-quality products and excellent service experience.\n\nThrough continuous innovation and improvement, we constantly meet customer needs and create greater value.",
-                content_zh="我们致力为客户提供高质量的产品和优质的服务体验。\n\n通过持续的创新和改进，我们不断满足客户的需求，创造更大的价值。",
-                background_image_url=None,
-                text_color="#333333",
-                background_overlay="rgba(255, 255, 255, 0.8)",
-                is_active=True
-            )
-            return default_data
-        
-        return about_us
+        # 优先读取缓存，内容变更时由管理接口失效
+        return await site_cache.get_or_load_async(ABOUT_US, None, lambda: db.run_sync(load_about_us))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -75,6 +84,7 @@ async def get_about_us_admin(
             db.add(default_about_us)
             db.commit()
             db.refresh(default_about_us)
+            site_cache.invalidate(ABOUT_US)
             return default_about_us
         
         return about_us
@@ -103,6 +113,7 @@ async def create_about_us(
         new_about_us = AboutUs(**about_us_data.dict())
         db.add(new_about_us)
         db.commit()
+        site_cache.invalidate(ABOUT_US)
         
         return BaseResponse(message="关于我们信息创建成功")
     except HTTPException:
@@ -148,6 +159,7 @@ async def update_about_us(
                 setattr(about_us, key, value)
         
         db.commit()
+        site_cache.invalidate(ABOUT_US)
         return BaseResponse(message="关于我们信息更新成功")
     except Exception as e:
         db.rollback()
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from api.models import get_db, Admin
 from api.models.schemas import AdminCreate, AdminUpdate, AdminResponse
 from api.utils import get_current_admin, hash_password, get_admin_by_username, get_admin_by_email
+from api.utils.auth_cache import invalidate_admins
 
 router = APIRouter(prefix="/admin/admins", tags=["管理员管理"])
 
@@ -186,6 +187,7 @@ def update_admin(
     
     db.commit()
     db.refresh(admin)
+    invalidate_admins()
     
     return AdminResponse(
         id=admin.id,
@@ -226,5 +228,6 @@ def delete_admin(
     
     db.delete(admin)
     db.commit()
+    invalidate_admins()
     
     return {"message": "管理员删除成功"}
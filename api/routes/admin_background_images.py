@@ -18,6 +18,7 @@ from ..models.schemas import (
     BaseResponse
 )
 from ..utils.auth import get_current_admin
+from ..utils.cache import site_cache, BACKGROUND_IMAGES
 
 router = APIRouter()
 
@@ -110,6 +111,7 @@ async def create_background_image(
         db.add(db_background_image)
         db.commit()
         db.refresh(db_background_image)
+        site_cache.invalidate(BACKGROUND_IMAGES)
         
         return BackgroundImageResponse.from_orm(db_background_image)
     except Exception as e:
@@ -154,6 +156,7 @@ async def update_background_image(
         
         db.commit()
         db.refresh(db_background_image)
+        site_cache.invalidate(BACKGROUND_IMAGES)
         
         return BackgroundImageResponse.from_orm(db_background_image)
     except Exception as e:
@@ -177,6 +180,7 @@ async def delete_background_image(
     try:
         db.delete(background_image)
         db.commit()
+        site_cache.invalidate(BACKGROUND_IMAGES)
         
         return BaseResponse(message="背景图删除成功")
     except Exception as e:
@@ -202,6 +206,7 @@ async def toggle_background_image_status(
         background_image.is_active = not background_image.is_active
         db.commit()
         db.refresh(background_image)
+        site_cache.invalidate(BACKGROUND_IMAGES)
         
         return BackgroundImageResponse.from_orm(background_image)
     except Exception as e:
@@ -228,6 +233,7 @@ async def update_background_image_sort(
         background_image.sort_order = sort_order
         db.commit()
         db.refresh(background_image)
+        site_cache.invalidate(BACKGROUND_IMAGES)
         
         return BackgroundImageResponse.from_orm(background_image)
     except Exception as e:
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from api.models import get_db, Admin, Category
 from api.models.schemas import CategoryCreate, CategoryUpdate, CategoryResponse
 from api.utils.auth import verify_token
+from api.utils.cache import site_cache, CATEGORIES
 
 router = APIRouter(prefix="/admin/categories", tags=["管理员分类管理"])
 
@@ -87,6 +88,7 @@ def create_category(
         
         db.add(db_category)
         db.commit()
+        site_cache.invalidate(CATEGORIES)
         db.refresh(db_category)
         
         return CategoryResponse(
@@ -137,6 +139,7 @@ def update_category(
             db_category.name_zh = update_data['name']
         
         db.commit()
+        site_cache.invalidate(CATEGORIES)
         db.refresh(db_category)
         
         return CategoryResponse(
@@ -181,6 +184,7 @@ def toggle_category_status(
         # 切换状态
         db_category.is_active = not db_category.is_active
         db.commit()
+        site_cache.invalidate(CATEGORIES)
         db.refresh(db_category)
         
         return {
@@ -225,6 +229,7 @@ def delete_category(
         # 删除分类
         db.delete(db_category)
         db.commit()
+        site_cache.invalidate(CATEGORIES)
         
         return {"message": "分类已删除"}
         
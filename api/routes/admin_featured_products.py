@@ -5,9 +5,10 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from api.models import get_db, Admin, FeaturedProduct, Product
+from api.models import get_db, Admin, FeaturedProduct, Product, Category
 from api.models.schemas import FeaturedProductResponse, FeaturedProductCreate, FeaturedProductUpdate
 from api.utils.auth import verify_token
+from api.utils.cache import site_cache, FEATURED_PRODUCTS
 
 router = APIRouter(prefix="/admin/featured-products", tags=["管理员特色产品管理"])
 
@@ -17,15 +18,15 @@ def get_all_featured_products(
     db: Session = Depends(get_db)
 ):
     """获取所有特色产品配置"""
-    featured_products = db.query(FeaturedProduct).order_by(
-        FeaturedProduct.position.asc()
-    ).all()
+    # 一次查询获取配置及关联的产品、分类
+    rows = db.query(FeaturedProduct, Product, Category).outerjoin(
+        Product, Product.id == FeaturedProduct.product_id
+    ).outerjoin(
+        Category, Category.id == Product.category_id
+    ).order_by(FeaturedProduct.position.asc()).all()
     
     result = []
-    for fp in featured_products:
-        # 获取关联的产品信息
-        product = db.query(Product).filter(Product.id == fp.product_id).first()
-        
+    for fp, product, category in rows:
         # 构建响应数据
         fp_data = {
             "id": fp.id,
@@ -38,10 +39,6 @@ def get_all_featured_products(
         }
         
         if product:
-            # 获取产品的分类信息
-            from api.models import Category
-            category = db.query(Category).filter(Category.id == product.category_id).first()
-            
             fp_data["product"] = {
                 "id": product.id,
                 "name": product.name,
@@ -98,19 +95,20 @@ def get_featured_positions(
     for i in range(1, 7):
         positions[str(i)] = None
     
-    # 查询已配置的位置
-    featured_products = db.query(FeaturedProduct).filter(
+    # 查询已配置的位置（连同产品名称和图片一次取出）
+    rows = db.query(FeaturedProduct, Product.name, Product.image_url).outerjoin(
+        Product, Product.id == FeaturedProduct.product_id
+    ).filter(
         FeaturedProduct.is_active == True
     ).all()
     
-    for fp in featured_products:
+    for fp, product_name, product_image in rows:
         if 1 <= fp.position <= 6:
-            product = db.query(Product).filter(Product.id == fp.product_id).first()
             positions[str(fp.position)] = {
                 "id": fp.id,
                 "product_id": fp.product_id,
-                "product_name": product.name if product else "产品不存在",
-                "product_image": product.image_url if product else None
+                "product_name": product_name if product_name is not None else "产品不存在",
+                "product_image": product_image
             }
     
     return positions
@@ -152,6 +150,7 @@ def create_featured_product(
         
         db.add(db_featured)
         db.commit()
+        site_cache.invalidate(FEATURED_PRODUCTS)
         db.refresh(db_featured)
         
         return FeaturedProductResponse(
@@ -221,6 +220,7 @@ def update_featured_product(
             setattr(db_featured, field, value)
         
         db.commit()
+        site_cache.invalidate(FEATURED_PRODUCTS)
         db.refresh(db_featured)
         
         return FeaturedProductResponse(
@@ -263,6 +263,7 @@ def delete_featured_product(
         # 删除配置
         db.delete(db_featured)
         db.commit()
+        site_cache.invalidate(FEATURED_PRODUCTS)
         
         return {"message": "特色产品配置已删除"}
         
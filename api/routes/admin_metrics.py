@@ -0,0 +1,39 @@
+"""
+运行指标API路由（管理员）
+"""
+
+import os
+from fastapi import APIRouter, Depends, HTTPException, status
+from api.models import Admin
+from api.models.database import pool_metrics
+from api.utils import get_current_admin
+from config.config import DatabaseConfig, ServerConfig
+
+router = APIRouter(prefix="/admin/metrics", tags=["运行指标"])
+
+@router.get("/db-pool")
+def get_db_pool_metrics(
+    reset: bool = False,
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    获取处理本次请求的工作进程的数据库连接池统计（需要超级用户权限）
+    各工作进程的连接池相互独立，多次请求可能由不同进程返回（见pid）；reset=true 时读取后清零累计值
+    """
+    if not current_admin.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="权限不足，需要超级用户权限"
+        )
+
+    workers = ServerConfig.WORKERS if ServerConfig.WORKERS > 0 else (os.cpu_count() or 1)
+    per_pool = DatabaseConfig.POOL_SIZE + DatabaseConfig.MAX_OVERFLOW
+    pools = pool_metrics(reset=reset)
+    return {
+        "pid": os.getpid(),
+        "workers": workers,
+        # 每个进程有同步和异步两个连接池（启用从库时从库另有两个），平滑重启期间新旧两组进程同时持有连接
+        "max_connections_per_worker": per_pool * len(pools),
+        "max_connections_total": per_pool * len(pools) * workers,
+        "pools": pools
+    }
@@ -7,12 +7,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from api.models.database import get_db
 from api.models.models import Product, Category
-from api.models.schemas import ProductResponse, ProductCreate, ProductUpdate
+from api.models.schemas import ProductResponse, ProductCreate, ProductUpdate, serialize_product
 from api.utils.auth import verify_token
+from api.utils.cache import site_cache, PRODUCTS
+from api.utils.responses import FastJSONResponse
 
 router = APIRouter(prefix="/admin/products", tags=["管理员产品管理"])
 
-@router.get("/")
+@router.get("/", response_class=FastJSONResponse)
 def get_all_products(
     skip: int = 0,
     limit: int = 100,
@@ -32,40 +34,8 @@ def get_all_products(
         # 分页查询
         products = query.offset(skip).limit(limit).all()
         
-        # 转换为响应格式
-        result = []
-        for product in products:
-            product_data = ProductResponse(
-                id=product.id,
-                name=product.name,
-                name_en=getattr(product, 'name_en', None),
-                name_zh=getattr(product, 'name_zh', None),
-                description=product.description,
-                description_en=getattr(product, 'description_en', None),
-                description_zh=getattr(product, 'description_zh', None),
-                price=product.price,
-                original_price=getattr(product, 'original_price', None),
-                image_url=product.image_url,
-                images=getattr(product, 'images', None),
-                sku=product.sku,
-                stock=product.stock,
-                tags=getattr(product, 'tags', None),
-                is_featured=getattr(product, 'is_featured', False),
-                is_active=product.is_active,
-                sort_order=getattr(product, 'sort_order', 0),
-                category_id=product.category_id,
-                sales_count=getattr(product, 'sales_count', 0),
-                view_count=getattr(product, 'view_count', 0),
-                rating=getattr(product, 'rating', 0.0),
-                created_at=product.created_at,
-                updated_at=product.updated_at
-            )
-            # 转换为字典并添加stock_quantity字段以保持前端兼容性
-            product_dict = product_data.dict()
-            product_dict['stock_quantity'] = product.stock
-            result.append(product_dict)
-        
-        return result
+        # 直接生成响应字典（包含stock_quantity字段以保持前端兼容性）
+        return FastJSONResponse([serialize_product(product) for product in products])
         
     except Exception as e:
         raise HTTPException(
@@ -73,7 +43,7 @@ def get_all_products(
             detail=f"获取产品列表失败: {str(e)}"
         )
 
-@router.get("/{product_id}")
+@router.get("/{product_id}", response_class=FastJSONResponse)
 def get_product(
     product_id: int,
     current_admin = Depends(verify_token),
@@ -89,36 +59,8 @@ def get_product(
                 detail="产品不存在"
             )
         
-        product_response = ProductResponse(
-            id=product.id,
-            name=product.name,
-            name_en=getattr(product, 'name_en', None),
-            name_zh=getattr(product, 'name_zh', None),
-            description=product.description,
-            description_en=getattr(product, 'description_en', None),
-            description_zh=getattr(product, 'description_zh', None),
-            price=product.price,
-            original_price=getattr(product, 'original_price', None),
-            image_url=product.image_url,
-            images=getattr(product, 'images', None),
-            sku=product.sku,
-            stock=product.stock,
-            tags=getattr(product, 'tags', None),
-            is_featured=getattr(product, 'is_featured', False),
-            is_active=product.is_active,
-            sort_order=getattr(product, 'sort_order', 0),
-            category_id=product.category_id,
-            sales_count=getattr(product, 'sales_count', 0),
-            view_count=getattr(product, 'view_count', 0),
-            rating=getattr(product, 'rating', 0.0),
-            created_at=product.created_at,
-            updated_at=product.updated_at
-        )
-        
-        # 转换为字典并添加stock_quantity字段
-        result = product_response.dict()
-        result['stock_quantity'] = product.stock
-        return result
+        # 直接生成响应字典（包含stock_quantity字段）
+        return FastJSONResponse(serialize_product(product))
         
     except HTTPException:
         raise
@@ -174,6 +116,7 @@ def create_product(
         
         db.add(db_product)
         db.commit()
+        site_cache.invalidate(PRODUCTS)
         db.refresh(db_product)
         
         return ProductResponse(
@@ -265,6 +208,7 @@ def update_product(
                 print(f"[DEBUG] 跳过不存在的字段: {field}")
         
         db.commit()
+        site_cache.invalidate(PRODUCTS)
         db.refresh(db_product)
         
         print(f"[DEBUG] 产品更新完成，新库存: {db_product.stock}")
@@ -328,6 +272,7 @@ def delete_product(
         # 删除产品
         db.delete(product)
         db.commit()
+        site_cache.invalidate(PRODUCTS)
         
         return {"success": True, "message": "产品删除成功"}
         
@@ -359,6 +304,7 @@ def toggle_product_status(
         # 切换状态
         db_product.is_active = not db_product.is_active
         db.commit()
+        site_cache.invalidate(PRODUCTS)
         db.refresh(db_product)
         
         return {
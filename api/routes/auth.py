@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from api.models import get_db, Admin
 from api.models.schemas import AdminLogin, TokenResponse, AdminResponse
 from api.utils import authenticate_admin, create_access_token, get_current_admin
+from api.utils.auth_cache import invalidate_admins
 from config.config import JWTConfig
 
 router = APIRouter(prefix="/admin", tags=["管理员"])
@@ -28,6 +29,7 @@ def admin_login(login_data: AdminLogin, db: Session = Depends(get_db)):
     from datetime import datetime
     admin.last_login = datetime.utcnow()
     db.commit()
+    invalidate_admins()
     
     # 创建访问令牌
     access_token_expires = timedelta(minutes=JWTConfig.ACCESS_TOKEN_EXPIRE_MINUTES)
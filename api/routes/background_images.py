@@ -4,10 +4,11 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
-from ..models.database import get_db
 from ..models.models import BackgroundImage
 from ..models.schemas import (
     BackgroundImageResponse, 
@@ -16,23 +17,30 @@ from ..models.schemas import (
 )
 from ..utils.auth import get_current_admin
 from ..utils.helpers import get_localized_field
+from ..utils.cache import site_cache, BACKGROUND_IMAGES
+from ..utils.conditional import conditional_get
+from ..utils.image_variants import image_variants
+from ..utils.read_replica import async_read_db
 
 router = APIRouter()
 
-@router.get("/", response_model=BackgroundImageListResponse)
+@router.get("/", response_model=BackgroundImageListResponse, dependencies=[Depends(conditional_get(BACKGROUND_IMAGES))])
 async def get_background_images(
     request: Request,
     page: int = Query(1, ge=1, description="页码"),
     size: int = Query(20, ge=1, le=100, description="每页数量"),
     is_active: Optional[bool] = Query(None, description="是否启用筛选"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(async_read_db(BACKGROUND_IMAGES))
 ):
     """
     获取背景图列表
     """
-    try:
+    # 本地化处理
+    lang = request.headers.get("Accept-Language", "zh-CN")
+    
+    def load_background_images(session: Session):
         # 构建查询
-        query = db.query(BackgroundImage)
+        query = session.query(BackgroundImage)
         
         # 筛选条件
         if is_active is not None:
@@ -48,9 +56,6 @@ async def get_background_images(
         skip = (page - 1) * size
         background_images = query.offset(skip).limit(size).all()
         
-        # 本地化处理
-        lang = request.headers.get("Accept-Language", "zh-CN")
-        
         processed_images = []
         for bg_img in background_images:
             bg_dict = {
@@ -62,6 +67,7 @@ async def get_background_images(
                 "subtitle_en": bg_img.subtitle_en,
                 "subtitle_zh": bg_img.subtitle_zh,
                 "image_url": bg_img.image_url,
+                "image_variants": image_variants(bg_img.image_url),
                 "button_text": get_localized_field(bg_img, "button_text", lang),
                 "button_text_en": bg_img.button_text_en,
                 "button_text_zh": bg_img.button_text_zh,
@@ -86,19 +92,28 @@ async def get_background_images(
                 pages=pages
             )
         )
+    
+    try:
+        # 优先读取缓存，背景图变更时由管理接口失效
+        # get_localized_field 仅区分 "en" 与其他值，缓存键按此归一化
+        cache_key = ("list", page, size, is_active, lang == "en")
+        return await site_cache.get_or_load_async(
+            BACKGROUND_IMAGES, cache_key, lambda: db.run_sync(load_background_images)
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取背景图列表失败: {str(e)}")
 
-@router.get("/{bg_id}", response_model=BackgroundImageResponse)
+@router.get("/{bg_id}", response_model=BackgroundImageResponse, dependencies=[Depends(conditional_get(BACKGROUND_IMAGES))])
 async def get_background_image(
     bg_id: int,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(async_read_db(BACKGROUND_IMAGES))
 ):
     """
     获取单个背景图详情
     """
-    background_image = db.query(BackgroundImage).filter(BackgroundImage.id == bg_id).first()
+    result = await db.execute(select(BackgroundImage).where(BackgroundImage.id == bg_id))
+    background_image = result.scalars().first()
     if not background_image:
         raise HTTPException(status_code=404, detail="背景图不存在")
     
@@ -114,6 +129,7 @@ async def get_background_image(
         "subtitle_en": background_image.subtitle_en,
         "subtitle_zh": background_image.subtitle_zh,
         "image_url": background_image.image_url,
+        "image_variants": image_variants(background_image.image_url),
         "button_text": get_localized_field(background_image, "button_text", lang),
         "button_text_en": background_image.button_text_en,
         "button_text_zh": background_image.button_text_zh,
@@ -5,17 +5,20 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Header
 from sqlalchemy.orm import Session
-from api.models import get_db, Category
+from api.models import Category
 from api.models.schemas import CategoryResponse
 from api.utils import get_language_from_request, get_localized_field
+from api.utils.cache import CATEGORIES
+from api.utils.conditional import conditional_get
+from api.utils.read_replica import read_db
 
 router = APIRouter(prefix="/categories", tags=["分类"])
 
-@router.get("/", response_model=List[CategoryResponse])
+@router.get("/", response_model=List[CategoryResponse], dependencies=[Depends(conditional_get(CATEGORIES))])
 def get_categories(
     request: Request,
     accept_language: str = Header(None),
-    db: Session = Depends(get_db)
+    db: Session = Depends(read_db(CATEGORIES))
 ):
     """获取分类列表"""
     categories = db.query(Category).filter(
@@ -45,12 +48,12 @@ def get_categories(
     
     return result
 
-@router.get("/{category_id}", response_model=CategoryResponse)
+@router.get("/{category_id}", response_model=CategoryResponse, dependencies=[Depends(conditional_get(CATEGORIES))])
 def get_category(
     category_id: int,
     request: Request,
     accept_language: str = Header(None),
-    db: Session = Depends(get_db)
+    db: Session = Depends(read_db(CATEGORIES))
 ):
     """获取单个分类详情"""
     category = db.query(Category).filter(
@@ -3,10 +3,14 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 from ..models.database import get_db
 from ..models.models import FooterInfo
+from ..utils.cache import site_cache, FOOTER_INFO
+from ..utils.conditional import conditional_get
+from ..utils.read_replica import async_read_db
 from pydantic import BaseModel
 
 # 创建路由器
@@ -47,39 +51,44 @@ class FooterInfoResponse(FooterInfoBase):
     class Config:
         from_attributes = True
 
-@router.get("/", response_model=FooterInfoResponse)
-async def get_footer_info(db: Session = Depends(get_db)):
+def load_footer_info(db: Session):
+    """从数据库加载启用的页脚信息（无记录时创建默认记录）"""
+    # 获取第一个活跃的页脚信息记录
+    footer_info = db.query(FooterInfo).filter(FooterInfo.is_active == True).first()
+    
+    if not footer_info:
+        # 如果没有记录，创建默认记录
+        default_footer = FooterInfo(
+            about_title="关于我们",
+            about_title_en="About Us",
+            about_content="我们致力于为客户提供高质量的产品和优质的服务体验，通过持续的创新和改进，我们不断满足客户的需求。",
+            about_content_en="We are committed to providing customers with high-quality products and excellent service experience. Through continuous innovation and improvement, we constantly meet customer needs.",
+            contact_title="联系我们",
+            contact_title_en="Contact Us",
+            contact_email="info@example.com",
+            contact_phone="+86 123 4567 8900",
+            contact_address="中国，上海市",
+            contact_address_en="Shanghai, China",
+            social_title="关注我们",
+            social_title_en="Follow Us",
+            quick_links_title="快速链接",
+            quick_links_title_en="Quick Links",
+            copyright_text="© 2024 产品展示网站. 保留所有权利.",
+            copyright_text_en="© 2024 Product Showcase Website. All rights reserved."
+        )
+        db.add(default_footer)
+        db.commit()
+        db.refresh(default_footer)
+        footer_info = default_footer
+    
+    return footer_info
+
+@router.get("/", response_model=FooterInfoResponse, dependencies=[Depends(conditional_get(FOOTER_INFO))])
+async def get_footer_info(db: AsyncSession = Depends(async_read_db(FOOTER_INFO))):
     """获取页脚信息"""
     try:
-        # 获取第一个活跃的页脚信息记录
-        footer_info = db.query(FooterInfo).filter(FooterInfo.is_active == True).first()
-        
-        if not footer_info:
-            # 如果没有记录，创建默认记录
-            default_footer = FooterInfo(
-                about_title="关于我们",
-                about_title_en="About Us",
-                about_content="我们致力于为客户提供高质量的产品和优质的服务体验，通过持续的创新和改进，我们不断满足客户的需求。",
-                about_content_en="We are committed to providing customers with high-quality products and excellent service experience. Through continuous innovation and improvement, we constantly meet customer needs.",
-                contact_title="联系我们",
-                contact_title_en="Contact Us",
-                contact_email="info@example.com",
-                contact_phone="+86 123 4567 8900",
-                contact_address="中国，上海市",
-                contact_address_en="Shanghai, China",
-                social_title="关注我们",
-                social_title_en="Follow Us",
-                quick_links_title="快速链接",
-                quick_links_title_en="Quick Links",
-                copyright_text="© 2024 产品展示网站. 保留所有权利.",
-                copyright_text_en="© 2024 Product Showcase Website. All rights reserved."
-            )
-            db.add(default_footer)
-            db.commit()
-            db.refresh(default_footer)
-            footer_info = default_footer
-            
-        return footer_info
+        # 优先读取缓存，内容变更时由更新接口失效
+        return await site_cache.get_or_load_async(FOOTER_INFO, None, lambda: db.run_sync(load_footer_info))
         
     except Exception as e:
         print(f"获取页脚信息失败: {e}")
@@ -109,6 +118,7 @@ async def update_footer_info(
         
         db.commit()
         db.refresh(footer_info)
+        site_cache.invalidate(FOOTER_INFO)
         
         return footer_info
         
@@ -0,0 +1,118 @@
+"""
+首页聚合API路由
+一次返回首页所需的全部内容（顶部信息栏、轮播图、特色产品、分类、关于我们、页脚），
+按语言缓存序列化后的JSON并提供ETag
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Header
+from sqlalchemy.orm import Session
+
+from api.models.models import BackgroundImage, Category
+from api.routes.about_us import load_about_us
+from api.routes.featured_products import get_featured_products
+from api.routes.footer_info import load_footer_info
+from api.routes.top_info import load_top_info
+from api.utils.cache import (
+    site_cache, HOME, TOP_INFO, ABOUT_US, FOOTER_INFO, BACKGROUND_IMAGES,
+    CATEGORIES, PRODUCTS, FEATURED_PRODUCTS
+)
+from api.utils.helpers import get_language_from_request, get_localized_field
+from api.utils.image_variants import image_variants
+from api.utils.read_replica import read_db
+from api.utils.snapshot import render_snapshot, snapshot_response
+
+router = APIRouter(prefix="/home", tags=["首页"])
+
+# 首页文档依赖的内容，任一内容变更都会使首页缓存失效
+HOME_DEPENDENCIES = (
+    TOP_INFO, ABOUT_US, FOOTER_INFO, BACKGROUND_IMAGES,
+    CATEGORIES, PRODUCTS, FEATURED_PRODUCTS
+)
+
+def _columns(obj) -> dict:
+    """将ORM对象的列转换为字典"""
+    return {column.name: getattr(obj, column.name) for column in obj.__table__.columns}
+
+def _build_background_images(db: Session, lang: str) -> list:
+    """启用的轮播图（标题、副标题、按钮文本已本地化）"""
+    background_images = db.query(BackgroundImage).filter(
+        BackgroundImage.is_active == True
+    ).order_by(BackgroundImage.sort_order, BackgroundImage.created_at.desc()).all()
+
+    result = []
+    for bg_img in background_images:
+        bg_dict = _columns(bg_img)
+        bg_dict["title"] = get_localized_field(bg_img, "title", lang)
+        bg_dict["subtitle"] = get_localized_field(bg_img, "subtitle", lang)
+        bg_dict["button_text"] = get_localized_field(bg_img, "button_text", lang)
+        bg_dict["image_variants"] = image_variants(bg_img.image_url)
+        result.append(bg_dict)
+    return result
+
+def _build_categories(db: Session, lang: str) -> list:
+    """启用的分类（名称、描述已本地化）"""
+    categories = db.query(Category).filter(
+        Category.is_active == True
+    ).order_by(Category.sort_order.asc(), Category.id.asc()).all()
+
+    result = []
+    for category in categories:
+        category_dict = _columns(category)
+        category_dict["name"] = get_localized_field(category, "name", lang)
+        category_dict["description"] = get_localized_field(category, "description", lang)
+        result.append(category_dict)
+    return result
+
+def _build_featured_products(db: Session, lang: str) -> list:
+    """6个特色产品位置（英文时名称、描述使用英文字段）"""
+    featured = get_featured_products(db)
+    if lang == "en":
+        for item in featured:
+            product = item["product"]
+            if product:
+                product["name"] = product["name_en"] or product["name"]
+                product["description"] = product["description_en"] or product["description"]
+    return featured
+
+def _build_about_us(db: Session, lang: str) -> dict:
+    """关于我们（英文时标题、内容使用英文字段）"""
+    about_us = load_about_us(db)
+    about_dict = _columns(about_us)
+    if lang == "en":
+        about_dict["title"] = about_us.title_en or about_us.title
+        about_dict["content"] = about_us.content_en or about_us.content
+    return about_dict
+
+def build_home_document(db: Session, lang: str) -> dict:
+    """组装首页文档"""
+    return {
+        "lang": lang,
+        "top_info": _columns(load_top_info(db)),
+        "background_images": _build_background_images(db, lang),
+        "featured_products": _build_featured_products(db, lang),
+        "categories": _build_categories(db, lang),
+        "about_us": _build_about_us(db, lang),
+        "footer_info": _columns(load_footer_info(db))
+    }
+
+@router.get("/")
+def get_home(
+    request: Request,
+    lang: Optional[str] = Query(None, description="语言: zh, en"),
+    accept_language: str = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(read_db(*HOME_DEPENDENCIES))
+):
+    """获取首页聚合数据"""
+    lang = get_language_from_request(request, accept_language)
+
+    try:
+        snapshot = site_cache.get_or_load(
+            HOME, lang, lambda: render_snapshot(build_home_document(db, lang)),
+            depends_on=HOME_DEPENDENCIES
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"获取首页数据失败: {str(e)}")
+
+    return snapshot_response(snapshot, if_none_match, {"Vary": "Accept-Language"})
@@ -3,41 +3,60 @@
 提供语言切换和多语言内容获取功能
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from api.models.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Header
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from api.models.models import Product, Category
-from typing import List, Dict, Any
+from api.models.projections import language_product_list_columns
+from api.routes.products import query_products
+from api.utils.cache import (
+    site_cache, PRODUCTS, CATEGORIES, FEATURED_PRODUCTS, BACKGROUND_IMAGES, ABOUT_US
+)
+from api.utils.helpers import calculate_pagination
+from api.utils.snapshot import render_snapshot_async, snapshot_response
+from api.utils.image_variants import image_variants
+from api.utils.read_replica import async_read_db
+from typing import List, Dict, Any, Optional
 
 router = APIRouter()
 
-@router.get("/language/{lang_code}/products")
-async def get_products_by_language(lang_code: str, db: Session = Depends(get_db)):
-    """获取指定语言的产品列表"""
+# 快照依赖：产品详情包含分类名称，精选产品包含产品和分类信息
+CATEGORIES_DEPENDENCY = (CATEGORIES,)
+FEATURED_DEPENDENCIES = (PRODUCTS, CATEGORIES)
+
+def _snapshot_lang(lang_code: str) -> str:
+    """快照按语言缓存：仅 "en" 使用英文字段，其他语言代码共用中文快照"""
+    return "en" if lang_code == "en" else "zh"
+
+async def _build_products(lang_code: str, db: AsyncSession, filters: Dict[str, Any]):
+    """构建指定语言的产品列表"""
+    use_cursor = filters["use_cursor"]
+    page = filters["page"]
+    size = filters["size"]
+    
     try:
-        products = db.query(Product).filter(Product.is_active == True).all()
+        # 复用 /products 的查询逻辑（全文搜索、游标分页），只查询列表输出的列，
+        # 名称和描述在数据库中按语言取值，不加载其他语言的描述文本
+        products, total, next_cursor = await db.run_sync(
+            lambda session: query_products(
+                session, columns=language_product_list_columns(lang_code), **filters
+            )
+        )
         
         result = []
         for product in products:
-            # 根据语言选择对应的字段
-            if lang_code == 'en':
-                name = getattr(product, 'name_en', None) or product.name
-                description = getattr(product, 'description_en', None) or product.description
-            else:
-                name = product.name
-                description = product.description
-            
             images_list = []
-            if getattr(product, 'images', None):
+            if product.images:
                 images_list = str(product.images).split(',')
             
             result.append({
                 "id": product.id,
-                "name": name,
-                "description": description,
+                "name": product.name,
+                "description": product.description,
                 "price": product.price,
                 "original_price": product.original_price,
                 "image_url": product.image_url,
+                "image_variants": image_variants(product.image_url),
                 "images": images_list,
                 "is_featured": product.is_featured,
                 "rating": product.rating,
@@ -47,19 +66,67 @@ async def get_products_by_language(lang_code: str, db: Session = Depends(get_db)
                 "category_id": product.category_id
             })
         
-        return {"success": True, "data": result}
+        if use_cursor:
+            return {"success": True, "data": result, "next_cursor": next_cursor}
+        return {"success": True, "data": result, "pagination": calculate_pagination(total, page, size)}
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取产品数据失败: {str(e)}")
 
-@router.get("/language/{lang_code}/products/{product_id}")
-async def get_product_by_language(lang_code: str, product_id: int, db: Session = Depends(get_db)):
-    """获取指定语言的单个产品详情"""
+@router.get("/language/{lang_code}/products")
+async def get_products_by_language(
+    lang_code: str,
+    category_id: Optional[int] = Query(None, description="分类ID筛选"),
+    q: Optional[str] = Query(None, description="搜索关键词（MySQL全文索引可用时，空格分隔的多个词须全部命中，不要求相邻；"
+                                               "未建索引或含单字时按整个关键词做子串匹配）"),
+    is_featured: Optional[bool] = Query(None, description="是否精选"),
+    min_price: Optional[float] = Query(None, ge=0, description="最低价格"),
+    max_price: Optional[float] = Query(None, ge=0, description="最高价格"),
+    sort_by: Optional[str] = Query(None, description="排序字段: relevance, id, price, sales_count, created_at（搜索时默认按相关度）"),
+    sort_order: Optional[str] = Query("asc", description="排序方式: asc, desc"),
+    page: int = Query(1, ge=1, description="页码"),
+    size: int = Query(10, ge=1, le=100, description="每页数量"),
+    pagination_mode: str = Query("page", alias="pagination", description="分页模式: page, cursor（游标分页支持按 id, sales_count, created_at 排序）"),
+    cursor: Optional[str] = Query(None, description="游标（游标分页模式下由上一页的next_cursor提供）"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(async_read_db(PRODUCTS, CATEGORIES))
+):
+    """获取指定语言的产品列表（筛选、排序、分页参数与 /products 一致）"""
+    filters = {
+        "category_id": category_id,
+        "q": q,
+        "is_featured": is_featured,
+        "min_price": min_price,
+        "max_price": max_price,
+        "sort_by": sort_by,
+        "sort_order": sort_order,
+        "page": page,
+        "size": size,
+        "use_cursor": pagination_mode == "cursor" or cursor is not None,
+        "cursor": cursor
+    }
+    lang = _snapshot_lang(lang_code)
+    # 搜索词、游标和价格区间的取值不受限，这类请求不写入快照缓存，
+    # 否则会占满PRODUCTS命名空间的条目上限，导致产品详情等快照被整体清空
+    if q or cursor is not None or min_price is not None or max_price is not None:
+        snapshot = await render_snapshot_async(_build_products(lang, db, filters))
+        return snapshot_response(snapshot, if_none_match)
+    cache_key = ("language", "list", lang, tuple(sorted(filters.items())))
+    snapshot = await site_cache.get_or_load_async(
+        PRODUCTS, cache_key, lambda: render_snapshot_async(_build_products(lang, db, filters))
+    )
+    return snapshot_response(snapshot, if_none_match)
+
+async def _build_product(lang_code: str, product_id: int, db: AsyncSession):
+    """构建指定语言的单个产品详情"""
     try:
-        product = db.query(Product).filter(
+        product_result = await db.execute(select(Product).where(
             Product.id == product_id,
             Product.is_active == True
-        ).first()
+        ))
+        product = product_result.scalars().first()
         
         if not product:
             raise HTTPException(status_code=404, detail="产品未找到")
@@ -74,7 +141,8 @@ async def get_product_by_language(lang_code: str, product_id: int, db: Session =
         
         # 获取分类信息
         from ..models.models import Category
-        category = db.query(Category).filter(Category.id == product.category_id).first()
+        category_result = await db.execute(select(Category).where(Category.id == product.category_id))
+        category = category_result.scalars().first()
         
         # 根据语言选择分类名称
         if category:
@@ -101,6 +169,7 @@ async def get_product_by_language(lang_code: str, product_id: int, db: Session =
             "price": product.price,
             "original_price": product.original_price,
             "image_url": product.image_url,
+            "image_variants": image_variants(product.image_url),
             "images": images_list,
             "sku": product.sku,
             "stock": product.stock,
@@ -126,11 +195,27 @@ async def get_product_by_language(lang_code: str, product_id: int, db: Session =
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取产品详情失败: {str(e)}")
 
-@router.get("/language/{lang_code}/categories")
-async def get_categories_by_language(lang_code: str, db: Session = Depends(get_db)):
-    """获取指定语言的分类列表"""
+@router.get("/language/{lang_code}/products/{product_id}")
+async def get_product_by_language(
+    lang_code: str,
+    product_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(async_read_db(PRODUCTS, CATEGORIES))
+):
+    """获取指定语言的单个产品详情"""
+    lang = _snapshot_lang(lang_code)
+    snapshot = await site_cache.get_or_load_async(
+        PRODUCTS, ("language", "detail", lang, product_id),
+        lambda: render_snapshot_async(_build_product(lang, product_id, db)),
+        depends_on=CATEGORIES_DEPENDENCY
+    )
+    return snapshot_response(snapshot, if_none_match)
+
+async def _build_categories(lang_code: str, db: AsyncSession):
+    """构建指定语言的分类列表"""
     try:
-        categories = db.query(Category).filter(Category.is_active == True).all()
+        category_result = await db.execute(select(Category).where(Category.is_active == True))
+        categories = category_result.scalars().all()
         
         result = []
         for category in categories:
@@ -161,74 +246,84 @@ async def get_categories_by_language(lang_code: str, db: Session = Depends(get_d
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取分类数据失败: {str(e)}")
 
-@router.get("/language/{lang_code}/featured-products")
-async def get_featured_products_by_language(lang_code: str, db: Session = Depends(get_db)):
-    """获取指定语言的精选产品列表"""
+@router.get("/language/{lang_code}/categories")
+async def get_categories_by_language(
+    lang_code: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(async_read_db(CATEGORIES))
+):
+    """获取指定语言的分类列表"""
+    lang = _snapshot_lang(lang_code)
+    snapshot = await site_cache.get_or_load_async(
+        CATEGORIES, ("language", lang),
+        lambda: render_snapshot_async(_build_categories(lang, db))
+    )
+    return snapshot_response(snapshot, if_none_match)
+
+async def _build_featured_products(lang_code: str, db: AsyncSession):
+    """构建指定语言的精选产品列表"""
     try:
         # 导入FeaturedProduct模型
         from ..models.models import FeaturedProduct
         
-        # 获取所有启用的特色产品配置
-        featured_configs = db.query(FeaturedProduct).filter(
-            FeaturedProduct.is_active == True
-        ).order_by(FeaturedProduct.position.asc()).all()
+        # 一次查询获取所有启用的特色产品位置及其产品、分类名称
+        rows = (await db.execute(
+            select(FeaturedProduct.position, Product, Category.name.label("category_name")).outerjoin(
+                Product, Product.id == FeaturedProduct.product_id
+            ).outerjoin(
+                Category, Category.id == Product.category_id
+            ).where(
+                FeaturedProduct.is_active == True
+            ).order_by(FeaturedProduct.position.asc(), FeaturedProduct.id.asc())
+        )).all()
+        
+        # 按位置索引，每个位置取第一个配置
+        by_position = {}
+        for position, product, category_name in rows:
+            by_position.setdefault(position, (product, category_name))
         
         # 初始化6个位置的展示数据
         result = []
         
         for position in range(1, 7):  # 位置 1-6
             display_data = {"position": position, "product": None}
+            product, category_name = by_position.get(position, (None, None))
             
-            # 查找该位置的配置
-            for config in featured_configs:
-                if getattr(config, 'position') == position:
-                    # 获取产品详情
-                    product = db.query(Product).filter(
-                        Product.id == config.product_id,
-                        Product.is_active == True
-                    ).first()
-                    
-                    if product:
-                        # 根据语言选择对应的字段
-                        if lang_code == 'en':
-                            name = getattr(product, 'name_en', None) or product.name
-                            description = getattr(product, 'description_en', None) or product.description
-                        else:
-                            name = product.name
-                            description = product.description
-                        
-                        # 获取分类信息
-                        from ..models.models import Category
-                        category = db.query(Category).filter(Category.id == product.category_id).first()
-                        
-                        # 构建产品响应数据
-                        product_data = {
-                            "id": product.id,
-                            "name": name,
-                            "name_en": product.name_en,
-                            "name_zh": product.name_zh,
-                            "description": description,
-                            "description_en": product.description_en,
-                            "description_zh": product.description_zh,
-                            "price": product.price,
-                            "original_price": product.original_price,
-                            "image_url": product.image_url,
-                            "images": product.images,
-                            "sku": product.sku,
-                            "stock": product.stock,
-                            "sales_count": product.sales_count,
-                            "view_count": product.view_count,
-                            "rating": product.rating,
-                            "tags": product.tags,
-                            "is_active": product.is_active,
-                            "category_id": product.category_id,
-                            "category_name": category.name if category else None,
-                            "created_at": product.created_at,
-                            "updated_at": product.updated_at
-                        }
-                        
-                        display_data["product"] = product_data
-                    break
+            if product and product.is_active:
+                # 根据语言选择对应的字段
+                if lang_code == 'en':
+                    name = getattr(product, 'name_en', None) or product.name
+                    description = getattr(product, 'description_en', None) or product.description
+                else:
+                    name = product.name
+                    description = product.description
+                
+                # 构建产品响应数据
+                display_data["product"] = {
+                    "id": product.id,
+                    "name": name,
+                    "name_en": product.name_en,
+                    "name_zh": product.name_zh,
+                    "description": description,
+                    "description_en": product.description_en,
+                    "description_zh": product.description_zh,
+                    "price": product.price,
+                    "original_price": product.original_price,
+                    "image_url": product.image_url,
+                    "image_variants": image_variants(product.image_url),
+                    "images": product.images,
+                    "sku": product.sku,
+                    "stock": product.stock,
+                    "sales_count": product.sales_count,
+                    "view_count": product.view_count,
+                    "rating": product.rating,
+                    "tags": product.tags,
+                    "is_active": product.is_active,
+                    "category_id": product.category_id,
+                    "category_name": category_name,
+                    "created_at": product.created_at,
+                    "updated_at": product.updated_at
+                }
             
             result.append(display_data)
         
@@ -237,55 +332,86 @@ async def get_featured_products_by_language(lang_code: str, db: Session = Depend
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取精选产品数据失败: {str(e)}")
 
+@router.get("/language/{lang_code}/featured-products")
+async def get_featured_products_by_language(
+    lang_code: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(async_read_db(FEATURED_PRODUCTS, PRODUCTS, CATEGORIES))
+):
+    """获取指定语言的精选产品列表"""
+    lang = _snapshot_lang(lang_code)
+    snapshot = await site_cache.get_or_load_async(
+        FEATURED_PRODUCTS, ("language", lang),
+        lambda: render_snapshot_async(_build_featured_products(lang, db)),
+        depends_on=FEATURED_DEPENDENCIES
+    )
+    return snapshot_response(snapshot, if_none_match)
+
+async def _build_background_images(lang_code: str, db: AsyncSession):
+    """构建指定语言的背景图列表"""
+    # 导入BackgroundImage模型
+    from ..models.models import BackgroundImage
+    
+    bg_result = await db.execute(
+        select(BackgroundImage).where(
+            BackgroundImage.is_active == True
+        ).order_by(BackgroundImage.sort_order)
+    )
+    background_images = bg_result.scalars().all()
+    
+    result = []
+    for bg_image in background_images:
+        # 根据语言选择对应的字段
+        if lang_code == 'en':
+            title = getattr(bg_image, 'title_en', None) or bg_image.title
+            subtitle = getattr(bg_image, 'subtitle_en', None) or bg_image.subtitle
+            button_text = getattr(bg_image, 'button_text_en', None) or bg_image.button_text
+        else:
+            title = bg_image.title
+            subtitle = bg_image.subtitle
+            button_text = bg_image.button_text
+        
+        result.append({
+            "id": bg_image.id,
+            "title": title,
+            "subtitle": subtitle,
+            "button_text": button_text,
+            "button_link": bg_image.button_link,
+            "image_url": bg_image.image_url,
+            "image_variants": image_variants(bg_image.image_url),
+            "sort_order": bg_image.sort_order,
+            "is_active": bg_image.is_active
+        })
+    
+    return {"items": result, "success": True}
+
 @router.get("/language/{lang_code}/background-images")
-async def get_background_images_by_language(lang_code: str, db: Session = Depends(get_db)):
+async def get_background_images_by_language(
+    lang_code: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(async_read_db(BACKGROUND_IMAGES))
+):
     """获取指定语言的背景图列表"""
+    lang = _snapshot_lang(lang_code)
     try:
-        # 导入BackgroundImage模型
-        from ..models.models import BackgroundImage
-        
-        background_images = db.query(BackgroundImage).filter(
-            BackgroundImage.is_active == True
-        ).order_by(BackgroundImage.sort_order).all()
-        
-        result = []
-        for bg_image in background_images:
-            # 根据语言选择对应的字段
-            if lang_code == 'en':
-                title = getattr(bg_image, 'title_en', None) or bg_image.title
-                subtitle = getattr(bg_image, 'subtitle_en', None) or bg_image.subtitle
-                button_text = getattr(bg_image, 'button_text_en', None) or bg_image.button_text
-            else:
-                title = bg_image.title
-                subtitle = bg_image.subtitle
-                button_text = bg_image.button_text
-            
-            result.append({
-                "id": bg_image.id,
-                "title": title,
-                "subtitle": subtitle,
-                "button_text": button_text,
-                "button_link": bg_image.button_link,
-                "image_url": bg_image.image_url,
-                "sort_order": bg_image.sort_order,
-                "is_active": bg_image.is_active
-            })
-        
-        return {"items": result, "success": True}
-        
+        snapshot = await site_cache.get_or_load_async(
+            BACKGROUND_IMAGES, ("language", lang),
+            lambda: render_snapshot_async(_build_background_images(lang, db))
+        )
     except Exception as e:
         print(f"背景图API错误: {str(e)}")
-        # 如果模型不存在或出错，返回空列表
+        # 如果模型不存在或出错，返回空列表（不写入快照）
         return {"items": [], "success": True}
+    return snapshot_response(snapshot, if_none_match)
 
-@router.get("/language/{lang_code}/about-us")
-async def get_about_us_by_language(lang_code: str, db: Session = Depends(get_db)):
-    """获取指定语言的关于我们内容"""
+async def _build_about_us(lang_code: str, db: AsyncSession):
+    """构建指定语言的关于我们内容"""
     try:
         # 导入AboutUs模型
         from ..models.models import AboutUs
         
-        about_us = db.query(AboutUs).filter(AboutUs.is_active == True).first()
+        about_result = await db.execute(select(AboutUs).where(AboutUs.is_active == True))
+        about_us = about_result.scalars().first()
         
         if not about_us:
             # 如果没有数据，返回默认内容
@@ -341,6 +467,20 @@ async def get_about_us_by_language(lang_code: str, db: Session = Depends(get_db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取关于我们数据失败: {str(e)}")
 
+@router.get("/language/{lang_code}/about-us")
+async def get_about_us_by_language(
+    lang_code: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(async_read_db(ABOUT_US))
+):
+    """获取指定语言的关于我们内容"""
+    lang = _snapshot_lang(lang_code)
+    snapshot = await site_cache.get_or_load_async(
+        ABOUT_US, ("language", lang),
+        lambda: render_snapshot_async(_build_about_us(lang, db))
+    )
+    return snapshot_response(snapshot, if_none_match)
+
 @router.post("/language/switch")
 async def switch_language(data: Dict[str, Any]):
     """切换语言（客户端状态管理）"""
@@ -2,49 +2,119 @@
 产品相关API路由
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Header
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
-from api.models import get_db, Product, Category
-from api.models.schemas import ProductResponse, CategoryResponse, ProductListResponse
-from api.utils import get_language_from_request, get_localized_field, calculate_pagination
+from datetime import datetime
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, Header
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from api.models import Product, Category
+from api.models.schemas import ProductResponse, ProductListResponse, serialize_category, serialize_product
+from api.utils import get_language_from_request, get_localized_field, calculate_pagination, encode_cursor, decode_cursor
+from api.utils.search import build_product_search
+from api.utils.view_counter import view_counter
+from api.utils.image_variants import image_variants
+from api.utils.cache import PRODUCTS, CATEGORIES
+from api.utils.conditional import conditional_get
+from api.utils.read_replica import async_read_db
+from api.utils.responses import FastJSONResponse
 
 router = APIRouter(prefix="/products", tags=["产品"])
 
-@router.get("/", response_model=ProductListResponse)
-def get_products(
-    request: Request,
-    category_id: Optional[int] = Query(None, description="分类ID筛选"),
-    q: Optional[str] = Query(None, description="搜索关键词"),
-    is_featured: Optional[bool] = Query(None, description="是否精选"),
-    min_price: Optional[float] = Query(None, ge=0, description="最低价格"),
-    max_price: Optional[float] = Query(None, ge=0, description="最高价格"),
-    sort_by: Optional[str] = Query("id", description="排序字段: id, price, sales_count, created_at"),
-    sort_order: Optional[str] = Query("asc", description="排序方式: asc, desc"),
-    page: int = Query(1, ge=1, description="页码"),
-    size: int = Query(10, ge=1, le=100, description="每页数量"),
-    accept_language: str = Header(None),
-    db: Session = Depends(get_db)
+# 支持游标分页的排序字段（非空列，并建有 (is_active, 字段, id) 复合索引；
+# sales_count 和 created_at 由 migrate_product_sort_indexes.py 改为非空）
+# price 为单精度FLOAT，游标中的值与数据库中的值无法精确比较，不支持游标分页；
+# 游标分页时指定其他排序字段（包括 relevance）返回400
+CURSOR_SORT_FIELDS = {"id", "sales_count", "created_at"}
+
+def _cursor_value(product: Product, sort_by: str):
+    """获取游标中记录的排序键值"""
+    value = getattr(product, sort_by)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _apply_cursor(query, sort_by: str, sort_order: str, cursor: Optional[str]):
+    """按 (排序字段, id) 进行键集定位，返回已排序的查询"""
+    sort_field = getattr(Product, sort_by)
+    descending = sort_order == "desc"
+    
+    if cursor:
+        try:
+            data = decode_cursor(cursor)
+            if data.get("s") != sort_by or data.get("o") != sort_order:
+                raise ValueError("游标与排序参数不匹配")
+            last_id = int(data["id"])
+            last_value = data["v"]
+            if sort_by == "created_at":
+                last_value = datetime.fromisoformat(last_value)
+        except (ValueError, KeyError, TypeError) as e:
+            raise HTTPException(status_code=400, detail=f"无效的游标: {str(e)}")
+        
+        if sort_by == "id":
+            seek = Product.id < last_id if descending else Product.id > last_id
+        elif descending:
+            seek = or_(sort_field < last_value, (sort_field == last_value) & (Product.id < last_id))
+        else:
+            seek = or_(sort_field > last_value, (sort_field == last_value) & (Product.id > last_id))
+        query = query.filter(seek)
+    
+    if descending:
+        return query.order_by(sort_field.desc(), Product.id.desc())
+    return query.order_by(sort_field.asc(), Product.id.asc())
+
+def _product_item(product: Product, lang: str, **values) -> dict:
+    """本地化产品及其分类，生成ProductResponse结构的字典"""
+    category = None
+    if product.category:
+        category = serialize_category(
+            product.category,
+            name=get_localized_field(product.category, "name", lang)
+        )
+    return serialize_product(
+        product,
+        category,
+        name=get_localized_field(product, "name", lang),
+        description=get_localized_field(product, "description", lang),
+        image_variants=image_variants(product.image_url),
+        **values
+    )
+
+def query_products(
+    db: Session,
+    category_id: Optional[int] = None,
+    q: Optional[str] = None,
+    is_featured: Optional[bool] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = "asc",
+    page: int = 1,
+    size: int = 10,
+    use_cursor: bool = False,
+    cursor: Optional[str] = None,
+    options: Tuple = (),
+    columns: Tuple = ()
 ):
-    """获取产品列表"""
-    query = db.query(Product).filter(Product.is_active == True)
+    """
+    按筛选、排序和分页条件查询启用的产品
+    指定columns时只查询这些列（见 api.models.projections），返回结果行而不是Product实体
+    返回 (产品列表, 总数, 下一页游标)，游标分页时总数为None
+    """
+    if columns:
+        query = db.query(*columns)
+    else:
+        query = db.query(Product).options(*options)
+    query = query.filter(Product.is_active == True)
     
     # 分类筛选
     if category_id:
         query = query.filter(Product.category_id == category_id)
     
-    # 搜索筛选
+    # 搜索筛选（优先使用全文索引）
+    relevance = None
     if q:
-        search_filter = or_(
-            Product.name.contains(q),
-            Product.description.contains(q),
-            Product.name_en.contains(q),
-            Product.description_en.contains(q),
-            Product.name_zh.contains(q),
-            Product.description_zh.contains(q),
-            Product.tags.contains(q)
-        )
+        search_filter, relevance = build_product_search(db, q)
         query = query.filter(search_filter)
     
     # 精选筛选
@@ -57,142 +127,138 @@ def get_products(
     if max_price is not None:
         query = query.filter(Product.price <= max_price)
     
-    # 排序
-    sort_field = getattr(Product, sort_by, Product.id)
-    if sort_order == "desc":
-        query = query.order_by(sort_field.desc())
-    else:
-        query = query.order_by(sort_field.asc())
+    total = None
+    next_cursor = None
     
-    # 总数统计
-    total = query.count()
+    if use_cursor:
+        # 游标分页：按索引定位，不统计总数（未指定排序字段时按ID排序）
+        if sort_by is not None and sort_by not in CURSOR_SORT_FIELDS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"游标分页不支持按 {sort_by} 排序，可选: {', '.join(sorted(CURSOR_SORT_FIELDS))}"
+            )
+        cursor_sort = sort_by or "id"
+        cursor_order = "desc" if sort_order == "desc" else "asc"
+        query = _apply_cursor(query, cursor_sort, cursor_order, cursor)
+        products = query.limit(size + 1).all()
+        if len(products) > size:
+            products = products[:size]
+            last = products[-1]
+            next_cursor = encode_cursor({
+                "s": cursor_sort,
+                "o": cursor_order,
+                "v": _cursor_value(last, cursor_sort),
+                "id": last.id
+            })
+    else:
+        # 排序
+        if sort_by in (None, "relevance") and relevance is not None:
+            # 按相关度排序，相同得分按ID保持稳定
+            query = query.order_by(relevance.desc(), Product.id.asc())
+        else:
+            sort_field = getattr(Product, sort_by or "id", Product.id)
+            if sort_order == "desc":
+                query = query.order_by(sort_field.desc())
+            else:
+                query = query.order_by(sort_field.asc())
+        
+        # 总数统计
+        total = query.count()
+        
+        # 分页
+        offset = (page - 1) * size
+        products = query.offset(offset).limit(size).all()
     
-    # 分页
-    offset = (page - 1) * size
-    products = query.offset(offset).limit(size).all()
+    return products, total, next_cursor
+
+@router.get("/", response_model=ProductListResponse, response_class=FastJSONResponse,
+            dependencies=[Depends(conditional_get(PRODUCTS, CATEGORIES))])
+async def get_products(
+    request: Request,
+    response: Response,
+    category_id: Optional[int] = Query(None, description="分类ID筛选"),
+    q: Optional[str] = Query(None, description="搜索关键词（MySQL全文索引可用时，空格分隔的多个词须全部命中，不要求相邻；"
+                                               "未建索引或含单字时按整个关键词做子串匹配）"),
+    is_featured: Optional[bool] = Query(None, description="是否精选"),
+    min_price: Optional[float] = Query(None, ge=0, description="最低价格"),
+    max_price: Optional[float] = Query(None, ge=0, description="最高价格"),
+    sort_by: Optional[str] = Query(None, description="排序字段: relevance, id, price, sales_count, created_at（搜索时默认按相关度）"),
+    sort_order: Optional[str] = Query("asc", description="排序方式: asc, desc"),
+    page: int = Query(1, ge=1, description="页码"),
+    size: int = Query(10, ge=1, le=100, description="每页数量"),
+    pagination_mode: str = Query("page", alias="pagination", description="分页模式: page, cursor（游标分页支持按 id, sales_count, created_at 排序）"),
+    cursor: Optional[str] = Query(None, description="游标（游标分页模式下由上一页的next_cursor提供）"),
+    accept_language: str = Header(None),
+    db: AsyncSession = Depends(async_read_db(PRODUCTS, CATEGORIES))
+):
+    """获取产品列表"""
+    use_cursor = pagination_mode == "cursor" or cursor is not None
     
     # 获取语言设置
     lang = get_language_from_request(request, accept_language)
     
-    # 构建响应数据
-    items = []
-    for product in products:
-        # 本地化产品字段
-        product_dict = {
-            "id": product.id,
-            "name": get_localized_field(product, "name", lang),
-            "name_en": product.name_en,
-            "name_zh": product.name_zh,
-            "description": get_localized_field(product, "description", lang),
-            "description_en": product.description_en,
-            "description_zh": product.description_zh,
-            "price": product.price,
-            "original_price": product.original_price,
-            "image_url": product.image_url,
-            "images": product.images,
-            "sku": product.sku,
-            "stock": product.stock,
-            "stock_quantity": product.stock,  # 为前端兼容性添加映射
-            "sales_count": product.sales_count,
-            "view_count": product.view_count,
-            "rating": product.rating,
-            "tags": product.tags,
-            "is_featured": product.is_featured,
-            "is_active": product.is_active,
-            "sort_order": product.sort_order,
-            "category_id": product.category_id,
-            "created_at": product.created_at,
-            "updated_at": product.updated_at
-        }
-        
-        # 添加分类信息
-        if product.category:
-            category_dict = {
-                "id": product.category.id,
-                "name": get_localized_field(product.category, "name", lang),
-                "name_en": product.category.name_en,
-                "name_zh": product.category.name_zh,
-                "description": product.category.description,
-                "description_en": product.category.description_en,
-                "sort_order": product.category.sort_order,
-                "is_active": product.category.is_active,
-                "created_at": product.category.created_at,
-                "updated_at": product.category.updated_at
-            }
-            product_dict["category"] = CategoryResponse(**category_dict)
-        
-        items.append(ProductResponse(**product_dict))
+    def list_products(session: Session):
+        # 预加载分类（多对一JOIN），避免逐行懒加载产生N+1查询
+        products, total, next_cursor = query_products(
+            session,
+            category_id=category_id,
+            q=q,
+            is_featured=is_featured,
+            min_price=min_price,
+            max_price=max_price,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            page=page,
+            size=size,
+            use_cursor=use_cursor,
+            cursor=cursor,
+            options=(joinedload(Product.category),)
+        )
+        # 直接从ORM对象生成响应字典，跳过逐项的pydantic校验
+        return [_product_item(product, lang) for product in products], total, next_cursor
+    
+    # 查询和序列化都在同步会话中完成（异步会话不能懒加载）
+    items, total, next_cursor = await db.run_sync(list_products)
+    
+    if use_cursor:
+        return FastJSONResponse(
+            {"items": items, "pagination": None, "next_cursor": next_cursor},
+            headers=response.headers
+        )
     
     # 分页信息
     pagination = calculate_pagination(total, page, size)
     
-    return ProductListResponse(items=items, pagination=pagination)
+    return FastJSONResponse(
+        {"items": items, "pagination": pagination, "next_cursor": None},
+        headers=response.headers
+    )
 
-@router.get("/{product_id}", response_model=ProductResponse)
-def get_product(
+@router.get("/{product_id}", response_model=ProductResponse, response_class=FastJSONResponse)
+async def get_product(
     product_id: int,
     request: Request,
     accept_language: str = Header(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(async_read_db(PRODUCTS, CATEGORIES))
 ):
     """获取产品详情"""
-    product = db.query(Product).filter(
+    result = await db.execute(select(Product).options(joinedload(Product.category)).where(
         Product.id == product_id,
         Product.is_active == True
-    ).first()
+    ))
+    product = result.scalars().first()
     
     if not product:
         raise HTTPException(status_code=404, detail="产品不存在")
     
-    # 增加浏览次数
-    product.view_count += 1
-    db.commit()
+    # 增加浏览次数（缓冲后批量写入数据库）
+    view_counter.record(product.id)
     
     # 获取语言设置
     lang = get_language_from_request(request, accept_language)
     
-    # 本地化产品字段
-    product_dict = {
-        "id": product.id,
-        "name": get_localized_field(product, "name", lang),
-        "name_en": product.name_en,
-        "name_zh": product.name_zh,
-        "description": get_localized_field(product, "description", lang),
-        "description_en": product.description_en,
-        "description_zh": product.description_zh,
-        "price": product.price,
-        "original_price": product.original_price,
-        "image_url": product.image_url,
-        "images": product.images,
-        "sku": product.sku,
-        "stock": product.stock,
-        "stock_quantity": product.stock,  # 为前端兼容性添加映射
-        "sales_count": product.sales_count,
-        "view_count": product.view_count,
-        "rating": product.rating,
-        "tags": product.tags,
-        "is_featured": product.is_featured,
-        "is_active": product.is_active,
-        "sort_order": product.sort_order,
-        "category_id": product.category_id,
-        "created_at": product.created_at,
-        "updated_at": product.updated_at
-    }
-    
-    # 添加分类信息
-    if product.category:
-        category_dict = {
-            "id": product.category.id,
-            "name": get_localized_field(product.category, "name", lang),
-            "name_en": product.category.name_en,
-            "name_zh": product.category.name_zh,
-            "description": product.category.description,
-            "description_en": product.category.description_en,
-            "sort_order": product.category.sort_order,
-            "is_active": product.category.is_active,
-            "created_at": product.category.created_at,
-            "updated_at": product.category.updated_at
-        }
-        product_dict["category"] = CategoryResponse(**category_dict)
-    
-    return ProductResponse(**product_dict)
+    return FastJSONResponse(_product_item(
+        product,
+        lang,
+        view_count=product.view_count + view_counter.pending(product.id)
+    ))
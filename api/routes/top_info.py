@@ -3,6 +3,7 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -15,32 +16,40 @@ from api.models.schemas import (
     BaseResponse
 )
 from api.utils.auth import get_current_admin
+from api.utils.cache import site_cache, TOP_INFO
+from api.utils.conditional import conditional_get
+from api.utils.read_replica import async_read_db
 
 router = APIRouter(prefix="/top-info", tags=["顶部信息栏"])
 
-@router.get("/", response_model=TopInfoBarResponse)
-async def get_top_info(db: Session = Depends(get_db)):
+def load_top_info(db: Session):
+    """从数据库加载启用的顶部信息栏（无数据时返回默认值）"""
+    top_info = db.query(TopInfoBar).filter(TopInfoBar.is_active == True).first()
+    
+    if not top_info:
+        # 如果没有数据，返回默认数据
+        default_data = TopInfoBar(
+            id=0,
+            phone="400-123-4567",
+            email="service@example.com",
+            wechat_url="#",
+            wechat_qr=None,
+            weibo_url="https://weibo.com/",
+            qq_url="https://qzone.qq.com/",
+            github_url="https://github.com/",
+            linkedin_url="https://linkedin.com/",
+            is_active=True
+        )
+        return default_data
+    
+    return top_info
+
+@router.get("/", response_model=TopInfoBarResponse, dependencies=[Depends(conditional_get(TOP_INFO))])
+async def get_top_info(db: AsyncSession = Depends(async_read_db(TOP_INFO))):
     """获取顶部信息栏信息"""
     try:
-        top_info = db.query(TopInfoBar).filter(TopInfoBar.is_active == True).first()
-        
-        if not top_info:
-            # 如果没有数据，返回默认数据
-            default_data = TopInfoBar(
-                id=0,
-                phone="400-123-4567",
-                email="service@example.com",
-                wechat_url="#",
-                wechat_qr=None,
-                weibo_url="https://weibo.com/",
-                qq_url="https://qzone.qq.com/",
-                github_url="https://github.com/",
-                linkedin_url="https://linkedin.com/",
-                is_active=True
-            )
-            return default_data
-        
-        return top_info
+        # 优先读取缓存，内容变更时由管理接口失效
+        return await site_cache.get_or_load_async(TOP_INFO, None, lambda: db.run_sync(load_top_info))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -73,6 +82,7 @@ async def get_top_info_admin(
             db.add(default_top_info)
             db.commit()
             db.refresh(default_top_info)
+            site_cache.invalidate(TOP_INFO)
             return default_top_info
         
         return top_info
@@ -101,6 +111,7 @@ async def create_top_info(
         new_top_info = TopInfoBar(**top_info_data.dict())
         db.add(new_top_info)
         db.commit()
+        site_cache.invalidate(TOP_INFO)
         
         return BaseResponse(message="顶部信息栏信息创建成功")
     except HTTPException:
@@ -145,6 +156,7 @@ async def update_top_info(
                 setattr(top_info, key, value)
         
         db.commit()
+        site_cache.invalidate(TOP_INFO)
         return BaseResponse(message="顶部信息栏信息更新成功")
     except Exception as e:
         db.rollback()
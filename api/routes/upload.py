@@ -3,33 +3,31 @@
 """
 
 import os
-import uuid
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.orm import Session
 from api.models import get_db, Admin
 from api.utils import get_current_admin
-from config.config import Config
+from api.utils.uploads import save_upload, normalize_extension, count_upload_references, UploadTooLarge
+from api.utils.image_variants import build_variants, remove_variants
+from config.config import UploadConfig
 
 router = APIRouter(prefix="/upload", tags=["文件上传"])
 
 # 支持的图片格式
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
-MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+MAX_FILE_SIZE = UploadConfig.MAX_FILE_SIZE
+# 批量上传一次最多的文件数
+MAX_BATCH_FILES = 10
 
 def allowed_file(filename: str) -> bool:
     """检查文件扩展名是否允许"""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def generate_unique_filename(original_filename: str) -> str:
-    """生成唯一的文件名"""
-    ext = original_filename.rsplit('.', 1)[1].lower()
-    unique_filename = f"{uuid.uuid4()}.{ext}"
-    return unique_filename
-
 @router.post("/image")
 async def upload_image(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_admin: Admin = Depends(get_current_admin)
 ):
@@ -49,46 +47,44 @@ async def upload_image(
             detail=f"不支持的文件格式，支持的格式: {', '.join(ALLOWED_EXTENSIONS)}"
         )
     
-    # 检查文件大小
-    file_content = await file.read()
-    if len(file_content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"文件大小超出限制，最大允许 {MAX_FILE_SIZE // (1024*1024)}MB"
-        )
-    
     # 确保上传目录存在
-    config = Config()
-    upload_dir = config.get_upload_dir()
+    upload_dir = UploadConfig.UPLOAD_PATH
     os.makedirs(upload_dir, exist_ok=True)
     
-    # 生成唯一文件名
-    unique_filename = generate_unique_filename(file.filename)
-    file_path = os.path.join(upload_dir, unique_filename)
-    
-    # 保存文件
+    # 分块保存文件（按内容寻址，相同内容复用已有文件），超过大小限制时不保存
     try:
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)
+        stored_path, file_size, created = await save_upload(
+            file, upload_dir, normalize_extension(file.filename), MAX_FILE_SIZE
+        )
+    except UploadTooLarge as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"文件保存失败: {str(e)}"
         )
     
+    # 新文件在响应返回后由进程池生成缩放版本
+    if created:
+        background_tasks.add_task(build_variants, os.path.join(upload_dir, stored_path))
+    
     # 构建文件URL
-    file_url = f"{config.get_base_url()}/uploads/{unique_filename}"
+    file_url = f"/uploads/{stored_path}"
     
     return {
         "message": "文件上传成功",
-        "filename": unique_filename,
+        "filename": stored_path,
         "original_filename": file.filename,
         "file_url": file_url,
-        "file_size": len(file_content)
+        "file_size": file_size
     }
 
 @router.post("/images")
 async def upload_multiple_images(
+    background_tasks: BackgroundTasks,
     files: List[UploadFile] = File(...),
     current_admin: Admin = Depends(get_current_admin)
 ):
@@ -100,14 +96,13 @@ async def upload_multiple_images(
             detail="未选择文件"
         )
     
-    if len(files) > 10:  # 限制最多同时上传10个文件
+    if len(files) > MAX_BATCH_FILES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="一次最多上传10个文件"
+            detail=f"一次最多上传{MAX_BATCH_FILES}个文件"
         )
     
-    config = Config()
-    upload_dir = config.get_upload_dir()
+    upload_dir = UploadConfig.UPLOAD_PATH
     os.makedirs(upload_dir, exist_ok=True)
     
     results = []
@@ -128,30 +123,27 @@ async def upload_multiple_images(
                 })
                 continue
             
-            # 检查文件大小
-            file_content = await file.read()
-            if len(file_content) > MAX_FILE_SIZE:
-                errors.append({
-                    "filename": file.filename,
-                    "error": f"文件大小超出限制，最大允许 {MAX_FILE_SIZE // (1024*1024)}MB"
-                })
+            # 分块保存（按内容寻址），超过大小限制时不保存
+            try:
+                stored_path, file_size, created = await save_upload(
+                    file, upload_dir, normalize_extension(file.filename), MAX_FILE_SIZE
+                )
+            except UploadTooLarge as e:
+                errors.append({"filename": file.filename, "error": str(e)})
                 continue
             
-            # 生成唯一文件名并保存
-            unique_filename = generate_unique_filename(file.filename)
-            file_path = os.path.join(upload_dir, unique_filename)
-            
-            with open(file_path, "wb") as buffer:
-                buffer.write(file_content)
+            # 新文件在响应返回后由进程池生成缩放版本
+            if created:
+                background_tasks.add_task(build_variants, os.path.join(upload_dir, stored_path))
             
             # 构建文件URL
-            file_url = f"{config.get_base_url()}/uploads/{unique_filename}"
+            file_url = f"/uploads/{stored_path}"
             
             results.append({
-                "filename": unique_filename,
+                "filename": stored_path,
                 "original_filename": file.filename,
                 "file_url": file_url,
-                "file_size": len(file_content)
+                "file_size": file_size
             })
             
         except Exception as e:
@@ -166,15 +158,15 @@ async def upload_multiple_images(
         "failed_uploads": errors
     }
 
-@router.delete("/image/{filename}")
-async def delete_image(
+@router.delete("/image/{filename:path}")
+def delete_image(
     filename: str,
-    current_admin: Admin = Depends(get_current_admin)
+    current_admin: Admin = Depends(get_current_admin),
+    db: Session = Depends(get_db)
 ):
-    """删除上传的图片文件（需要管理员权限）"""
+    """删除上传的图片文件（需要管理员权限，仍被内容引用的文件不能删除）"""
     
-    config = Config()
-    upload_dir = config.get_upload_dir()
+    upload_dir = UploadConfig.UPLOAD_PATH
     file_path = os.path.join(upload_dir, filename)
     
     # 检查文件是否存在
@@ -191,8 +183,17 @@ async def delete_image(
             detail="非法的文件路径"
         )
     
+    # 相同内容的上传共用一个文件，仍有引用时不能删除
+    references = count_upload_references(db, filename)
+    if references:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"文件仍被 {references} 处内容引用，无法删除"
+        )
+    
     try:
         os.remove(file_path)
+        remove_variants(file_path)
         return {"message": "文件删除成功", "filename": filename}
     except Exception as e:
         raise HTTPException(
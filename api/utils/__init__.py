@@ -13,12 +13,14 @@ from .helpers import (
     get_language_from_request,
     get_localized_field,
     build_response,
-    calculate_pagination
+    calculate_pagination,
+    encode_cursor,
+    decode_cursor
 )
 
 __all__ = [
     'verify_password', 'get_password_hash', 'create_access_token', 
     'verify_token', 'get_current_admin', 'authenticate_admin',
     'get_language_from_request', 'get_localized_field', 
-    'build_response', 'calculate_pagination'
+    'build_response', 'calculate_pagination', 'encode_cursor', 'decode_cursor'
 ]
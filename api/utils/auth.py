@@ -6,11 +6,13 @@ from jose import jwt, JWTError, ExpiredSignatureError
 from datetime import datetime, timedelta
 import hashlib
 import hmac
+import time
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from config.config import JWTConfig, AdminConfig
 from api.models import get_db, Admin
+from api.utils.auth_cache import token_cache, admin_cache, admin_stamp
 
 # JWT Bearer Token
 security = HTTPBearer()
@@ -45,14 +47,20 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     encoded_jwt = jwt.encode(to_encode, JWTConfig.SECRET_KEY, algorithm=JWTConfig.ALGORITHM)
     return encoded_jwt
 
+def _decode_token(token: str) -> dict:
+    """解码令牌，结果按原始令牌缓存（缓存时间不超过令牌有效期）"""
+    hit, payload = token_cache.get(token)
+    if hit:
+        return payload
+    payload = jwt.decode(token, JWTConfig.SECRET_KEY, algorithms=[JWTConfig.ALGORITHM])
+    exp = payload.get("exp")
+    token_cache.set(token, payload, max_age=exp - time.time() if exp is not None else None)
+    return payload
+
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     """验证令牌"""
     try:
-        payload = jwt.decode(
-            credentials.credentials, 
-            JWTConfig.SECRET_KEY, 
-            algorithms=[JWTConfig.ALGORITHM]
-        )
+        payload = _decode_token(credentials.credentials)
         username: str = payload.get("sub")
         if username is None:
             raise HTTPException(
@@ -74,13 +82,23 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+def _detached_admin(admin: Admin) -> Admin:
+    """复制管理员的列值为不关联会话的对象，可在请求之间共享"""
+    return Admin(**{column.key: getattr(admin, column.key) for column in Admin.__table__.columns})
+
 def get_current_admin(
     token_data: dict = Depends(verify_token),
     db: Session = Depends(get_db)
 ) -> Admin:
-    """获取当前管理员"""
+    """获取当前管理员（短时缓存，管理员变更时失效）"""
     username = token_data.get("sub")
-    admin = db.query(Admin).filter(Admin.username == username).first()
+    stamp = admin_stamp()
+    hit, admin = admin_cache.get(username, stamp)
+    if not hit:
+        admin = db.query(Admin).filter(Admin.username == username).first()
+        if admin is not None:
+            admin = _detached_admin(admin)
+            admin_cache.set(username, admin, stamp)
     if admin is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
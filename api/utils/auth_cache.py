@@ -0,0 +1,82 @@
+"""
+管理员认证缓存
+按原始令牌缓存解码后的JWT、按用户名缓存当前管理员信息，避免每个管理请求都解码令牌并查询管理员表；
+管理员被修改、禁用或删除时清空管理员缓存，并通过失效标记通知其他worker进程
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+from config.config import AuthCacheConfig
+from api.utils.cache import site_cache, ADMINS
+
+class ExpiringLRUCache:
+    """带过期时间的有界LRU缓存"""
+
+    def __init__(self, ttl: int, max_entries: int, enabled: bool = True):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled and ttl > 0 and max_entries > 0
+        self._lock = threading.Lock()
+        # 键 -> (过期时间, 标记, 值)，按最近使用排序
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, stamp: Any = None) -> Tuple[bool, Any]:
+        """获取缓存，返回 (是否命中, 值)；stamp与写入时不同视为失效"""
+        if not self.enabled:
+            return False, None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, entry_stamp, value = entry
+            if expires_at < time.monotonic() or entry_stamp != stamp:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: Hashable, value: Any, stamp: Any = None, max_age: Optional[float] = None):
+        """写入缓存，max_age可进一步缩短有效期（秒）"""
+        if not self.enabled:
+            return
+        ttl = self.ttl if max_age is None else min(self.ttl, max_age)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+
+# 解码后的JWT（原始令牌 -> 载荷）
+token_cache = ExpiringLRUCache(
+    ttl=AuthCacheConfig.TOKEN_TTL,
+    max_entries=AuthCacheConfig.MAX_ENTRIES,
+    enabled=AuthCacheConfig.ENABLED
+)
+
+# 管理员信息（用户名 -> 不关联会话的管理员对象）
+admin_cache = ExpiringLRUCache(
+    ttl=AuthCacheConfig.ADMIN_TTL,
+    max_entries=AuthCacheConfig.MAX_ENTRIES,
+    enabled=AuthCacheConfig.ENABLED
+)
+
+def admin_stamp():
+    """管理员数据的失效标记（其他进程修改管理员后变化）"""
+    if not admin_cache.enabled:
+        return None
+    stamps, _ = site_cache.versions((ADMINS,))
+    return stamps[0]
+
+def invalidate_admins():
+    """管理员数据变更后使所有进程的管理员缓存失效"""
+    admin_cache.clear()
+    site_cache.invalidate(ADMINS)
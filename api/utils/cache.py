@@ -0,0 +1,172 @@
+"""
+站点内容进程内缓存
+按命名空间缓存很少变化的公开内容（顶部信息栏、关于我们、页脚、背景图），
+支持TTL过期和显式失效；失效时更新标记文件，使其他worker进程的缓存同步失效
+"""
+
+import os
+import time
+import uuid
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, Set, Tuple
+from config.config import CacheConfig
+
+# 缓存命名空间
+TOP_INFO = "top_info"
+ABOUT_US = "about_us"
+FOOTER_INFO = "footer_info"
+BACKGROUND_IMAGES = "background_images"
+CATEGORIES = "categories"
+PRODUCTS = "products"
+FEATURED_PRODUCTS = "featured_products"
+HOME = "home"
+ADMINS = "admins"
+
+_UNSET = object()
+
+class SiteContentCache:
+    """带TTL和跨进程失效标记的简单缓存"""
+
+    def __init__(self, ttl: int, stamp_dir: str, enabled: bool = True, max_entries: int = 256):
+        self.ttl = ttl
+        self.stamp_dir = stamp_dir
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # 命名空间 -> {键: (过期时间, 标记, 值)}
+        self._entries: Dict[str, Dict[Any, Tuple[float, Any, Any]]] = {}
+        # 被依赖的命名空间 -> 依赖它的命名空间
+        self._dependents: Dict[str, Set[str]] = {}
+
+    def _stamp_path(self, namespace: str) -> str:
+        return os.path.join(self.stamp_dir, f"{namespace}.stamp")
+
+    def _read_stamp(self, namespace: str):
+        """读取命名空间的失效标记（文件不存在时为None）"""
+        try:
+            stat = os.stat(self._stamp_path(namespace))
+        except OSError:
+            return None
+        # 标记文件每次通过原子替换写入，inode和mtime共同标识一个版本
+        return (stat.st_ino, stat.st_mtime_ns)
+
+    def _read_stamps(self, namespace: str, depends_on: Iterable[str] = ()):
+        """读取命名空间及其依赖的失效标记"""
+        return tuple(self._read_stamp(ns) for ns in (namespace, *depends_on))
+
+    def _touch_stamp(self, namespace: str):
+        """更新失效标记，通知其他进程"""
+        try:
+            os.makedirs(self.stamp_dir, exist_ok=True)
+            path = self._stamp_path(namespace)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(uuid.uuid4().hex)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ 缓存失效标记写入失败，仅清除本进程缓存: {str(e)}")
+
+    def get(self, namespace: str, key: Any = None, depends_on: Iterable[str] = ()) -> Tuple[bool, Any]:
+        """获取缓存，返回 (是否命中, 值)；depends_on中任一命名空间失效时缓存同样失效"""
+        if not self.enabled:
+            return False, None
+
+        stamp = self._read_stamps(namespace, depends_on)
+        with self._lock:
+            entry = self._entries.get(namespace, {}).get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, entry_stamp, value = entry
+        if expires_at < time.monotonic() or entry_stamp != stamp:
+            return False, None
+        return True, value
+
+    def set(self, namespace: str, key: Any, value: Any, stamp: Any = _UNSET,
+            depends_on: Iterable[str] = ()):
+        """写入缓存，stamp为加载数据前读取的失效标记"""
+        if not self.enabled:
+            return
+        depends_on = tuple(depends_on)
+        if stamp is _UNSET:
+            stamp = self._read_stamps(namespace, depends_on)
+        with self._lock:
+            for dependency in depends_on:
+                self._dependents.setdefault(dependency, set()).add(namespace)
+            entries = self._entries.setdefault(namespace, {})
+            # 每个命名空间的条目数有上限，超出时整体清空
+            if key not in entries and len(entries) >= self.max_entries:
+                entries.clear()
+            entries[key] = (time.monotonic() + self.ttl, stamp, value)
+
+    def get_or_load(self, namespace: str, key: Any, loader: Callable[[], Any],
+                    depends_on: Iterable[str] = ()) -> Any:
+        """命中则返回缓存值，否则调用loader加载并写入缓存"""
+        depends_on = tuple(depends_on)
+        hit, value = self.get(namespace, key, depends_on)
+        if hit:
+            return value
+        # 先读取标记再加载，加载期间发生的失效会使本次写入的缓存立即过期
+        stamp = self._read_stamps(namespace, depends_on)
+        value = loader()
+        self.set(namespace, key, value, stamp, depends_on)
+        return value
+
+    async def get_or_load_async(self, namespace: str, key: Any, loader: Callable[[], Awaitable[Any]],
+                                depends_on: Iterable[str] = ()) -> Any:
+        """get_or_load 的异步版本，loader返回可等待对象"""
+        depends_on = tuple(depends_on)
+        hit, value = self.get(namespace, key, depends_on)
+        if hit:
+            return value
+        stamp = self._read_stamps(namespace, depends_on)
+        value = await loader()
+        self.set(namespace, key, value, stamp, depends_on)
+        return value
+
+    def invalidate(self, namespace: str):
+        """使命名空间及依赖它的缓存失效（包括其他worker进程）"""
+        with self._lock:
+            self._entries.pop(namespace, None)
+            for dependent in self._dependents.get(namespace, ()):
+                self._entries.pop(dependent, None)
+        self._touch_stamp(namespace)
+
+    def versions(self, namespaces: Iterable[str]) -> Tuple[tuple, int]:
+        """
+        返回命名空间的版本标记及最后修改时间（纳秒），用于生成条件请求的校验值
+        标记文件不存在时先创建，使各worker进程得到相同的版本
+        """
+        stamps = []
+        modified_ns = 0
+        for namespace in namespaces:
+            stamp = self._read_stamp(namespace)
+            if stamp is None:
+                self._touch_stamp(namespace)
+                stamp = self._read_stamp(namespace)
+            stamps.append(stamp)
+            if stamp is not None:
+                modified_ns = max(modified_ns, stamp[1])
+        return tuple(stamps), modified_ns
+
+    def modified_within(self, namespaces: Iterable[str], seconds: float) -> bool:
+        """命名空间中是否有最近seconds秒内失效过的（按标记文件的修改时间，对所有worker进程有效）"""
+        threshold = time.time_ns() - int(seconds * 1_000_000_000)
+        for namespace in namespaces:
+            stamp = self._read_stamp(namespace)
+            if stamp is not None and stamp[1] >= threshold:
+                return True
+        return False
+
+    def clear(self):
+        """清空本进程缓存"""
+        with self._lock:
+            self._entries.clear()
+
+# 全局缓存实例
+site_cache = SiteContentCache(
+    ttl=CacheConfig.TTL,
+    stamp_dir=CacheConfig.STAMP_DIR,
+    enabled=CacheConfig.ENABLED,
+    max_entries=CacheConfig.MAX_ENTRIES
+)
@@ -0,0 +1,164 @@
+"""
+响应压缩
+静态资源在启动时预压缩为gzip/brotli版本，按Accept-Encoding直接返回；
+动态响应（API JSON等）超过阈值时由中间件实时压缩
+brotli为可选依赖，未安装时只使用gzip
+"""
+
+import gzip
+from typing import Dict, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # 未安装brotli时仅支持gzip
+    brotli = None
+
+# 可压缩的内容类型
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# 可压缩的静态文件扩展名（图片、woff2等已压缩格式不处理）
+COMPRESSIBLE_EXTENSIONS = (".html", ".css", ".js", ".json", ".svg", ".ttf", ".txt", ".xml", ".ico")
+
+def available_encodings():
+    """当前可用的压缩编码（按优先级）"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+def negotiate_encoding(accept_encoding: Optional[str], supported: Optional[tuple] = None) -> Optional[str]:
+    """根据Accept-Encoding从supported（默认为全部可用编码）中选择压缩编码，不接受压缩时返回None"""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in supported or available_encodings():
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+def is_compressible(content_type: str) -> bool:
+    """判断内容类型是否值得压缩"""
+    content_type = content_type.lower()
+    if content_type.startswith("text/event-stream"):
+        return False
+    return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """按指定编码压缩"""
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+def weaken_etag(etag: str) -> str:
+    """压缩后的内容与原内容字节不同，ETag改为弱校验"""
+    if not etag or etag.startswith("W/"):
+        return etag
+    return f"W/{etag}"
+
+class PrecompressedStore:
+    """启动时预压缩的静态内容，总大小受内存预算限制"""
+
+    def __init__(self, gzip_level: int = 9, brotli_level: int = 11,
+                 minimum_size: int = 1024, max_memory: int = 32 * 1024 * 1024):
+        self.levels = {"gzip": gzip_level, "br": brotli_level}
+        self.minimum_size = minimum_size
+        self.max_memory = max_memory
+        self.memory_used = 0
+        self._variants: Dict[str, Dict[str, bytes]] = {}
+
+    def add(self, key: str, data: bytes):
+        """为内容生成各编码的压缩版本（仅保留比原内容小的版本）"""
+        if len(data) < self.minimum_size or not key.lower().endswith(COMPRESSIBLE_EXTENSIONS):
+            return
+        variants = {}
+        for encoding in available_encodings():
+            compressed = compress(data, encoding, self.levels[encoding])
+            if len(compressed) >= len(data):
+                continue
+            if self.memory_used + len(compressed) > self.max_memory:
+                # 超出内存预算的内容改由中间件实时压缩
+                break
+            self.memory_used += len(compressed)
+            variants[encoding] = compressed
+        if variants:
+            self._variants[key] = variants
+
+    def get(self, key: str, accept_encoding: Optional[str]):
+        """返回 (编码, 压缩内容)，没有可用版本时返回 (None, None)"""
+        variants = self._variants.get(key)
+        if not variants:
+            return None, None
+        encoding = negotiate_encoding(accept_encoding, tuple(variants))
+        if encoding is None:
+            return None, None
+        return encoding, variants[encoding]
+
+class CompressionMiddleware:
+    """动态响应压缩中间件：仅压缩一次性返回、超过阈值且未压缩的可压缩内容"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_level: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "br": brotli_level}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        pending = {}
+
+        async def send_compressed(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # 等到第一段响应体再决定是否压缩
+                pending["start"] = message
+                return
+
+            start = pending.pop("start", None)
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+                or not is_compressible(headers.get("content-type", ""))
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            body = compress(body, encoding, self.levels[encoding])
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                headers["ETag"] = weaken_etag(headers["etag"])
+            message["body"] = body
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
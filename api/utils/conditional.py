@@ -0,0 +1,73 @@
+"""
+条件请求（ETag / Last-Modified）
+根据内容命名空间的版本标记生成校验值，客户端缓存仍有效时在查询数据库和序列化之前直接返回304
+"""
+
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+from fastapi import HTTPException, Request, Response
+
+from config.config import AppConfig
+from api.utils.cache import site_cache
+from api.utils.snapshot import etag_matches
+
+def _validators(request: Request, namespaces: tuple):
+    """生成 (ETag, Last-Modified时间戳)，标记文件无法读写时返回None"""
+    stamps, modified_ns = site_cache.versions(namespaces)
+    if None in stamps:
+        # 标记目录不可写时内容修改不会改变版本，不能据此返回304
+        return None
+    # 校验值只由版本标记决定，内容未变化时保持不变；绕过管理接口直接修改数据库后需调用对应的失效接口
+    last_modified = modified_ns // 1_000_000_000
+
+    # 同一版本下，响应仍随路径、查询参数和语言变化
+    raw = "|".join([
+        AppConfig.VERSION,
+        str(stamps),
+        request.url.path,
+        "&".join(sorted(f"{key}={value}" for key, value in request.query_params.multi_items())),
+        request.headers.get("accept-language", ""),
+    ])
+    # 校验值只反映内容版本，不反映响应字节（如浏览次数批量写回后内容会变化但版本不变），使用弱ETag
+    etag = f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+    return etag, last_modified
+
+def _not_modified_since(if_modified_since: Optional[str], last_modified: int) -> bool:
+    """判断If-Modified-Since是否不早于最后修改时间"""
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return since >= last_modified
+
+def conditional_get(*namespaces: str):
+    """
+    生成条件请求依赖，用法：
+        @router.get("/", dependencies=[Depends(conditional_get(PRODUCTS, CATEGORIES))])
+    响应附带ETag和Last-Modified，校验值匹配时抛出304
+    """
+    async def dependency(request: Request, response: Response):
+        validators = _validators(request, namespaces)
+        if validators is None:
+            return
+        etag, last_modified = validators
+        headers = {
+            "ETag": etag,
+            "Last-Modified": formatdate(last_modified, usegmt=True),
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Language",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # 有If-None-Match时忽略If-Modified-Since
+            not_modified = etag_matches(if_none_match, etag)
+        else:
+            not_modified = _not_modified_since(request.headers.get("if-modified-since"), last_modified)
+        if not_modified:
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+
+    return dependency
@@ -2,6 +2,8 @@
 通用工具函数
 """
 
+import base64
+import json
 from typing import Optional, Dict, Any
 from fastapi import Request, Header
 
@@ -57,3 +59,19 @@ def calculate_pagination(total: int, page: int, size: int) -> Dict[str, int]:
         "size": size,
         "pages": pages
     }
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """将游标数据编码为不透明的URL安全字符串"""
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """解码游标字符串，格式错误时抛出ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except Exception:
+        raise ValueError("无效的游标")
+    if not isinstance(data, dict):
+        raise ValueError("无效的游标")
+    return data
@@ -0,0 +1,257 @@
+"""
+上传图片的响应式版本
+上传后在进程池中为图片生成多个宽度的缩放版本，以及WebP/AVIF编码，与原图存放在同一目录，
+并写入清单文件（<原文件名>.variants.json）；接口通过 image_variants 字段返回srcset，前端按需加载合适尺寸
+Pillow为可选依赖，未安装时不生成任何版本，接口照常返回原图
+"""
+
+import asyncio
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from config.config import UploadConfig, ImageVariantConfig
+from api.utils.cache import site_cache, PRODUCTS, BACKGROUND_IMAGES
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # 未安装Pillow时不生成图片版本
+    Image = None
+
+# 上传文件的URL前缀（main.py中挂载的路径）
+UPLOAD_URL_PREFIX = "/uploads/"
+
+# 清单文件后缀
+MANIFEST_SUFFIX = ".variants.json"
+
+# 生成的版本文件名：<原文件名（含扩展名）>-<宽度>w.<扩展名>
+# 保留原图扩展名，内容相同、扩展名不同的两个原图（<哈希>.png 和 <哈希>.jpg）各自拥有版本，删除其一不影响另一个
+VARIANT_NAME = re.compile(r"-\d+w\.[a-z0-9]+$")
+
+# 可处理的原图扩展名
+SOURCE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".gif")
+
+# Pillow格式 -> (扩展名, MIME类型)
+_FORMATS = {
+    "JPEG": ("jpg", "image/jpeg"),
+    "PNG": ("png", "image/png"),
+    "WEBP": ("webp", "image/webp"),
+    "AVIF": ("avif", "image/avif"),
+    "GIF": ("gif", "image/gif"),
+}
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def is_variant_file(filename: str) -> bool:
+    """判断文件是否为生成的版本或清单"""
+    return filename.endswith(MANIFEST_SUFFIX) or bool(VARIANT_NAME.search(filename))
+
+def manifest_path(original_path: str) -> str:
+    """原图对应的清单文件路径（<原文件名>.variants.json）"""
+    return original_path + MANIFEST_SUFFIX
+
+def upload_file_path(image_url: Optional[str]) -> Optional[str]:
+    """把 /uploads/... 地址转换为上传目录中的文件路径，其他地址返回None"""
+    if not image_url or not image_url.startswith(UPLOAD_URL_PREFIX):
+        return None
+    relative = image_url[len(UPLOAD_URL_PREFIX):].split("?", 1)[0]
+    parts = relative.split("/")
+    if not relative or any(part in ("", ".", "..") for part in parts):
+        return None
+    return os.path.join(UploadConfig.UPLOAD_PATH, *parts)
+
+def _write_atomic(path: str, save):
+    """先写入同目录的临时文件再重命名，读取方不会看到写了一半的文件"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        save(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+def _encode(image, path: str, pillow_format: str, quality: int):
+    if pillow_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    _write_atomic(path, lambda tmp: image.save(tmp, format=pillow_format, quality=quality, optimize=True))
+
+def generate_variants(original_path: str, widths: Tuple[int, ...], formats: Tuple[str, ...],
+                      quality: int) -> Optional[dict]:
+    """
+    生成缩放版本并写入清单，返回清单内容（在工作进程中执行）
+    只缩小不放大；额外编码格式同时生成原尺寸版本；动图和无法识别的文件不处理
+    """
+    if Image is None:
+        return None
+
+    Image.init()
+    extra_formats = [f.upper() for f in formats if f.upper() in Image.SAVE and f.upper() in _FORMATS]
+    stem = original_path
+    name = os.path.basename(stem)
+
+    with Image.open(original_path) as source:
+        source_format = source.format
+        if source_format not in _FORMATS or getattr(source, "is_animated", False):
+            return None
+        image = ImageOps.exif_transpose(source)
+        width, height = image.size
+
+        variants = []
+        for target in sorted({w for w in widths if 0 < w < width} | {width}):
+            resized = image if target == width else image.resize(
+                (target, max(1, round(height * target / width))), Image.LANCZOS
+            )
+            # 原格式的原尺寸版本即原图本身
+            target_formats = extra_formats if target == width else [source_format] + extra_formats
+            for pillow_format in dict.fromkeys(target_formats):
+                if target == width and pillow_format == source_format:
+                    continue
+                ext, mime_type = _FORMATS[pillow_format]
+                filename = f"{name}-{target}w.{ext}"
+                _encode(resized, f"{stem}-{target}w.{ext}", pillow_format, quality)
+                variants.append({"file": filename, "width": target, "type": mime_type})
+
+    manifest = {
+        "width": width,
+        "height": height,
+        "type": _FORMATS[source_format][1],
+        "variants": variants,
+    }
+    # 清单最后写入，存在清单即表示所有版本已生成
+    _write_atomic(manifest_path(original_path), lambda tmp: _write_json(tmp, manifest))
+    return manifest
+
+def _write_json(path: str, data: dict):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+def remove_variants(original_path: str):
+    """删除原图的所有版本和清单"""
+    directory = os.path.dirname(original_path)
+    prefix = os.path.basename(original_path) + "-"
+    with suppress(OSError):
+        for filename in os.listdir(directory):
+            if filename.startswith(prefix) and VARIANT_NAME.search(filename):
+                with suppress(OSError):
+                    os.remove(os.path.join(directory, filename))
+    with suppress(OSError):
+        os.remove(manifest_path(original_path))
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=ImageVariantConfig.WORKERS)
+    return _pool
+
+def variants_enabled() -> bool:
+    """是否生成图片版本（配置启用且已安装Pillow）"""
+    return ImageVariantConfig.ENABLED and Image is not None
+
+def _generate_configured(original_path: str) -> Optional[dict]:
+    return generate_variants(
+        original_path,
+        tuple(ImageVariantConfig.WIDTHS),
+        tuple(ImageVariantConfig.FORMATS),
+        ImageVariantConfig.QUALITY
+    )
+
+def invalidate_image_content():
+    """图片版本变化后使包含图片地址的缓存失效"""
+    site_cache.invalidate(PRODUCTS)
+    site_cache.invalidate(BACKGROUND_IMAGES)
+
+async def build_variants(original_path: str):
+    """在进程池中生成图片版本（上传完成后作为后台任务执行）"""
+    if not variants_enabled():
+        return
+    loop = asyncio.get_running_loop()
+    try:
+        manifest = await loop.run_in_executor(_get_pool(), _generate_configured, original_path)
+    except Exception as e:
+        print(f"⚠️ 图片版本生成失败 {original_path}: {str(e)}")
+        return
+    if manifest is not None:
+        invalidate_image_content()
+
+def backfill_variants(upload_dir: str, force: bool = False) -> Tuple[int, int, List[str]]:
+    """
+    为上传目录中已有的图片补生成版本（命令行工具使用）
+    返回 (生成数, 跳过数, 失败的文件)
+    """
+    generated, skipped, failed = 0, 0, []
+    for dirpath, _, filenames in os.walk(upload_dir):
+        for filename in sorted(filenames):
+            if is_variant_file(filename) or not filename.lower().endswith(SOURCE_EXTENSIONS):
+                continue
+            path = os.path.join(dirpath, filename)
+            if not force and os.path.exists(manifest_path(path)):
+                skipped += 1
+                continue
+            try:
+                if _generate_configured(path) is None:
+                    skipped += 1
+                else:
+                    generated += 1
+            except Exception as e:
+                failed.append(f"{path}: {str(e)}")
+    if generated:
+        invalidate_image_content()
+    return generated, skipped, failed
+
+def shutdown_variant_pool():
+    """关闭进程池（应用关闭时调用）"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+@lru_cache(maxsize=4096)
+def _load_manifest(path: str, mtime_ns: int) -> Optional[dict]:
+    """读取清单（按修改时间缓存）"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def image_variants(image_url: Optional[str]) -> Optional[dict]:
+    """
+    返回图片的响应式版本，没有生成版本时返回None：
+    {"width", "height", "srcset": 原格式的srcset, "sources": [{"type", "srcset"}, ...]}
+    sources按配置的格式顺序排列，可直接用于 <picture><source>
+    """
+    original_path = upload_file_path(image_url)
+    if original_path is None:
+        return None
+    path = manifest_path(original_path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    manifest = _load_manifest(path, mtime_ns)
+    if not manifest:
+        return None
+
+    base_url = image_url.split("?", 1)[0].rsplit("/", 1)[0]
+    original_type = manifest["type"]
+    candidates = {}
+    for variant in manifest["variants"]:
+        candidates.setdefault(variant["type"], []).append(
+            f"{base_url}/{variant['file']} {variant['width']}w"
+        )
+    candidates.setdefault(original_type, []).append(f"{image_url} {manifest['width']}w")
+
+    return {
+        "width": manifest["width"],
+        "height": manifest["height"],
+        "srcset": ", ".join(candidates.pop(original_type)),
+        "sources": [
+            {"type": mime_type, "srcset": ", ".join(entries)}
+            for mime_type, entries in candidates.items()
+        ],
+    }
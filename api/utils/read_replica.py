@@ -0,0 +1,46 @@
+"""
+公开读取接口的读写分离
+启用 [database_replica] 时，公开读取接口的查询发往从库；接口读取的内容在 sticky_seconds 内被修改过时改走主库，
+使刚保存内容的管理员读到自己的修改，也避免把从库上尚未同步的旧数据写入站点缓存
+"""
+
+from config.config import DatabaseReplicaConfig
+from api.models.database import (
+    AsyncReadSessionLocal, ReadSessionLocal, get_async_db, get_db
+)
+from api.utils.cache import site_cache
+
+def _prefer_primary(namespaces: tuple) -> bool:
+    """接口读取的内容最近是否被修改过"""
+    return site_cache.modified_within(namespaces, DatabaseReplicaConfig.STICKY_SECONDS)
+
+def read_db(*namespaces: str):
+    """
+    生成公开读取接口的同步会话依赖，用法：
+        db: Session = Depends(read_db(PRODUCTS, CATEGORIES))
+    namespaces为接口读取的内容对应的缓存命名空间；未启用从库时即为 get_db
+    """
+    if not DatabaseReplicaConfig.ENABLED:
+        return get_db
+
+    def dependency():
+        db = ReadSessionLocal()
+        db.use_primary = _prefer_primary(namespaces)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    return dependency
+
+def async_read_db(*namespaces: str):
+    """read_db 的异步版本，未启用从库时即为 get_async_db"""
+    if not DatabaseReplicaConfig.ENABLED:
+        return get_async_db
+
+    async def dependency():
+        async with AsyncReadSessionLocal() as db:
+            db.sync_session.use_primary = _prefer_primary(namespaces)
+            yield db
+
+    return dependency
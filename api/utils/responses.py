@@ -0,0 +1,45 @@
+"""
+快速JSON响应
+使用orjson把已经是字典/列表的响应内容直接序列化为字节，
+跳过FastAPI按response_model重新校验以及jsonable_encoder的逐层转换
+orjson为可选依赖，未安装时回退到标准库json
+"""
+
+import json
+from decimal import Decimal
+from typing import Any
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # 未安装orjson时使用标准库json
+    orjson = None
+
+def _default(value: Any):
+    """orjson不支持的类型"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"无法序列化的类型: {type(value).__name__}")
+
+def dump_json(content: Any) -> bytes:
+    """序列化为紧凑的UTF-8 JSON字节（datetime输出ISO 8601格式）"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """
+    快速JSON响应（按路由选用）
+    路由直接返回该响应时FastAPI不再按response_model校验和转换，
+    内容应由 api.models.schemas 中的 serialize_* 函数生成，保证字段与响应模型一致；
+    response_model仍保留用于生成接口文档
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
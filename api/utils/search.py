@@ -0,0 +1,99 @@
+"""
+产品全文搜索工具
+基于MySQL FULLTEXT(ngram)索引进行检索和相关度排序，索引不可用时回退到LIKE查询
+"""
+
+import logging
+import re
+import time
+from typing import Optional, Tuple, Any
+from sqlalchemy import or_, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+from api.models.models import Product
+
+# 全文索引名称（与迁移脚本及模型定义保持一致）
+FULLTEXT_INDEX_NAME = "ft_products_search"
+
+# ngram分词长度（MySQL默认ngram_token_size=2）
+NGRAM_TOKEN_SIZE = 2
+
+# 布尔模式下有特殊含义的字符
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+# 未检测到索引时，间隔该时间后重新检测（秒），运行迁移脚本后无需重启即可切换到全文索引
+FULLTEXT_RECHECK_SECONDS = 300
+
+logger = logging.getLogger(__name__)
+
+# 索引检测结果缓存，None表示尚未检测；检测出错时不缓存，下次调用重试
+_fulltext_available: Optional[bool] = None
+_checked_at = 0.0
+
+def _search_columns():
+    """参与全文检索的列（顺序必须与索引定义一致）"""
+    return (
+        Product.name,
+        Product.name_en,
+        Product.name_zh,
+        Product.description,
+        Product.description_en,
+        Product.description_zh,
+        Product.tags,
+    )
+
+def has_fulltext_index(db: Session) -> bool:
+    """
+    检测产品表是否已建立全文索引
+    检测到索引后按进程缓存；未检测到时每 FULLTEXT_RECHECK_SECONDS 秒重新检测；检测出错时本次使用LIKE搜索，下次调用重试
+    """
+    global _fulltext_available, _checked_at
+    if _fulltext_available:
+        return True
+    if _fulltext_available is False and time.monotonic() - _checked_at < FULLTEXT_RECHECK_SECONDS:
+        return False
+
+    # 读写分离会话没有固定的bind，按查询实际使用的引擎判断
+    if db.get_bind().dialect.name != "mysql":
+        return False
+
+    try:
+        result = db.execute(text("""
+            SELECT COUNT(*) FROM information_schema.statistics
+            WHERE table_schema = DATABASE()
+            AND table_name = 'products'
+            AND index_name = :index_name
+        """), {"index_name": FULLTEXT_INDEX_NAME})
+        available = result.scalar() > 0
+    except Exception as e:
+        logger.warning("全文索引检测失败，本次使用LIKE搜索: %s", e)
+        return False
+
+    if available and _fulltext_available is not True:
+        logger.info("检测到全文索引 %s，产品搜索使用全文检索", FULLTEXT_INDEX_NAME)
+    _fulltext_available = available
+    _checked_at = time.monotonic()
+    return available
+
+def build_boolean_query(q: str) -> Optional[str]:
+    """将用户输入转换为布尔模式查询串，每个词都必须命中"""
+    terms = _BOOLEAN_OPERATORS.sub(" ", q).split()
+    if not terms:
+        return None
+    # 短于ngram长度的词无法命中索引
+    if any(len(term) < NGRAM_TOKEN_SIZE for term in terms):
+        return None
+    return " ".join(f'+"{term}"' for term in terms)
+
+def build_product_search(db: Session, q: str) -> Tuple[Any, Optional[Any]]:
+    """
+    构建产品搜索条件
+    返回 (过滤条件, 相关度表达式)，相关度表达式为None表示使用LIKE回退
+    """
+    boolean_query = build_boolean_query(q)
+    if boolean_query and has_fulltext_index(db):
+        relevance = match(*_search_columns(), against=boolean_query).in_boolean_mode()
+        return relevance, relevance
+
+    search_filter = or_(*[column.contains(q) for column in _search_columns()])
+    return search_filter, None
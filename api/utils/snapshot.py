@@ -0,0 +1,46 @@
+"""
+预序列化响应快照
+把本地化后的响应文档序列化为JSON字节并计算ETag，缓存后可直接按字节返回，
+请求携带匹配的If-None-Match时返回304
+"""
+
+import hashlib
+from typing import Any, Awaitable, Dict, Optional, Tuple
+from fastapi import Response
+
+from api.utils.responses import dump_json
+
+# 快照：(JSON字节, ETag)
+Snapshot = Tuple[bytes, str]
+
+def render_snapshot(document: Any) -> Snapshot:
+    """序列化响应文档，返回 (JSON字节, ETag)"""
+    body = dump_json(document)
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    return body, etag
+
+async def render_snapshot_async(document: Awaitable[Any]) -> Snapshot:
+    """等待异步构建的响应文档并序列化"""
+    return render_snapshot(await document)
+
+def _strip_weak(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """判断If-None-Match请求头是否包含当前ETag（弱比较，压缩后的弱ETag同样匹配）"""
+    if not if_none_match:
+        return False
+    tags = [_strip_weak(tag) for tag in if_none_match.split(",")]
+    return "*" in tags or _strip_weak(etag) in tags
+
+def snapshot_response(snapshot: Snapshot, if_none_match: Optional[str] = None,
+                      headers: Optional[Dict[str, str]] = None) -> Response:
+    """返回快照字节，ETag匹配时返回304"""
+    body, etag = snapshot
+    response_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if headers:
+        response_headers.update(headers)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=response_headers)
+    return Response(content=body, media_type="application/json", headers=response_headers)
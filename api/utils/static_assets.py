@@ -0,0 +1,200 @@
+"""
+前端静态资源指纹
+启动时为 css/js/webfonts/images 下的文件计算内容哈希，生成带哈希的文件名，
+并改写HTML和CSS中的引用：带哈希的资源长期缓存（immutable），HTML通过ETag重新验证
+"""
+
+import hashlib
+import mimetypes
+import os
+import posixpath
+import re
+from typing import Dict, Optional
+from fastapi import Request, Response
+from fastapi.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from api.utils.compression import PrecompressedStore, weaken_etag
+from api.utils.snapshot import etag_matches
+
+# 需要生成指纹的目录（CSS最后处理，以便改写其中的字体和图片引用）
+ASSET_DIRS = ("webfonts", "images", "js", "css")
+
+# 指纹长度（十六进制字符数）
+HASH_LENGTH = 10
+
+_ATTR_REF = re.compile(r'''(\b(?:src|href)=)(["'])([^"']+)\2''')
+_URL_REF = re.compile(r'''url\(\s*(["']?)([^"')]+)\1\s*\)''')
+_EXTERNAL_PREFIXES = ("http://", "https://", "//", "data:", "#", "mailto:", "tel:", "javascript:")
+
+class Asset:
+    """带指纹的静态资源"""
+
+    def __init__(self, path: str, full_path: str, content: Optional[bytes] = None):
+        self.path = path            # 原始路径，如 css/style.css
+        self.full_path = full_path  # 磁盘路径
+        self.content = content      # 改写后的内容（未改写时为None，直接读取文件）
+
+class AssetManifest:
+    """原始路径与指纹路径的映射，以及改写后的HTML页面"""
+
+    def __init__(self, web_dir: str, precompressed: Optional[PrecompressedStore] = None):
+        self.web_dir = web_dir
+        self.precompressed = precompressed   # 预压缩内容（按指纹路径/HTML路径）
+        self.hashed: Dict[str, str] = {}     # 原始路径 -> 指纹路径
+        self.assets: Dict[str, Asset] = {}   # 指纹路径 -> 资源
+        self.pages: Dict[str, tuple] = {}    # HTML路径 -> (内容, ETag)
+
+    def build(self) -> "AssetManifest":
+        """扫描资源目录并改写HTML"""
+        for directory in ASSET_DIRS:
+            for path, full_path in self._walk(directory):
+                content = None
+                if path.endswith(".css"):
+                    content = self._rewrite_css(self._read(full_path), posixpath.dirname(path))
+                self._add(path, full_path, content)
+
+        for path, full_path in self._walk(""):
+            if path.endswith(".html"):
+                html = self._rewrite_html(self._read(full_path), posixpath.dirname(path))
+                body = html.encode("utf-8")
+                self.pages[path] = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+                if self.precompressed is not None:
+                    self.precompressed.add(path, body)
+        return self
+
+    def _walk(self, directory: str):
+        """遍历目录，返回 (web目录下的相对路径, 磁盘路径)"""
+        root = os.path.join(self.web_dir, directory)
+        for dirpath, _, filenames in os.walk(root):
+            for filename in sorted(filenames):
+                full_path = os.path.join(dirpath, filename)
+                path = os.path.relpath(full_path, self.web_dir).replace(os.sep, "/")
+                yield path, full_path
+
+    @staticmethod
+    def _read(full_path: str) -> str:
+        with open(full_path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def _add(self, path: str, full_path: str, content: Optional[str] = None):
+        """登记资源，文件名中插入内容哈希"""
+        if content is not None:
+            data = content.encode("utf-8")
+        else:
+            with open(full_path, "rb") as f:
+                data = f.read()
+        digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        stem, ext = posixpath.splitext(path)
+        hashed_path = f"{stem}.{digest}{ext}"
+        self.hashed[path] = hashed_path
+        self.assets[hashed_path] = Asset(path, full_path, data if content is not None else None)
+        if self.precompressed is not None:
+            self.precompressed.add(hashed_path, data)
+
+    def _resolve(self, ref: str, base_dir: str) -> Optional[str]:
+        """把引用改写为指纹路径，无法改写时返回None"""
+        if ref.startswith(_EXTERNAL_PREFIXES):
+            return None
+        # 去掉查询参数（原有的 ?v= 版本号由指纹取代），保留锚点
+        target, _, fragment = ref.partition("#")
+        target = target.split("?", 1)[0]
+        if target.startswith("/"):
+            path = posixpath.normpath(target.lstrip("/"))
+        else:
+            path = posixpath.normpath(posixpath.join(base_dir, target))
+
+        hashed_path = self.hashed.get(path)
+        if hashed_path is None:
+            return None
+        if target.startswith("/"):
+            result = "/" + hashed_path
+        else:
+            result = posixpath.relpath(hashed_path, base_dir or ".")
+        return f"{result}#{fragment}" if fragment else result
+
+    def _rewrite_urls(self, text: str, base_dir: str) -> str:
+        """改写 url(...) 引用"""
+        def replace(match):
+            resolved = self._resolve(match.group(2).strip(), base_dir)
+            if resolved is None:
+                return match.group(0)
+            quote = match.group(1)
+            return f"url({quote}{resolved}{quote})"
+        return _URL_REF.sub(replace, text)
+
+    def _rewrite_css(self, css: str, base_dir: str) -> str:
+        return self._rewrite_urls(css, base_dir)
+
+    def _rewrite_html(self, html: str, base_dir: str) -> str:
+        """改写 src/href 属性和内联样式中的引用"""
+        def replace(match):
+            resolved = self._resolve(match.group(3), base_dir)
+            if resolved is None:
+                return match.group(0)
+            return f"{match.group(1)}{match.group(2)}{resolved}{match.group(2)}"
+        return self._rewrite_urls(_ATTR_REF.sub(replace, html), base_dir)
+
+class FingerprintedStaticFiles(StaticFiles):
+    """
+    前端静态文件服务
+    指纹资源返回 immutable 长缓存，HTML和其他文件带ETag并要求每次重新验证
+    """
+
+    def __init__(self, *args, fingerprint: bool = True, max_age: int = 31536000,
+                 precompressed: Optional[PrecompressedStore] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_age = max_age
+        self.precompressed = precompressed
+        self.manifest = AssetManifest(self.directory, precompressed).build() if fingerprint else None
+
+    def _compressed(self, key: str, scope: Scope):
+        """返回 (编码, 预压缩内容)，没有可用版本时返回 (None, None)"""
+        if self.precompressed is None:
+            return None, None
+        return self.precompressed.get(key, Request(scope).headers.get("accept-encoding"))
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if self.manifest is not None and scope["method"] in ("GET", "HEAD"):
+            logical = path.replace(os.sep, "/")
+            if logical == ".":
+                logical = "index.html"
+
+            asset = self.manifest.assets.get(logical)
+            if asset is not None:
+                return self._asset_response(logical, asset, scope)
+
+            page = self.manifest.pages.get(logical)
+            if page is not None:
+                body, etag = page
+                headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+                encoding, compressed = self._compressed(logical, scope)
+                if encoding is not None:
+                    body = compressed
+                    etag = weaken_etag(etag)
+                    headers["Content-Encoding"] = encoding
+                headers["ETag"] = etag
+                if etag_matches(Request(scope).headers.get("if-none-match"), etag):
+                    return Response(status_code=304, headers=headers)
+                return Response(content=body, media_type="text/html", headers=headers)
+
+        response = await super().get_response(path, scope)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    def _asset_response(self, hashed_path: str, asset: Asset, scope: Scope) -> Response:
+        """返回指纹资源，内容随文件名变化，可永久缓存"""
+        headers = {"Cache-Control": f"public, max-age={self.max_age}, immutable", "Vary": "Accept-Encoding"}
+        media_type = mimetypes.guess_type(asset.path)[0]
+        encoding, compressed = self._compressed(hashed_path, scope)
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+            return Response(content=compressed, media_type=media_type, headers=headers)
+        if asset.content is not None:
+            return Response(content=asset.content, media_type=media_type, headers=headers)
+        full_path, stat_result = self.lookup_path(asset.path)
+        if stat_result is None:
+            return Response(status_code=404)
+        response = self.file_response(full_path, stat_result, scope)
+        response.headers.update(headers)
+        return response
@@ -0,0 +1,175 @@
+"""
+上传文件服务
+替代 StaticFiles 挂载在 /uploads：
+- 按内容寻址的文件（<哈希>.<扩展名>）以哈希作为强ETag，并返回 immutable 长缓存；
+  生成的图片版本以原图哈希命名，同样长期缓存；旧的平铺文件带ETag，每次重新验证
+- 支持单个字节范围的Range请求（206/416）和If-Range
+- 服务器支持ASGI zerocopysend扩展时交给服务器用sendfile发送，否则分块读取发送
+"""
+
+import os
+import re
+from typing import Optional, Tuple
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Receive, Scope, Send
+
+# 按内容寻址的原图文件名：<sha256>.<扩展名>
+CONTENT_NAME = re.compile(r"^([0-9a-f]{64})\.[a-z0-9]+$")
+
+# 以原图哈希命名的图片版本：<sha256>.<原图扩展名>-<宽度>w.<扩展名>
+HASHED_VARIANT_NAME = re.compile(r"^[0-9a-f]{64}\.[a-z0-9]+-\d+w\.[a-z0-9]+$")
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# 服务器不支持zerocopysend时每次读取的块大小
+CHUNK_SIZE = 256 * 1024
+
+class RangeNotSatisfiable(Exception):
+    """请求的字节范围超出文件大小"""
+
+def parse_range(value: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    解析Range请求头，返回 (起始位置, 结束位置)（均包含）
+    多个范围或无法识别的格式返回None（按规范返回完整文件）；范围无法满足时抛出RangeNotSatisfiable
+    """
+    match = _RANGE.match(value.replace(" ", ""))
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        # 后缀范围：最后N个字节
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    end = int(last) if last else size - 1
+    return start, min(end, size - 1)
+
+class UploadFileResponse(FileResponse):
+    """支持字节范围和sendfile的文件响应"""
+
+    chunk_size = CHUNK_SIZE
+
+    def __init__(self, *args, byte_range: Optional[Tuple[int, int]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        size = self.stat_result.st_size
+        self.offset, last = byte_range if byte_range is not None else (0, size - 1)
+        self.count = max(last - self.offset + 1, 0)
+        self.headers["accept-ranges"] = "bytes"
+        if byte_range is not None:
+            self.status_code = 206
+            self.headers["content-range"] = f"bytes {self.offset}-{last}/{size}"
+            self.headers["content-length"] = str(self.count)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if self.send_header_only or self.count == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        zero_copy = "http.response.zerocopysend" in scope.get("extensions", {})
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            if zero_copy:
+                # 由服务器通过sendfile直接从文件描述符发送
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file.wrapped,
+                    "offset": self.offset,
+                    "count": self.count,
+                    "more_body": False,
+                })
+                return
+
+            await file.seek(self.offset)
+            remaining = self.count
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": remaining > 0,
+                })
+            if remaining > 0:
+                # 发送期间文件被截断，结束响应
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+class UploadFiles(StaticFiles):
+    """上传文件服务，按文件名决定ETag和缓存策略"""
+
+    def __init__(self, *args, max_age: int = 31536000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_age = max_age
+
+    def _cache_headers(self, filename: str, stat_result: os.stat_result) -> dict:
+        match = CONTENT_NAME.match(filename)
+        if match is not None:
+            # 文件名即内容哈希，内容不会变化
+            return {
+                "etag": f'"{match.group(1)}"',
+                "cache-control": f"public, max-age={self.max_age}, immutable",
+            }
+        # 平铺文件和版本文件：按inode、修改时间和大小生成ETag，文件被替换后随之变化
+        etag = f'"{stat_result.st_ino:x}-{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        if HASHED_VARIANT_NAME.match(filename):
+            # 版本由内容固定的原图生成，重新生成只会改变编码质量
+            return {"etag": etag, "cache-control": f"public, max-age={self.max_age}, immutable"}
+        return {"etag": etag, "cache-control": "no-cache"}
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope,
+                      status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        headers = self._cache_headers(os.path.basename(full_path), stat_result)
+        response = UploadFileResponse(
+            full_path, status_code=status_code, headers=headers,
+            stat_result=stat_result, method=scope["method"]
+        )
+        if status_code != 200:
+            return response
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+
+        range_header = request_headers.get("range")
+        if range_header is None or not self._if_range_matches(request_headers, response.headers):
+            return response
+        try:
+            byte_range = parse_range(range_header, stat_result.st_size)
+        except RangeNotSatisfiable:
+            return Response(status_code=416, headers={
+                "content-range": f"bytes */{stat_result.st_size}",
+                "accept-ranges": "bytes",
+            })
+        if byte_range is None:
+            return response
+        return UploadFileResponse(
+            full_path, headers=headers, stat_result=stat_result,
+            method=scope["method"], byte_range=byte_range
+        )
+
+    @staticmethod
+    def _if_range_matches(request_headers: Headers, response_headers) -> bool:
+        """If-Range与当前ETag（强比较）或Last-Modified一致时才按范围返回"""
+        if_range = request_headers.get("if-range")
+        if if_range is None:
+            return True
+        if if_range.startswith('"'):
+            return if_range == response_headers["etag"]
+        return if_range == response_headers["last-modified"]
@@ -0,0 +1,204 @@
+"""
+上传文件存储
+表单解析时Starlette会先把整个上传内容写入临时文件，因此请求体大小由 UploadLimitMiddleware 在解析前检查：
+Content-Length超出限制时直接返回413，未声明长度的请求在读取量超出限制时中止；
+保存时按固定大小分块复制，通过aiofiles写入上传目录中的临时文件，不阻塞事件循环，同时计算内容哈希
+文件按内容寻址保存（<哈希前2位>/<3-4位>/<哈希>.<扩展名>），相同内容只保存一份；
+不再被任何内容引用的文件由 upload_tools.py gc 清理
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import time
+import uuid
+from collections import Counter
+from contextlib import suppress
+from typing import Dict, List, Tuple
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, UploadFile, status
+from sqlalchemy import select
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from sqlalchemy.orm import Session
+
+from api.models.models import Product, Category, BackgroundImage, AboutUs, TopInfoBar
+from api.utils.image_variants import is_variant_file
+
+# 每次读取和写入的块大小
+CHUNK_SIZE = 64 * 1024
+
+# 请求体中除文件内容外的multipart开销（分隔符、各部分的头和其他表单字段）
+MULTIPART_OVERHEAD = 64 * 1024
+
+# 临时文件后缀（gc会清理遗留的临时文件）
+TMP_SUFFIX = ".tmp"
+
+# 扩展名别名，同一格式使用相同的扩展名以便去重
+_EXTENSION_ALIASES = {"jpeg": "jpg"}
+
+# 可能引用上传文件的列（富文本内容中也可能嵌入图片）
+UPLOAD_REFERENCE_COLUMNS = (
+    Product.image_url,
+    Product.images,
+    Category.icon_url,
+    BackgroundImage.image_url,
+    AboutUs.background_image_url,
+    AboutUs.content,
+    AboutUs.content_en,
+    AboutUs.content_zh,
+    TopInfoBar.wechat_qr,
+)
+
+_UPLOAD_REF = re.compile(r"/uploads/([^\s\"'(),;<>?#]+)")
+
+class UploadTooLarge(Exception):
+    """上传文件超过大小限制"""
+
+    def __init__(self, max_size: int):
+        super().__init__(f"文件大小超出限制，最大允许 {max_size // (1024*1024)}MB")
+        self.max_size = max_size
+
+class UploadLimitMiddleware:
+    """
+    上传请求体大小限制中间件，limits为 {路径: 最大请求体字节数}
+    在表单解析（Starlette把上传内容写入临时文件）之前检查，超出限制时返回413
+    """
+
+    def __init__(self, app: ASGIApp, limits: Dict[str, int]):
+        self.app = app
+        self.limits = {path.rstrip("/"): limit for path, limit in limits.items()}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limit = None
+        if scope["type"] == "http" and scope["method"] in ("POST", "PUT"):
+            limit = self.limits.get(scope["path"].rstrip("/"))
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"请求体超出限制，最大允许 {limit // (1024*1024)}MB"
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            # 声明的长度已超出限制，不读取请求体
+            response = JSONResponse({"detail": detail}, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            # 未声明长度（分块传输）或声明不实时，按实际读取量中止表单解析
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+def normalize_extension(filename: str) -> str:
+    """取文件扩展名（小写，统一别名）"""
+    ext = filename.rsplit('.', 1)[1].lower()
+    return _EXTENSION_ALIASES.get(ext, ext)
+
+def content_path(digest: str, extension: str) -> str:
+    """内容寻址的相对路径（按哈希前缀分两级目录，避免单个目录文件过多）"""
+    return f"{digest[:2]}/{digest[2:4]}/{digest}.{extension}"
+
+async def save_upload(file: UploadFile, directory: str, extension: str, max_size: int,
+                      chunk_size: int = CHUNK_SIZE) -> Tuple[str, int, bool]:
+    """
+    流式保存上传文件，返回 (相对路径, 文件大小, 是否新保存)
+    内容已存在时直接复用已有文件；超过max_size时删除临时文件并抛出UploadTooLarge
+    （此时上传内容已在表单解析时读完，请求体大小的提前检查见 UploadLimitMiddleware）
+    """
+    # 表单解析时已知大小的文件直接拒绝，不再复制
+    if file.size is not None and file.size > max_size:
+        raise UploadTooLarge(max_size)
+
+    # 临时文件与目标文件在同一文件系统，保证重命名是原子操作
+    tmp_path = os.path.join(directory, f".{uuid.uuid4().hex}{TMP_SUFFIX}")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(tmp_path, "wb") as out:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLarge(max_size)
+                digest.update(chunk)
+                await out.write(chunk)
+
+        relative_path = content_path(digest.hexdigest(), extension)
+        final_path = os.path.join(directory, relative_path)
+        if await aiofiles.os.path.exists(final_path):
+            # 相同内容已上传过：复用已有文件，并刷新修改时间，使gc按新的上传时间计算保留期
+            await aiofiles.os.remove(tmp_path)
+            with suppress(OSError):
+                await asyncio.to_thread(os.utime, final_path)
+            return relative_path, size, False
+        await aiofiles.os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        await aiofiles.os.replace(tmp_path, final_path)
+    except BaseException:
+        with suppress(OSError):
+            await aiofiles.os.remove(tmp_path)
+        raise
+    return relative_path, size, True
+
+def upload_reference_counts(db: Session) -> Counter:
+    """统计各上传文件（相对路径）被内容引用的次数"""
+    counts = Counter()
+    for column in UPLOAD_REFERENCE_COLUMNS:
+        for value in db.execute(select(column).where(column.like("%/uploads/%"))).scalars():
+            counts.update(_UPLOAD_REF.findall(value))
+    return counts
+
+def count_upload_references(db: Session, relative_path: str) -> int:
+    """统计单个上传文件被内容引用的次数（只读取地址中包含该文件的行）"""
+    # 以 ! 作为LIKE转义字符（路径中含有 /，反斜杠在MySQL字符串中另有转义含义）
+    escaped = relative_path.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+    pattern = f"%/uploads/{escaped}%"
+    count = 0
+    for column in UPLOAD_REFERENCE_COLUMNS:
+        for value in db.execute(select(column).where(column.like(pattern, escape="!"))).scalars():
+            count += _UPLOAD_REF.findall(value).count(relative_path)
+    return count
+
+def replace_upload_references(value: str, mapping: Dict[str, str]) -> str:
+    """把内容中引用的上传文件（相对路径）按mapping替换为新的相对路径"""
+    def replace(match):
+        new_path = mapping.get(match.group(1))
+        return match.group(0) if new_path is None else f"/uploads/{new_path}"
+    return _UPLOAD_REF.sub(replace, value)
+
+def find_unreferenced_uploads(upload_dir: str, referenced, min_age: float = 0) -> List[str]:
+    """
+    找出未被引用的上传文件（相对路径），生成的图片版本随原图一起处理，
+    修改时间在min_age秒以内的文件不计入（刚上传、尚未保存到内容中的文件）
+    """
+    cutoff = time.time() - min_age
+    unreferenced = []
+    for dirpath, _, filenames in os.walk(upload_dir):
+        for filename in sorted(filenames):
+            if is_variant_file(filename):
+                continue
+            path = os.path.join(dirpath, filename)
+            relative_path = os.path.relpath(path, upload_dir).replace(os.sep, "/")
+            if relative_path in referenced:
+                continue
+            try:
+                if os.stat(path).st_mtime > cutoff:
+                    continue
+            except OSError:
+                continue
+            unreferenced.append(relative_path)
+    return unreferenced
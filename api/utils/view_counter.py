@@ -0,0 +1,100 @@
+"""
+产品浏览次数写回缓冲
+浏览请求只在内存中累加计数，由后台任务定期用一条 UPDATE ... CASE 语句批量写入数据库，
+避免每次浏览都对产品行加锁并提交事务
+"""
+
+import asyncio
+import threading
+from collections import Counter
+from typing import Dict
+from sqlalchemy import case, update
+from config.config import ViewCounterConfig
+from api.models.database import SessionLocal
+from api.models.models import Product
+
+class ViewCounter:
+    """按产品ID聚合浏览次数，定期批量刷新到数据库"""
+
+    def __init__(self, flush_interval: int, max_batch_size: int, session_factory=SessionLocal):
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.session_factory = session_factory
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Counter = Counter()
+
+    def record(self, product_id: int, count: int = 1):
+        """记录一次浏览"""
+        with self._lock:
+            self._pending[product_id] += count
+
+    def pending(self, product_id: int) -> int:
+        """尚未写入数据库的浏览次数"""
+        with self._lock:
+            return self._pending.get(product_id, 0)
+
+    def _take(self) -> Dict[int, int]:
+        """取出全部待写入计数"""
+        with self._lock:
+            pending = dict(self._pending)
+            self._pending.clear()
+        return pending
+
+    def _restore(self, counts: Dict[int, int]):
+        """写入失败时把计数放回缓冲区，下次重试"""
+        with self._lock:
+            self._pending.update(counts)
+
+    def _write_batch(self, counts: Dict[int, int]):
+        """用一条UPDATE语句写入一批产品的浏览次数"""
+        db = self.session_factory()
+        try:
+            db.execute(
+                update(Product)
+                .where(Product.id.in_(list(counts)))
+                .values(view_count=Product.view_count + case(counts, value=Product.id, else_=0))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def flush(self) -> int:
+        """把缓冲的浏览次数写入数据库，返回写入的产品数"""
+        with self._flush_lock:
+            pending = self._take()
+            if not pending:
+                return 0
+
+            items = list(pending.items())
+            written = 0
+            for start in range(0, len(items), self.max_batch_size):
+                batch = dict(items[start:start + self.max_batch_size])
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    # 本批及之后未写入的计数全部放回
+                    self._restore(dict(items[start:]))
+                    print(f"⚠️ 浏览次数写入失败，稍后重试: {str(e)}")
+                    break
+                written += len(batch)
+            return written
+
+    async def run(self):
+        """后台任务：按间隔刷新，取消时执行最后一次刷新"""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await asyncio.to_thread(self.flush)
+        finally:
+            self.flush()
+
+# 全局浏览计数实例
+view_counter = ViewCounter(
+    flush_interval=ViewCounterConfig.FLUSH_INTERVAL,
+    max_batch_size=ViewCounterConfig.MAX_BATCH_SIZE
+)
@@ -83,11 +83,61 @@ class DatabaseConfig:
     PASSWORD = config.get('database', 'password', 'password')
     DATABASE = config.get('database', 'database', 'fanxi_shop')
     CHARSET = config.get('database', 'charset', 'utf8mb4')
+    ASYNC_URL = config.get('database', 'async_url', '')  # 可选，覆盖异步连接URL（如测试用 sqlite+aiosqlite:///./test.db）
+    POOL_SIZE = config.getint('database', 'pool_size', 10)  # 每个进程每个连接池保持的连接数
+    MAX_OVERFLOW = config.getint('database', 'max_overflow', 20)  # 连接池满时最多额外创建的连接数
+    POOL_TIMEOUT = config.getint('database', 'pool_timeout', 30)  # 等待空闲连接的最长时间（秒）
+    POOL_RECYCLE = config.getint('database', 'pool_recycle', 3600)  # 连接超过该时间后重建（秒），应小于MySQL的wait_timeout
+    POOL_PRE_PING = config.getboolean('database', 'pool_pre_ping', False)  # 借出连接前先检测是否可用
+    POOL_USE_LIFO = config.getboolean('database', 'pool_use_lifo', False)  # 优先复用最近归还的连接，空闲连接可随pool_recycle自然减少
+    
+    @classmethod
+    def pool_options(cls) -> dict:
+        """创建引擎时使用的连接池参数"""
+        return {
+            "pool_size": cls.POOL_SIZE,
+            "max_overflow": cls.MAX_OVERFLOW,
+            "pool_timeout": cls.POOL_TIMEOUT,
+            "pool_recycle": cls.POOL_RECYCLE,
+            "pool_pre_ping": cls.POOL_PRE_PING,
+            "pool_use_lifo": cls.POOL_USE_LIFO,
+        }
     
     @classmethod
     def get_url(cls) -> str:
         """获取数据库连接URL"""
         return f"mysql+pymysql://{cls.USERNAME}:{cls.PASSWORD}@{cls.HOST}:{cls.PORT}/{cls.DATABASE}?charset={cls.CHARSET}"
+    
+    @classmethod
+    def get_async_url(cls) -> str:
+        """获取异步数据库连接URL"""
+        if cls.ASYNC_URL:
+            return cls.ASYNC_URL
+        return f"mysql+aiomysql://{cls.USERNAME}:{cls.PASSWORD}@{cls.HOST}:{cls.PORT}/{cls.DATABASE}?charset={cls.CHARSET}"
+
+# 只读从库配置（未配置的连接参数沿用主库）
+class DatabaseReplicaConfig:
+    ENABLED = config.getboolean('database_replica', 'enabled', False)  # 是否将公开读取接口的查询发往从库
+    HOST = config.get('database_replica', 'host', DatabaseConfig.HOST)
+    PORT = config.getint('database_replica', 'port', DatabaseConfig.PORT)
+    USERNAME = config.get('database_replica', 'username', DatabaseConfig.USERNAME)
+    PASSWORD = config.get('database_replica', 'password', DatabaseConfig.PASSWORD)
+    DATABASE = config.get('database_replica', 'database', DatabaseConfig.DATABASE)
+    CHARSET = config.get('database_replica', 'charset', DatabaseConfig.CHARSET)
+    ASYNC_URL = config.get('database_replica', 'async_url', '')  # 可选，覆盖从库的异步连接URL
+    STICKY_SECONDS = config.getint('database_replica', 'sticky_seconds', 10)  # 内容修改后该时间内的读取仍走主库，应大于复制延迟
+    
+    @classmethod
+    def get_url(cls) -> str:
+        """获取从库连接URL"""
+        return f"mysql+pymysql://{cls.USERNAME}:{cls.PASSWORD}@{cls.HOST}:{cls.PORT}/{cls.DATABASE}?charset={cls.CHARSET}"
+    
+    @classmethod
+    def get_async_url(cls) -> str:
+        """获取从库异步连接URL"""
+        if cls.ASYNC_URL:
+            return cls.ASYNC_URL
+        return f"mysql+aiomysql://{cls.USERNAME}:{cls.PASSWORD}@{cls.HOST}:{cls.PORT}/{cls.DATABASE}?charset={cls.CHARSET}"
 
 # 应用配置
 class AppConfig:
@@ -97,6 +147,24 @@ class AppConfig:
     HOST = config.get('app', 'host', '0.0.0.0')
     PORT = config.getint('app', 'port', 8000)
 
+# 生产服务器配置
+class ServerConfig:
+    WORKERS = config.getint('server', 'workers', 0)  # 工作进程数，0表示按CPU核心数
+    BACKLOG = config.getint('server', 'backlog', 2048)  # 监听队列长度
+    LIMIT_CONCURRENCY = config.getint('server', 'limit_concurrency', 0)  # 每个进程的最大并发连接数，超出返回503（0为不限制）
+    KEEPALIVE = config.getint('server', 'keepalive', 5)  # HTTP keep-alive超时（秒）
+    MAX_REQUESTS = config.getint('server', 'max_requests', 0)  # 每个进程处理多少请求后重启（0为不重启）
+    MAX_REQUESTS_JITTER = config.getint('server', 'max_requests_jitter', 0)  # 重启阈值的随机增量，避免进程同时重启
+    GRACEFUL_TIMEOUT = config.getint('server', 'graceful_timeout', 30)  # 停止时等待请求处理完成的时间（秒）
+    RELOAD_TIMEOUT = config.getint('server', 'reload_timeout', 60)  # 平滑重启时等待新进程通过健康检查的时间（秒）
+    HEALTH_CHECK_PATH = config.get('server', 'health_check_path', '/api/health')  # 新进程就绪前需返回200的地址
+    PRELOAD = config.getboolean('server', 'preload', True)  # 每代工作进程只导入一次应用，再fork出各工作进程（不支持fork的系统忽略）
+
+# 启动配置
+class StartupConfig:
+    FAST_START = config.getboolean('startup', 'fast_start', False)  # 快速启动：跳过启动时的连接检查和建表
+    WARM_CONNECTIONS = config.getint('startup', 'warm_connections', 2)  # 快速启动时后台预热的连接数（同步和异步各）
+
 # JWT配置
 class JWTConfig:
     SECRET_KEY = config.get('jwt', 'secret_key', 'your-secret-key-change-this-in-production')
@@ -121,3 +189,45 @@ class UploadConfig:
     MAX_FILE_SIZE = config.getint('upload', 'max_file_size', 5242880)  # 5MB
     ALLOWED_EXTENSIONS = config.getlist('upload', 'allowed_extensions', ['.jpg', '.jpeg', '.png', '.gif', '.webp'])
     UPLOAD_PATH = config.get('upload', 'upload_path', './uploads')
+
+# 上传图片响应式版本配置
+class ImageVariantConfig:
+    ENABLED = config.getboolean('image_variants', 'enabled', True)
+    WIDTHS = config.getlist('image_variants', 'widths', [200, 400, 800, 1600])  # 缩放宽度（像素）
+    FORMATS = config.getlist('image_variants', 'formats', ['avif', 'webp'])  # 额外编码格式（按优先级）
+    QUALITY = config.getint('image_variants', 'quality', 80)  # 有损编码质量（1-100）
+    WORKERS = config.getint('image_variants', 'workers', 2)  # 生成版本的进程数
+
+# 缓存配置
+class CacheConfig:
+    ENABLED = config.getboolean('cache', 'enabled', True)
+    TTL = config.getint('cache', 'ttl', 300)  # 秒
+    STAMP_DIR = config.get('cache', 'stamp_dir', './cache')  # 多进程失效标记目录
+    MAX_ENTRIES = config.getint('cache', 'max_entries', 256)  # 每个命名空间的最大条目数
+
+# 管理员认证缓存配置
+class AuthCacheConfig:
+    ENABLED = config.getboolean('auth_cache', 'enabled', True)
+    TOKEN_TTL = config.getint('auth_cache', 'token_ttl', 300)  # 解码后JWT的缓存时间（秒，不超过令牌有效期）
+    ADMIN_TTL = config.getint('auth_cache', 'admin_ttl', 30)  # 管理员信息的缓存时间（秒）
+    MAX_ENTRIES = config.getint('auth_cache', 'max_entries', 1024)  # 每类缓存的最大条目数
+
+# 浏览次数写回配置
+class ViewCounterConfig:
+    FLUSH_INTERVAL = config.getint('view_counter', 'flush_interval', 10)  # 刷新间隔（秒）
+    MAX_BATCH_SIZE = config.getint('view_counter', 'max_batch_size', 500)  # 每条UPDATE语句最多更新的产品数
+
+# 前端静态资源配置
+class StaticConfig:
+    FINGERPRINT = config.getboolean('static', 'fingerprint', True)  # 是否为资源生成内容哈希文件名
+    MAX_AGE = config.getint('static', 'max_age', 31536000)  # 指纹资源的缓存时间（秒）
+
+# 响应压缩配置
+class CompressionConfig:
+    ENABLED = config.getboolean('compression', 'enabled', True)
+    MINIMUM_SIZE = config.getint('compression', 'minimum_size', 1024)  # 小于该大小（字节）的响应不压缩
+    GZIP_LEVEL = config.getint('compression', 'gzip_level', 6)  # 动态响应gzip级别（1-9，越高越耗CPU）
+    BROTLI_LEVEL = config.getint('compression', 'brotli_level', 4)  # 动态响应brotli级别（0-11）
+    STATIC_GZIP_LEVEL = config.getint('compression', 'static_gzip_level', 9)  # 静态资源预压缩gzip级别
+    STATIC_BROTLI_LEVEL = config.getint('compression', 'static_brotli_level', 11)  # 静态资源预压缩brotli级别
+    STATIC_MEMORY_MB = config.getint('compression', 'static_memory_mb', 32)  # 预压缩内容占用内存上限（MB）
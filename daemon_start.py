@@ -121,10 +121,7 @@ class DaemonManager:
         print(f"📝 日志文件: {self.log_file}")
         print(f"🌐 访问地址: http://localhost:8000")
         
-        # 设置信号处理
-        signal.signal(signal.SIGTERM, self.signal_handler)
-        signal.signal(signal.SIGINT, self.signal_handler)
-        
+        # SIGTERM/SIGINT由 server.py 的主进程处理：等待工作进程处理完请求后退出，PID文件由atexit清理
         try:
             # 启动FastAPI应用
             self.run_app()
@@ -134,28 +131,14 @@ class DaemonManager:
             sys.exit(1)
     
     def run_app(self):
-        """运行FastAPI应用"""
-        import uvicorn
-        from config.config import AppConfig
-        
-        app_config = AppConfig()
+        """运行FastAPI应用（多进程，按 settings.ini 的 [server] 配置）"""
+        from server import run_server
         
         print(f"🌟 启动FastAPI应用 - {datetime.now().isoformat()}")
         
-        uvicorn.run(
-            "main:app",
-            host=app_config.HOST or "0.0.0.0",
-            port=app_config.PORT or 8000,
-            reload=False,  # 守护进程不使用reload
-            log_level="info",
-            access_log=True
-        )
-    
-    def signal_handler(self, signum, frame):
-        """信号处理器"""
-        print(f"收到信号 {signum}，正在关闭服务...")
-        self.cleanup()
-        sys.exit(0)
+        exit_code = run_server()
+        if exit_code != 0:
+            raise RuntimeError(f"服务异常退出 (退出码: {exit_code})")
     
     def stop(self):
         """停止服务"""
@@ -172,17 +155,18 @@ class DaemonManager:
             # 发送TERM信号
             os.kill(pid, signal.SIGTERM)
             
-            # 等待进程结束
-            for i in range(10):
+            # 等待进程结束（主进程最多等待工作进程 graceful_timeout 秒，与 production.sh 的 TimeoutStopSec 一致）
+            from config.config import ServerConfig
+            for i in range(ServerConfig.GRACEFUL_TIMEOUT + 10):
                 try:
                     os.kill(pid, 0)
                     time.sleep(1)
                 except OSError:
                     break
             else:
-                # 如果进程仍在运行，强制杀死
+                # 如果进程仍在运行，强制杀死整个进程组（包括工作进程，避免残留进程占用端口）
                 print("强制终止进程...")
-                os.kill(pid, signal.SIGKILL)
+                os.killpg(os.getpgid(pid), signal.SIGKILL)
             
             # 清理文件
             for file in [self.pid_file, self.status_file]:
@@ -229,8 +213,31 @@ class DaemonManager:
         except Exception as e:
             print(f"❌ 获取状态失败: {e}")
     
-    def restart(self):
-        """重启服务"""
+    def reload(self):
+        """平滑重启：通知主进程启动新工作进程，就绪后再停止旧进程，期间不中断服务"""
+        if not self.is_running():
+            print("❌ 服务未运行")
+            return False
+        
+        try:
+            with open(self.pid_file, 'r') as f:
+                pid = int(f.read().strip())
+            
+            os.kill(pid, signal.SIGHUP)
+            print(f"🔄 已通知服务平滑重启 (PID: {pid})")
+            print(f"📝 新工作进程通过健康检查后替换旧进程，进度见日志: {self.log_file}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ 平滑重启失败: {e}")
+            return False
+    
+    def restart(self, hard=False):
+        """重启服务（运行中时默认平滑重启，hard为True时先停止再启动）"""
+        if self.is_running() and not hard:
+            self.reload()
+            return
+        
         print("🔄 重启服务...")
         if self.is_running():
             self.stop()
@@ -257,12 +264,14 @@ class DaemonManager:
 
 def main():
     parser = argparse.ArgumentParser(description='ShopSite 后台守护进程管理器')
-    parser.add_argument('command', choices=['start', 'stop', 'status', 'restart', 'logs'], 
+    parser.add_argument('command', choices=['start', 'stop', 'status', 'restart', 'reload', 'logs'], 
                        help='管理命令')
     parser.add_argument('--lines', '-n', type=int, default=50, 
                        help='查看日志行数 (默认50行)')
     parser.add_argument('--follow', '-f', action='store_true',
                        help='实时跟踪日志输出')
+    parser.add_argument('--hard', action='store_true',
+                       help='restart时先停止再启动（修改 [server] workers 等主进程配置后使用）')
     
     args = parser.parse_args()
     
@@ -275,7 +284,9 @@ def main():
     elif args.command == 'status':
         manager.status()
     elif args.command == 'restart':
-        manager.restart()
+        manager.restart(hard=args.hard)
+    elif args.command == 'reload':
+        manager.reload()
     elif args.command == 'logs':
         manager.logs(args.lines, args.follow)
 
@@ -81,6 +81,9 @@ def run_migrations():
         ("migrate_add_show_content_box.py", "迁移轮播图文字框控制功能"),
         ("migrate_footer_info.py", "迁移页脚信息功能"),
         ("migrate_top_info_bar.py", "迁移顶部信息栏功能"),
+        ("migrate_product_fulltext.py", "迁移产品全文搜索索引"),
+        ("migrate_product_sort_indexes.py", "迁移产品排序索引"),
+        ("migrate_upload_layout.py", "迁移上传目录结构"),
     ]
     
     success_count = 0
@@ -151,6 +154,9 @@ def list_available_scripts():
             ("migrate_add_show_content_box.py", "添加轮播图文字框控制"),
             ("migrate_footer_info.py", "添加页脚信息管理"),
             ("migrate_top_info_bar.py", "添加顶部信息栏"),
+            ("migrate_product_fulltext.py", "添加产品全文搜索索引"),
+            ("migrate_product_sort_indexes.py", "添加产品游标分页排序索引"),
+            ("migrate_upload_layout.py", "迁移上传文件到分片目录并改写地址"),
         ],
         "测试和调试": [
             ("test_db.py", "测试数据库连接"),
@@ -0,0 +1,60 @@
+"""
+为产品表添加全文搜索索引的迁移脚本
+使用MySQL ngram分词器，支持中文和英文混合搜索
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.models.database import engine
+from api.utils.search import FULLTEXT_INDEX_NAME
+from sqlalchemy import text
+
+def add_product_fulltext_index():
+    """添加ft_products_search全文索引到products表"""
+    try:
+        print("添加产品全文搜索索引...")
+
+        with engine.connect() as connection:
+            # 检查索引是否已存在
+            result = connection.execute(text("""
+                SELECT COUNT(*) as count
+                FROM information_schema.statistics
+                WHERE table_schema = DATABASE()
+                AND table_name = 'products'
+                AND index_name = :index_name
+            """), {"index_name": FULLTEXT_INDEX_NAME})
+
+            index_exists = result.fetchone()[0] > 0
+
+            if index_exists:
+                print(f"✅ {FULLTEXT_INDEX_NAME}索引已存在，跳过添加")
+            else:
+                # 创建索引（大表上可能耗时较长）
+                connection.execute(text(f"""
+                    ALTER TABLE products
+                    ADD FULLTEXT INDEX {FULLTEXT_INDEX_NAME}
+                    (name, name_en, name_zh, description, description_en, description_zh, tags)
+                    WITH PARSER ngram
+                """))
+                connection.commit()
+                print(f"✅ {FULLTEXT_INDEX_NAME}索引添加成功!")
+
+        print("🎉 产品全文搜索索引迁移完成!")
+        return True
+
+    except Exception as e:
+        print(f"❌ 迁移失败: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    success = add_product_fulltext_index()
+    if success:
+        print("\n📋 使用说明：")
+        print("   1. 运行中的服务最多5分钟内自动切换到全文索引（或重启应用服务立即生效）")
+        print("   2. /api/products?q=关键词 默认按相关度排序")
+        print("   3. 单字搜索仍使用LIKE匹配（ngram最小长度为2）")
+    else:
+        print("\n❌ 迁移失败，请检查数据库连接（需要MySQL 5.7.6+）")
+        sys.exit(1)
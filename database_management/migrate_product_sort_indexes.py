@@ -0,0 +1,87 @@
+"""
+为产品表添加游标分页排序索引的迁移脚本
+索引形如 (is_active, 排序字段, id)，使 /api/products?pagination=cursor 可以直接按索引定位；
+游标定位要求排序字段非空，sales_count 和 created_at 中的NULL先回填，再改为 NOT NULL
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.models.database import engine
+from sqlalchemy import text
+
+# 索引名称 -> 索引列（与 api/models/models.py 中的定义保持一致）
+SORT_INDEXES = {
+    "ix_products_active_price": "is_active, price, id",
+    "ix_products_active_sales": "is_active, sales_count, id",
+    "ix_products_active_created": "is_active, created_at, id",
+}
+
+# 游标分页排序字段 -> (回填NULL的值, 非空列定义)（与 api/models/models.py 中的定义保持一致）
+NOT_NULL_COLUMNS = {
+    "sales_count": ("0", "INT NOT NULL DEFAULT 0 COMMENT '销售数量'"),
+    "created_at": ("COALESCE(updated_at, CURRENT_TIMESTAMP)",
+                   "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间'"),
+}
+
+def make_sort_columns_not_null(connection):
+    """回填排序字段中的NULL并改为非空列"""
+    for column, (fill_value, definition) in NOT_NULL_COLUMNS.items():
+        result = connection.execute(text("""
+            SELECT IS_NULLABLE
+            FROM information_schema.columns
+            WHERE table_schema = DATABASE()
+            AND table_name = 'products'
+            AND column_name = :column
+        """), {"column": column})
+
+        if result.fetchone()[0] == "NO":
+            print(f"✅ {column}已是非空列，跳过修改")
+            continue
+
+        filled = connection.execute(text(
+            f"UPDATE products SET {column} = {fill_value} WHERE {column} IS NULL"
+        )).rowcount
+        connection.execute(text(f"ALTER TABLE products MODIFY {column} {definition}"))
+        connection.commit()
+        print(f"✅ {column}已改为非空列（回填 {filled} 行）")
+
+def add_product_sort_indexes():
+    """添加产品排序复合索引"""
+    try:
+        print("添加产品游标分页排序索引...")
+
+        with engine.connect() as connection:
+            make_sort_columns_not_null(connection)
+
+            for index_name, columns in SORT_INDEXES.items():
+                # 检查索引是否已存在
+                result = connection.execute(text("""
+                    SELECT COUNT(*) as count
+                    FROM information_schema.statistics
+                    WHERE table_schema = DATABASE()
+                    AND table_name = 'products'
+                    AND index_name = :index_name
+                """), {"index_name": index_name})
+
+                if result.fetchone()[0] > 0:
+                    print(f"✅ {index_name}索引已存在，跳过添加")
+                    continue
+
+                connection.execute(text(f"CREATE INDEX {index_name} ON products ({columns})"))
+                connection.commit()
+                print(f"✅ {index_name}索引添加成功!")
+
+        print("🎉 产品排序索引迁移完成!")
+        return True
+
+    except Exception as e:
+        print(f"❌ 迁移失败: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    success = add_product_sort_indexes()
+    if not success:
+        print("\n❌ 迁移失败，请检查数据库连接")
+        sys.exit(1)
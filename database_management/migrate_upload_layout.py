@@ -0,0 +1,238 @@
+"""
+把上传目录中平铺存放的旧文件迁移到按内容寻址的分片目录（<哈希前2位>/<3-4位>/<哈希>.<扩展名>）
+0. 把旧命名（去掉原图扩展名，<名称>-<宽度>w.<格式>）的图片版本和清单改为保留扩展名的命名
+1. 计算每个旧文件的内容哈希，以硬链接（跨文件系统时复制）放到新位置，内容相同的文件只保留一份；
+   已生成的图片版本和清单一并迁移
+2. 在一个事务中批量改写数据库内容里的 /uploads/ 地址
+3. 提交成功后删除旧文件
+任一步骤失败时旧文件和数据库保持原样，可以重复执行；加 --dry-run 参数只列出迁移计划
+"""
+
+import sys
+import os
+import json
+import shutil
+import hashlib
+import argparse
+from collections import defaultdict
+from contextlib import suppress
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, update, or_
+from config.config import UploadConfig
+from api.models.database import SessionLocal
+from api.utils.cache import site_cache, PRODUCTS, CATEGORIES, FEATURED_PRODUCTS, BACKGROUND_IMAGES, ABOUT_US, TOP_INFO
+from api.utils.image_variants import MANIFEST_SUFFIX, VARIANT_NAME, is_variant_file, manifest_path
+from api.utils.uploads import (
+    CHUNK_SIZE, UPLOAD_REFERENCE_COLUMNS, content_path, normalize_extension, replace_upload_references
+)
+
+# 每条批量UPDATE语句包含的行数
+BATCH_SIZE = 500
+
+def file_digest(path: str) -> str:
+    """分块计算文件的SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def plan_migration(upload_dir: str) -> dict:
+    """返回 {旧文件名: 新的相对路径}，只处理上传目录根下的原文件"""
+    plan = {}
+    with os.scandir(upload_dir) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            name = entry.name
+            if not entry.is_file() or name.startswith(".") or "." not in name or is_variant_file(name):
+                continue
+            plan[name] = content_path(file_digest(entry.path), normalize_extension(name))
+    return plan
+
+def _place(source: str, target: str):
+    """把文件放到新位置：优先硬链接，不支持时复制后原子替换"""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        pass
+    except OSError:
+        tmp_path = f"{target}.{os.getpid()}.tmp"
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, target)
+
+def _variant_files(directory: str, stem: str) -> list:
+    """以 <stem>- 开头的图片版本文件名"""
+    prefix = stem + "-"
+    return sorted(
+        filename for filename in os.listdir(directory)
+        if filename.startswith(prefix) and VARIANT_NAME.search(filename)
+    )
+
+def _write_manifest(path: str, manifest: dict):
+    """原子写入清单（清单最后写入，存在清单即表示所有版本已就位）"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def _rename_variants(directory: str, old_stem: str, new_stem: str, old_manifest: str, new_manifest: str):
+    """把版本文件放到 <new_stem>-<宽度>w.<格式>，并写入改写文件名后的新清单"""
+    for filename in _variant_files(directory, old_stem):
+        _place(os.path.join(directory, filename), os.path.join(os.path.dirname(new_manifest),
+                                                              new_stem + filename[len(old_stem):]))
+    with open(old_manifest, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    for variant in manifest.get("variants", []):
+        if variant["file"].startswith(old_stem + "-"):
+            variant["file"] = new_stem + variant["file"][len(old_stem):]
+    _write_manifest(new_manifest, manifest)
+
+def rename_legacy_variants(upload_dir: str, dry_run: bool = False) -> int:
+    """
+    把旧命名的图片版本和清单（<名称>-<宽度>w.<格式>、<名称>.variants.json）改为保留原图扩展名的命名，
+    返回处理的原图数；内容相同、扩展名不同的原图各自得到一份版本
+    """
+    renamed = 0
+    obsolete = set()
+    for dirpath, _, filenames in os.walk(upload_dir):
+        for filename in sorted(filenames):
+            if filename.startswith(".") or "." not in filename or is_variant_file(filename):
+                continue
+            old_stem = os.path.splitext(filename)[0]
+            old_manifest = os.path.join(dirpath, old_stem + MANIFEST_SUFFIX)
+            new_manifest = manifest_path(os.path.join(dirpath, filename))
+            if not os.path.exists(old_manifest):
+                continue
+            renamed += 1
+            if dry_run:
+                print(f"   🖼️ {os.path.join(dirpath, old_stem)}-* -> {filename}-*")
+                continue
+            if not os.path.exists(new_manifest):
+                _rename_variants(dirpath, old_stem, filename, old_manifest, new_manifest)
+            obsolete.add(old_manifest)
+            obsolete.update(os.path.join(dirpath, f) for f in _variant_files(dirpath, old_stem))
+
+    # 所有原图都得到新的版本后再删除旧文件
+    for path in obsolete:
+        with suppress(FileNotFoundError):
+            os.remove(path)
+    return renamed
+
+def place_files(upload_dir: str, plan: dict) -> list:
+    """把文件及其图片版本放到新位置，返回迁移后可删除的旧文件路径"""
+    obsolete = []
+    for name, relative_path in plan.items():
+        source = os.path.join(upload_dir, name)
+        target = os.path.join(upload_dir, relative_path)
+        # 版本文件名保留原图扩展名：<旧文件名>-<宽度>w.<格式> -> <哈希>.<扩展名>-<宽度>w.<格式>
+        new_name = os.path.basename(relative_path)
+        old_manifest = manifest_path(source)
+        obsolete.extend([source, old_manifest] + [os.path.join(upload_dir, f) for f in _variant_files(upload_dir, name)])
+
+        # 内容已存在（重复上传或已迁移过）时沿用目标位置已有的文件和版本
+        target_exists = os.path.exists(target) and os.path.exists(manifest_path(target))
+        _place(source, target)
+        if target_exists or not os.path.exists(old_manifest):
+            continue
+        _rename_variants(upload_dir, name, new_name, old_manifest, manifest_path(target))
+    return obsolete
+
+def rewrite_references(db, plan: dict) -> int:
+    """批量改写数据库中引用旧文件的地址（不提交），返回更新的行数"""
+    columns_by_model = defaultdict(list)
+    for column in UPLOAD_REFERENCE_COLUMNS:
+        columns_by_model[column.class_].append(column)
+
+    updated = 0
+    for model, columns in columns_by_model.items():
+        rows = db.execute(
+            select(model.id, *columns).where(or_(*(column.like("%/uploads/%") for column in columns)))
+        ).all()
+        changes = []
+        for row in rows:
+            values = {}
+            for column in columns:
+                value = getattr(row, column.key)
+                if value:
+                    new_value = replace_upload_references(value, plan)
+                    if new_value != value:
+                        values[column.key] = new_value
+            if values:
+                changes.append({"id": row.id, **values})
+
+        # 按主键批量UPDATE
+        for start in range(0, len(changes), BATCH_SIZE):
+            db.execute(update(model), changes[start:start + BATCH_SIZE])
+        if changes:
+            print(f"   📝 {model.__tablename__}: 更新 {len(changes)} 行")
+        updated += len(changes)
+    return updated
+
+def migrate_upload_layout(dry_run: bool = False):
+    """迁移上传目录结构"""
+    try:
+        upload_dir = UploadConfig.UPLOAD_PATH
+        if not os.path.isdir(upload_dir):
+            print(f"✅ 上传目录不存在，跳过迁移: {upload_dir}")
+            return True
+
+        print(f"迁移上传目录结构: {upload_dir}")
+        renamed = rename_legacy_variants(upload_dir, dry_run=dry_run)
+        if renamed:
+            print(f"✅ {'待改名' if dry_run else '已改名'}的图片版本: {renamed} 张原图")
+
+        plan = plan_migration(upload_dir)
+        if not plan:
+            print("✅ 没有需要迁移的平铺文件")
+            return True
+
+        distinct = len(set(plan.values()))
+        print(f"📊 待迁移文件 {len(plan)} 个，去重后 {distinct} 个")
+        if dry_run:
+            for name, relative_path in plan.items():
+                print(f"   📄 {name} -> {relative_path}")
+            return True
+
+        obsolete = place_files(upload_dir, plan)
+        print("✅ 文件已放到新位置")
+
+        db = SessionLocal()
+        try:
+            updated = rewrite_references(db, plan)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        print(f"✅ 数据库地址改写完成，共更新 {updated} 行")
+
+        for namespace in (PRODUCTS, CATEGORIES, FEATURED_PRODUCTS, BACKGROUND_IMAGES, ABOUT_US, TOP_INFO):
+            site_cache.invalidate(namespace)
+
+        removed = 0
+        for path in obsolete:
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        print(f"🗑️ 已删除 {removed} 个旧文件（含图片版本和清单）")
+
+        print("🎉 上传目录结构迁移完成!")
+        return True
+
+    except Exception as e:
+        print(f"❌ 迁移失败: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="迁移上传目录到按内容寻址的分片结构")
+    parser.add_argument("--dry-run", action="store_true", help="只列出迁移计划，不移动文件和修改数据库")
+    args = parser.parse_args()
+
+    success = migrate_upload_layout(dry_run=args.dry_run)
+    if not success:
+        print("\n❌ 迁移失败，请检查数据库连接和上传目录权限")
+        sys.exit(1)
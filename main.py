@@ -2,17 +2,27 @@
 FastAPI主应用程序
 """
 
+# 最先导入启动计时，统计框架和模型的导入耗时
+from api.startup import startup_timer
+
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import os
+import asyncio
 import uvicorn
 
 # 导入配置
-from config.config import Config, CORSConfig, UploadConfig, AppConfig
-from api.models.database import engine, Base
+from config.config import Config, CORSConfig, UploadConfig, AppConfig, StaticConfig, CompressionConfig, StartupConfig
+from api.models.database import engine, async_engine, Base, warm_up_pools
+from api.utils.view_counter import view_counter
+from api.utils.image_variants import shutdown_variant_pool
+from api.utils.static_assets import FingerprintedStaticFiles
+from api.utils.upload_files import UploadFiles
+from api.utils.compression import CompressionMiddleware, PrecompressedStore
+from api.utils.uploads import UploadLimitMiddleware, MULTIPART_OVERHEAD
+startup_timer.mark("导入框架和模型")
 
 # 导入路由
 from api.routes.categories import router as categories_router
@@ -21,7 +31,7 @@ from api.routes.auth import router as auth_router
 from api.routes.admin import router as admin_router
 from api.routes.admin_categories import router as admin_categories_router
 from api.routes.admin_products import router as admin_products_router
-from api.routes.upload import router as upload_router
+from api.routes.upload import router as upload_router, MAX_BATCH_FILES
 from api.routes.background_images import router as background_images_router
 from api.routes.admin_background_images import router as admin_background_images_router
 from api.routes.featured_products import router as featured_products_router
@@ -30,6 +40,9 @@ from api.routes.about_us import router as about_us_router
 from api.routes.top_info import router as top_info_router
 from api.routes.footer_info import router as footer_info_router
 from api.routes.i18n import router as i18n_router
+from api.routes.home import router as home_router
+from api.routes.admin_metrics import router as admin_metrics_router
+startup_timer.mark("导入路由")
 
 # 创建配置实例
 config = Config()
@@ -38,26 +51,34 @@ config = Config()
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
     # 启动时执行
-    # 测试数据库连接
-    from config.config import DatabaseConfig
-    from sqlalchemy import text
-    
-    try:
+    startup_timer.mark("服务器初始化")
+    warm_up_task = None
+    if StartupConfig.FAST_START:
+        # 快速启动：不检查连接也不建表（表结构由 initialize_db.py 和迁移脚本维护），连接池在后台预热
+        warm_up_task = asyncio.create_task(warm_up_pools(StartupConfig.WARM_CONNECTIONS))
+    else:
         # 测试数据库连接
-        with engine.connect() as connection:
-            result = connection.execute(text("SELECT 1"))
-            print(f"✅ 数据库连接成功: {DatabaseConfig.DATABASE}")
-            print(f"🔗 数据库地址: {DatabaseConfig.HOST}:{DatabaseConfig.PORT}")
-    except Exception as e:
-        print(f"❌ 数据库连接失败: {str(e)}")
-        print(f"⚠️ 请检查数据库配置: config/settings.ini")
-    
-    # 创建数据库表
-    try:
-        Base.metadata.create_all(bind=engine)
-        print("📊 数据库表初始化完成")
-    except Exception as e:
-        print(f"❌ 数据库表初始化失败: {str(e)}")
+        from config.config import DatabaseConfig
+        from sqlalchemy import text
+        
+        try:
+            # 测试数据库连接
+            with engine.connect() as connection:
+                result = connection.execute(text("SELECT 1"))
+                print(f"✅ 数据库连接成功: {DatabaseConfig.DATABASE}")
+                print(f"🔗 数据库地址: {DatabaseConfig.HOST}:{DatabaseConfig.PORT}")
+        except Exception as e:
+            print(f"❌ 数据库连接失败: {str(e)}")
+            print(f"⚠️ 请检查数据库配置: config/settings.ini")
+        startup_timer.mark("数据库连接检查")
+        
+        # 创建数据库表
+        try:
+            Base.metadata.create_all(bind=engine)
+            print("📊 数据库表初始化完成")
+        except Exception as e:
+            print(f"❌ 数据库表初始化失败: {str(e)}")
+        startup_timer.mark("数据库表初始化")
     
     # 确保上传目录存在
     upload_dir = UploadConfig.UPLOAD_PATH
@@ -67,20 +88,35 @@ async def lifespan(app: FastAPI):
     print(f"📁 上传目录: {upload_dir}")
     print(f"🌐 API文档: http://localhost:8000/api/docs")
     
+    # 启动浏览次数写回任务
+    view_counter_task = asyncio.create_task(view_counter.run())
+    startup_timer.mark("启动后台任务")
+    print(startup_timer.report())
+    
     yield
     
-    # 关闭时执行（如果需要清理资源）
+    # 停止尚未完成的连接池预热
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+        try:
+            await warm_up_task
+        except asyncio.CancelledError:
+            pass
+    
+    # 关闭时执行：停止写回任务（取消时会写入剩余的浏览次数）
+    view_counter_task.cancel()
+    try:
+        await view_counter_task
+    except asyncio.CancelledError:
+        pass
+    
+    # 等待进行中的图片版本生成结束
+    await asyncio.to_thread(shutdown_variant_pool)
+    
+    # 关闭异步连接池
+    await async_engine.dispose()
     print("👋 应用关闭")
 
-# 自定义静态文件类，禁用缓存
-class NoCacheStaticFiles(StaticFiles):
-    def file_response(self, *args, **kwargs):
-        response = super().file_response(*args, **kwargs)
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache" 
-        response.headers["Expires"] = "0"
-        return response
-
 # 创建FastAPI应用
 app = FastAPI(
     title="产品展示网站API",
@@ -102,6 +138,24 @@ app.add_middleware(
     allow_headers=cors_config.ALLOW_HEADERS,
 )
 
+# 响应压缩（API JSON等动态响应超过阈值时实时压缩）
+if CompressionConfig.ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=CompressionConfig.MINIMUM_SIZE,
+        gzip_level=CompressionConfig.GZIP_LEVEL,
+        brotli_level=CompressionConfig.BROTLI_LEVEL
+    )
+
+# 上传请求体大小限制（在表单解析、写入临时文件之前检查）
+app.add_middleware(
+    UploadLimitMiddleware,
+    limits={
+        "/api/upload/image": UploadConfig.MAX_FILE_SIZE + MULTIPART_OVERHEAD,
+        "/api/upload/images": UploadConfig.MAX_FILE_SIZE * MAX_BATCH_FILES + MULTIPART_OVERHEAD,
+    }
+)
+
 # 注册API路由
 app.include_router(categories_router, prefix="/api")
 app.include_router(products_router, prefix="/api")
@@ -118,30 +172,11 @@ app.include_router(about_us_router, prefix="/api")
 app.include_router(top_info_router, prefix="/api")
 app.include_router(footer_info_router, prefix="/api/footer-info", tags=["footer-info"])
 app.include_router(i18n_router, prefix="/api")
+app.include_router(home_router, prefix="/api")
+app.include_router(admin_metrics_router, prefix="/api")
+startup_timer.mark("注册路由")
 
-# 静态文件服务
-upload_dir = UploadConfig.UPLOAD_PATH
-if os.path.exists(upload_dir):
-    app.mount("/uploads", StaticFiles(directory=upload_dir), name="uploads")
-
-# 前端静态文件服务 - 禁用缓存
-web_dir = os.path.join(os.path.dirname(__file__), "web")
-if os.path.exists(web_dir):
-    app.mount("/", NoCacheStaticFiles(directory=web_dir, html=True), name="web")
-
-# 全局异常处理
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """全局异常处理器"""
-    return JSONResponse(
-        status_code=500,
-        content={
-            "detail": "服务器内部错误",
-            "error": str(exc) if config.get_debug() else "Internal Server Error"
-        }
-    )
-
-# 健康检查端点
+# 健康检查端点（在挂载静态文件之前注册，避免被根路径的前端文件服务覆盖）
 @app.get("/health")
 async def health_check():
     """健康检查"""
@@ -179,13 +214,53 @@ async def api_health_check():
             }
         )
 
+# 上传文件服务 - 按内容寻址的文件长期缓存，支持Range请求
+upload_dir = UploadConfig.UPLOAD_PATH
+if os.path.exists(upload_dir):
+    app.mount("/uploads", UploadFiles(directory=upload_dir, max_age=StaticConfig.MAX_AGE), name="uploads")
+
+# 前端静态文件服务 - 指纹资源长期缓存，HTML每次重新验证
+web_dir = os.path.join(os.path.dirname(__file__), "web")
+if os.path.exists(web_dir):
+    app.mount("/", FingerprintedStaticFiles(
+        directory=web_dir,
+        html=True,
+        fingerprint=StaticConfig.FINGERPRINT,
+        max_age=StaticConfig.MAX_AGE,
+        precompressed=PrecompressedStore(
+            gzip_level=CompressionConfig.STATIC_GZIP_LEVEL,
+            brotli_level=CompressionConfig.STATIC_BROTLI_LEVEL,
+            minimum_size=CompressionConfig.MINIMUM_SIZE,
+            max_memory=CompressionConfig.STATIC_MEMORY_MB * 1024 * 1024
+        ) if CompressionConfig.ENABLED else None
+    ), name="web")
+startup_timer.mark("挂载静态文件")
+
+# 全局异常处理
+@app.exception_handler(Exception)
+async def global_exception_handler(request: Request, exc: Exception):
+    """全局异常处理器"""
+    return JSONResponse(
+        status_code=500,
+        content={
+            "detail": "服务器内部错误",
+            "error": str(exc) if config.get_debug() else "Internal Server Error"
+        }
+    )
+
 # 运行应用
 if __name__ == "__main__":
     app_config = AppConfig()
-    uvicorn.run(
-        "main:app",
-        host=app_config.HOST,
-        port=app_config.PORT,
-        reload=app_config.DEBUG,
-        log_level="info"
-    )
+    if app_config.DEBUG:
+        # 开发模式：单进程，代码修改后自动重载
+        uvicorn.run(
+            "main:app",
+            host=app_config.HOST,
+            port=app_config.PORT,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        # 生产模式：按 [server] 配置启动多个工作进程
+        from server import run_server
+        raise SystemExit(run_server())
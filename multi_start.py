@@ -220,7 +220,7 @@ class MultiThreadLauncher:
         all_services = {
             'fastapi_main': {
                 "name": "FastAPI主服务",
-                "command": f"{sys.executable} main.py",
+                "command": f"{sys.executable} server.py",
                 "env": {"PYTHONPATH": "."},
                 "critical": True
             },
@@ -7,6 +7,8 @@ SERVICE_NAME="shopsite"
 PROJECT_DIR="$(pwd)"
 USER=$(whoami)
 PYTHON_PATH=$(which python3)
+# 停止超时需大于 [server] graceful_timeout，留出工作进程处理完请求的时间
+STOP_TIMEOUT=$(cd "${PROJECT_DIR}" && ${PYTHON_PATH} -c "from config.config import ServerConfig; print(ServerConfig.GRACEFUL_TIMEOUT + 10)" 2>/dev/null || echo 40)
 
 # 颜色定义
 GREEN='\033[0;32m'
@@ -37,10 +39,14 @@ Group=${USER}
 WorkingDirectory=${PROJECT_DIR}
 Environment=PATH=${PATH}
 Environment=PYTHONPATH=${PROJECT_DIR}
-ExecStart=${PYTHON_PATH} main.py
+ExecStart=${PYTHON_PATH} server.py
+# 平滑重启：新工作进程通过健康检查后再停止旧进程
+ExecReload=/bin/kill -HUP \$MAINPID
 Restart=always
 RestartSec=5
-TimeoutStopSec=30
+# 只向主进程发送SIGTERM，由主进程通知工作进程处理完请求后退出
+KillMode=mixed
+TimeoutStopSec=${STOP_TIMEOUT}
 
 # 日志输出到系统日志
 StandardOutput=journal
@@ -70,6 +76,9 @@ check_service() {
     if [ ! -f "/etc/systemd/system/${SERVICE_NAME}.service" ]; then
         print_warning "systemd服务未安装，正在安装..."
         install_service
+    elif ! grep -q "ExecReload" "/etc/systemd/system/${SERVICE_NAME}.service"; then
+        print_warning "systemd服务为旧版本配置，正在更新（多进程启动和平滑重启）..."
+        install_service
     fi
 }
 
@@ -115,6 +124,16 @@ restart() {
     fi
 }
 
+# 平滑重启（不中断正在处理的请求）
+reload() {
+    check_service
+    
+    print_info "平滑重启 ${SERVICE_NAME} 服务..."
+    sudo systemctl reload ${SERVICE_NAME}
+    print_status "已通知服务平滑重启，新工作进程通过健康检查后替换旧进程"
+    print_info "查看进度: $0 logs -f"
+}
+
 # 查看状态
 status() {
     echo "📊 ${SERVICE_NAME} 服务状态:"
@@ -157,8 +176,12 @@ deploy() {
         ${PYTHON_PATH} -m pip install -r requirements.txt --quiet
     fi
     
-    # 重启服务
-    restart
+    # 平滑重启服务（服务未运行时直接启动）
+    if sudo systemctl is-active --quiet ${SERVICE_NAME}; then
+        reload
+    else
+        start
+    fi
     
     print_status "部署完成"
 }
@@ -167,17 +190,18 @@ deploy() {
 help() {
     echo "🚀 ShopSite 生产环境管理脚本"
     echo ""
-    echo "用法: $0 {start|stop|restart|status|logs|deploy|help}"
+    echo "用法: $0 {start|stop|restart|reload|status|logs|deploy|help}"
     echo ""
     echo "命令:"
     echo "  start     - 启动服务"
     echo "  stop      - 停止服务"
     echo "  restart   - 重启服务"
+    echo "  reload    - 平滑重启（不中断请求）"
     echo "  status    - 查看服务状态"
     echo "  logs      - 查看最近50行日志"
     echo "  logs -f   - 实时查看日志"
     echo "  logs 100  - 查看最近100行日志"
-    echo "  deploy    - 快速部署（拉取代码+重启）"
+    echo "  deploy    - 快速部署（拉取代码+平滑重启）"
     echo "  help      - 显示此帮助"
     echo ""
     echo "💡 常用操作:"
@@ -190,6 +214,7 @@ help() {
     echo "  服务名: ${SERVICE_NAME}"
     echo "  项目目录: ${PROJECT_DIR}"
     echo "  Python路径: ${PYTHON_PATH}"
+    echo "  工作进程: 见 config/settings.ini 的 [server] 配置（workers = 0 表示按CPU核心数）"
 }
 
 # 主程序
@@ -203,6 +228,9 @@ case "$1" in
     restart)
         restart
         ;;
+    reload)
+        reload
+        ;;
     status)
         status
         ;;
@@ -222,7 +250,7 @@ case "$1" in
     *)
         echo "🚀 ShopSite 快速启动"
         echo ""
-        echo "使用: $0 {start|stop|restart|status|logs|deploy|help}"
+        echo "使用: $0 {start|stop|restart|reload|status|logs|deploy|help}"
         echo ""
         echo "💡 常用命令:"
         echo "  $0 start    # 启动服务"
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+生产环境服务器启动脚本
+主进程绑定监听端口后启动一组uvicorn工作进程（按 config/settings.ini 的 [server] 配置）：
+preload时工作进程组先导入一次应用，再fork出各工作进程，补充进程无需重新导入即可服务；
+工作进程处理完 max_requests 个请求后退出，由工作进程组补充新的进程
+收到SIGHUP时平滑重启：监听端口保持打开，先启动新的工作进程组（重新导入代码）并等待其通过健康检查，
+再让旧进程处理完当前请求后退出；新进程未通过检查时保留旧进程继续服务
+    python server.py              # 按配置启动
+    python server.py --workers 4  # 临时指定工作进程数
+    kill -HUP <主进程PID>          # 平滑重启（加载新代码和配置）
+"""
+
+import os
+import sys
+import time
+import random
+import signal
+import asyncio
+import argparse
+import importlib
+import threading
+import multiprocessing
+from typing import List, Optional
+
+import uvicorn
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config.config import AppConfig, ServerConfig
+from api.startup import startup_timer
+
+# 允许通过spawn方式把监听套接字传给子进程
+multiprocessing.allow_connection_pickling()
+
+# 工作进程启动后在该时间内异常退出视为启动失败（秒）
+BOOT_TIMEOUT = 10
+
+# 新进程健康检查的重试间隔（秒）
+HEALTH_CHECK_INTERVAL = 1
+
+def worker_count(workers: Optional[int] = None) -> int:
+    """工作进程数，未配置（0）时按CPU核心数"""
+    workers = ServerConfig.WORKERS if workers is None else workers
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+def build_config(workers: int) -> uvicorn.Config:
+    """生成uvicorn配置，每个工作进程的请求上限加入随机增量"""
+    max_requests = None
+    if ServerConfig.MAX_REQUESTS > 0:
+        max_requests = ServerConfig.MAX_REQUESTS + random.randint(0, max(ServerConfig.MAX_REQUESTS_JITTER, 0))
+    return uvicorn.Config(
+        "main:app",
+        host=AppConfig.HOST or "0.0.0.0",
+        port=AppConfig.PORT or 8000,
+        workers=workers,
+        backlog=ServerConfig.BACKLOG,
+        limit_concurrency=ServerConfig.LIMIT_CONCURRENCY or None,
+        limit_max_requests=max_requests,
+        timeout_keep_alive=ServerConfig.KEEPALIVE,
+        timeout_graceful_shutdown=ServerConfig.GRACEFUL_TIMEOUT or None,
+        log_level="info",
+        access_log=True
+    )
+
+async def check_health(app, path: str) -> bool:
+    """在进程内向应用发送一次GET请求，返回状态码是否为200（经过完整的中间件和数据库访问）"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 0),
+    }
+    statuses = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        return False
+    return statuses[:1] == [200]
+
+def serve_worker(config: uvicorn.Config, sockets, ready=None):
+    """
+    工作进程入口（在子进程中执行）
+    ready不为None时，服务启动后反复检查健康检查地址，通过后设置ready通知主进程
+    """
+    # 预加载后fork出的进程从此处计时，应用导入耗时已计入工作进程组
+    preloaded = "main" in sys.modules
+    startup_timer.reset(preloaded=preloaded)
+    if not preloaded:
+        # spawn出的进程需要重新配置日志
+        config.configure_logging()
+    server = uvicorn.Server(config)
+    if ready is None:
+        server.run(sockets=sockets)
+        return
+
+    async def serve():
+        serving = asyncio.ensure_future(server.serve(sockets=sockets))
+        while not serving.done():
+            if server.started:
+                if await check_health(config.loaded_app, ServerConfig.HEALTH_CHECK_PATH):
+                    ready.set()
+                    break
+                await asyncio.wait([serving], timeout=HEALTH_CHECK_INTERVAL)
+            else:
+                await asyncio.wait([serving], timeout=0.05)
+        await serving
+
+    config.setup_event_loop()
+    asyncio.run(serve())
+
+def can_preload() -> bool:
+    """是否预加载应用后fork工作进程（需要系统支持fork）"""
+    return ServerConfig.PRELOAD and "fork" in multiprocessing.get_all_start_methods()
+
+class WorkerGeneration:
+    """
+    一代工作进程（在独立的子进程中运行）：按需预加载应用后启动各工作进程，补充退出的工作进程，
+    通过健康检查的工作进程数达到配置数量后设置ready通知主进程；收到SIGTERM/SIGINT时平滑停止本代工作进程
+    """
+
+    def __init__(self, workers: int, sockets, ready, preload: bool):
+        self.workers = workers
+        self.sockets = sockets
+        self.ready = ready
+        self.preload = preload
+        self.processes: List = []
+        self.ready_events: List = []
+        self.should_exit = threading.Event()
+        self.exit_code = 0
+        self.mp_context = multiprocessing.get_context("fork" if preload else "spawn")
+
+    def signal_handler(self, signum, frame):
+        self.should_exit.set()
+
+    def spawn_worker(self):
+        """启动一个工作进程：预加载时直接fork，否则以spawn方式重新导入应用"""
+        config = build_config(self.workers)
+        # 本代就绪之前启动的进程都参与健康检查（包括达到请求上限后补充的进程）
+        ready = None
+        if not self.ready.is_set():
+            ready = self.mp_context.Event()
+            self.ready_events.append(ready)
+        process = self.mp_context.Process(target=serve_worker, args=(config, self.sockets),
+                                          kwargs={"ready": ready})
+        process.start()
+        process.started_at = time.monotonic()
+        self.processes.append(process)
+        print(f"👷 工作进程已启动 (PID: {process.pid}, 请求上限: {config.limit_max_requests or '不限'})")
+        return process
+
+    def reap_workers(self):
+        """补充已退出的工作进程；刚启动就异常退出时停止本代，避免反复重启"""
+        for process in list(self.processes):
+            if process.is_alive():
+                continue
+            process.join()
+            self.processes.remove(process)
+            if process.exitcode != 0 and time.monotonic() - process.started_at < BOOT_TIMEOUT:
+                print(f"❌ 工作进程 {process.pid} 启动失败 (退出码: {process.exitcode})")
+                self.exit_code = 1
+                self.should_exit.set()
+                return
+            print(f"♻️ 工作进程 {process.pid} 已退出 (退出码: {process.exitcode})，启动新进程")
+            self.spawn_worker()
+
+    def check_ready(self):
+        """通过健康检查的工作进程数达到配置数量后通知主进程"""
+        if self.ready.is_set():
+            return
+        if sum(event.is_set() for event in self.ready_events) >= self.workers:
+            self.ready.set()
+            self.ready_events.clear()
+
+    def run(self) -> int:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self.signal_handler)
+        if hasattr(signal, "SIGHUP"):
+            # SIGHUP只由主进程处理
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        if self.preload:
+            importlib.import_module("main")
+            print(f"📦 工作进程组 (PID: {os.getpid()}) 已预加载应用")
+            print(startup_timer.report())
+
+        for _ in range(self.workers):
+            self.spawn_worker()
+        try:
+            while not self.should_exit.wait(0.2):
+                self.check_ready()
+                self.reap_workers()
+        finally:
+            stop_processes(self.processes, timeout=ServerConfig.GRACEFUL_TIMEOUT + 5)
+        return self.exit_code
+
+def run_generation(workers: int, sockets, ready, preload: bool):
+    """工作进程组入口（在子进程中执行）"""
+    sys.exit(WorkerGeneration(workers, sockets, ready, preload).run())
+
+def stop_processes(processes: List, timeout: float):
+    """通知进程处理完当前请求后退出，超时未退出的强制结束"""
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    deadline = time.monotonic() + timeout
+    for process in processes:
+        process.join(max(deadline - time.monotonic(), 0))
+        if process.is_alive():
+            print(f"🔥 强制停止进程 {process.pid}")
+            process.kill()
+            process.join()
+
+class WorkerSupervisor:
+    """
+    主进程：绑定监听端口并管理工作进程组，工作进程组意外退出时重新启动，
+    收到SIGTERM/SIGINT时平滑停止，收到SIGHUP时按组替换工作进程
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.preload = can_preload()
+        self.generation = None
+        self.should_exit = threading.Event()
+        self.should_reload = threading.Event()
+        self.sockets = []
+        self.exit_code = 0
+        self.mp_context = multiprocessing.get_context("spawn")
+
+    def signal_handler(self, signum, frame):
+        self.should_exit.set()
+
+    def reload_handler(self, signum, frame):
+        self.should_reload.set()
+
+    def start_generation(self):
+        """启动新的工作进程组（spawn方式，重新导入代码和配置）"""
+        ready = self.mp_context.Event()
+        process = self.mp_context.Process(
+            target=run_generation, args=(self.workers, self.sockets, ready, self.preload)
+        )
+        process.start()
+        process.ready = ready
+        print(f"🧩 工作进程组已启动 (PID: {process.pid}, {'预加载应用后fork' if self.preload else '各进程独立导入'})")
+        return process
+
+    def check_generation(self):
+        """工作进程组意外退出时重新启动；未就绪就退出视为启动失败，停止服务"""
+        process = self.generation
+        if process.is_alive():
+            return
+        process.join()
+        if not process.ready.is_set():
+            print(f"❌ 工作进程组启动失败 (退出码: {process.exitcode})，停止服务")
+            self.exit_code = 1
+            self.should_exit.set()
+            return
+        print(f"♻️ 工作进程组 {process.pid} 已退出 (退出码: {process.exitcode})，重新启动")
+        self.generation = self.start_generation()
+
+    def reload(self):
+        """平滑重启：新的工作进程组全部通过健康检查后再停止旧进程组，监听端口始终保持打开"""
+        self.should_reload.clear()
+        print("🔄 平滑重启：启动新的工作进程组...")
+        new_generation = self.start_generation()
+
+        deadline = time.monotonic() + ServerConfig.RELOAD_TIMEOUT
+        ready = False
+        while time.monotonic() < deadline and not self.should_exit.is_set():
+            if new_generation.ready.wait(0.2):
+                ready = True
+                break
+            if not new_generation.is_alive():
+                break
+
+        if not ready:
+            print(f"❌ 新工作进程未通过健康检查 {ServerConfig.HEALTH_CHECK_PATH}，保留旧进程继续服务")
+            stop_processes([new_generation], timeout=10)
+            return
+
+        print(f"✅ 新工作进程已就绪，停止旧的工作进程组 {self.generation.pid}")
+        old_generation, self.generation = self.generation, new_generation
+        stop_processes([old_generation], timeout=ServerConfig.GRACEFUL_TIMEOUT + 10)
+        print("✅ 平滑重启完成")
+
+    def run(self) -> int:
+        config = build_config(self.workers)
+        self.sockets = [config.bind_socket()]
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self.signal_handler)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self.reload_handler)
+
+        print(f"🧭 主进程 (PID: {os.getpid()}) 启动 {self.workers} 个工作进程")
+        self.generation = self.start_generation()
+        try:
+            while not self.should_exit.wait(0.5):
+                if self.should_reload.is_set():
+                    self.reload()
+                else:
+                    self.check_generation()
+        finally:
+            print("🛑 正在停止工作进程...")
+            stop_processes([self.generation], timeout=ServerConfig.GRACEFUL_TIMEOUT + 10)
+            for sock in self.sockets:
+                sock.close()
+        print("✅ 服务已停止")
+        return self.exit_code
+
+def run_server(workers: Optional[int] = None) -> int:
+    """按 [server] 配置启动服务，返回退出码"""
+    workers = worker_count(workers)
+    config = build_config(workers)
+    print(f"🚀 启动生产服务器: http://{config.host}:{config.port}")
+    print(f"   工作进程: {workers}，backlog: {config.backlog}，"
+          f"并发上限: {config.limit_concurrency or '不限'}，keep-alive: {config.timeout_keep_alive}秒")
+    # 单进程时同样由主进程管理，以便定期重启和平滑重启
+    return WorkerSupervisor(workers).run()
+
+def main():
+    parser = argparse.ArgumentParser(description="ShopSite 生产环境服务器")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                        help="工作进程数（默认读取 [server] workers，0表示按CPU核心数）")
+    args = parser.parse_args()
+    sys.exit(run_server(args.workers))
+
+if __name__ == "__main__":
+    main()
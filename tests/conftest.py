@@ -0,0 +1,87 @@
+"""
+测试公共配置
+使用临时目录中的SQLite数据库，同步会话（get_db）和异步会话（get_async_db，aiosqlite驱动）读写同一个数据库文件；
+站点缓存关闭，失效标记写入临时目录
+运行: python -m pytest tests
+"""
+
+import os
+import sys
+import tempfile
+
+# 添加项目根目录到Python路径；环境变量需在导入配置前设置
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_tmp_dir = tempfile.mkdtemp(prefix="shopsite-test-")
+os.environ.setdefault("CACHE_ENABLED", "false")
+os.environ.setdefault("CACHE_STAMP_DIR", os.path.join(_tmp_dir, "cache"))
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from api.models.database import Base, get_async_db, get_db
+from api.models.models import Category, Product
+
+# 测试数据：60个产品，每个产品属于不同的分类（分类逐个加载时语句数随每页数量增长）
+PRODUCT_COUNT = 60
+
+@pytest.fixture(scope="session")
+def engine():
+    """同步引擎，建表并写入测试数据"""
+    engine = create_engine(f"sqlite:///{os.path.join(_tmp_dir, 'test.db')}",
+                           connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    categories = [Category(name=f"分类{i}", name_en=f"Category {i}") for i in range(PRODUCT_COUNT)]
+    session.add_all(categories)
+    session.flush()
+    session.add_all(
+        Product(
+            name=f"产品{i}",
+            name_en=f"Product {i}",
+            description="描述",
+            price=10 + i,
+            image_url="/images/product.png",
+            sales_count=i % 7,
+            category_id=categories[i].id,
+        )
+        for i in range(PRODUCT_COUNT)
+    )
+    session.commit()
+    session.close()
+    yield engine
+    engine.dispose()
+
+@pytest.fixture(scope="session")
+def async_engine(engine):
+    """异步引擎（aiosqlite），与同步引擎使用同一个数据库文件"""
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(_tmp_dir, 'test.db')}")
+    yield async_engine
+    async_engine.sync_engine.dispose()
+
+@pytest.fixture(scope="session")
+def client(engine, async_engine):
+    from main import app
+
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    TestAsyncSession = async_sessionmaker(
+        bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+    def override_get_db():
+        db = TestSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with TestAsyncSession() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
@@ -0,0 +1,25 @@
+"""
+条件请求测试
+"""
+
+import time
+
+from api.utils.cache import PRODUCTS, site_cache
+
+def test_validators_change_only_with_content_version(client, monkeypatch):
+    first = client.get("/api/products/")
+    etag, last_modified = first.headers["ETag"], first.headers["Last-Modified"]
+
+    # 超过缓存周期后校验值不变，客户端仍可得到304
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 3600)
+    second = client.get("/api/products/", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert client.get("/api/products/", headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    time.sleep(0.01)
+    site_cache.invalidate(PRODUCTS)
+    third = client.get("/api/products/", headers={"If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["ETag"] != etag
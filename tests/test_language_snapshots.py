@@ -0,0 +1,22 @@
+"""
+多语言接口快照缓存测试
+"""
+
+from api.utils.cache import PRODUCTS, site_cache
+
+def test_search_requests_do_not_evict_product_snapshots(client, monkeypatch):
+    monkeypatch.setattr(site_cache, "enabled", True)
+    monkeypatch.setattr(site_cache, "max_entries", 4)
+    monkeypatch.setattr(site_cache, "_entries", {})
+
+    product_id = client.get("/api/products/").json()["items"][0]["id"]
+    assert client.get(f"/api/language/en/products/{product_id}").status_code == 200
+    detail_key = ("language", "detail", "en", product_id)
+    assert detail_key in site_cache._entries[PRODUCTS]
+
+    for i in range(10):
+        assert client.get("/api/language/en/products", params={"q": f"产品{i}"}).status_code == 200
+        assert client.get("/api/language/en/products",
+                          params={"pagination": "cursor", "min_price": i}).status_code == 200
+
+    assert list(site_cache._entries[PRODUCTS]) == [detail_key]
@@ -0,0 +1,48 @@
+"""
+产品列表游标分页测试
+"""
+
+import pytest
+
+from tests.conftest import PRODUCT_COUNT
+
+def walk(client, url, **params) -> list:
+    """按next_cursor逐页读取，返回所有产品ID"""
+    ids, cursor = [], None
+    while True:
+        query = dict(params, pagination="cursor", size=7)
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get(url, params=query)
+        assert response.status_code == 200
+        data = response.json()
+        ids += [item["id"] for item in data.get("items", data.get("data", []))]
+        cursor = data["next_cursor"]
+        if not cursor:
+            return ids
+
+@pytest.mark.parametrize("url", ["/api/products/", "/api/language/en/products"])
+@pytest.mark.parametrize("sort_by, sort_order", [(None, "asc"), ("sales_count", "desc"), ("sales_count", "asc")])
+def test_cursor_walk_returns_every_product_once(client, url, sort_by, sort_order):
+    params = {"sort_order": sort_order}
+    if sort_by:
+        params["sort_by"] = sort_by
+    ids = walk(client, url, **params)
+    assert len(ids) == PRODUCT_COUNT
+    assert len(set(ids)) == PRODUCT_COUNT
+
+@pytest.mark.parametrize("url", ["/api/products/", "/api/language/en/products"])
+@pytest.mark.parametrize("sort_by", ["price", "relevance"])
+def test_cursor_rejects_unsupported_sort_fields(client, url, sort_by):
+    response = client.get(url, params={"pagination": "cursor", "sort_by": sort_by})
+    assert response.status_code == 400
+    assert sort_by in response.json()["detail"]
+
+def test_product_detail(client):
+    product_id = walk(client, "/api/products/")[0]
+    response = client.get(f"/api/products/{product_id}", headers={"Accept-Language": "en"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Product 0"
+    assert data["category"]["name"] == "Category 0"
+    assert client.get("/api/products/999999").status_code == 404
@@ -0,0 +1,23 @@
+"""
+产品列表的SQL语句数量测试
+每页查询的语句数应与每页数量无关（产品的分类一次性加载，不按产品逐个查询）
+"""
+
+import pytest
+
+from api.models.database import QueryCounter
+
+def count_queries(client, async_engine, **params) -> int:
+    """请求产品列表，返回执行的SQL语句数（产品接口使用异步会话）"""
+    with QueryCounter(async_engine.sync_engine) as counter:
+        response = client.get("/api/products/", params=params)
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == params["size"]
+    assert counter.count > 0
+    return counter.count
+
+@pytest.mark.parametrize("extra", [{}, {"pagination": "cursor"}, {"sort_by": "price", "sort_order": "desc"}])
+def test_product_list_queries_do_not_grow_with_page_size(client, async_engine, extra):
+    small = count_queries(client, async_engine, size=5, **extra)
+    large = count_queries(client, async_engine, size=50, **extra)
+    assert small == large
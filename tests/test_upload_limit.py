@@ -0,0 +1,28 @@
+"""
+上传请求体大小限制测试
+"""
+
+from api.utils.uploads import MULTIPART_OVERHEAD
+from config.config import UploadConfig
+
+def test_oversized_upload_is_rejected_before_parsing(client):
+    body = b"x" * (UploadConfig.MAX_FILE_SIZE + MULTIPART_OVERHEAD + 1)
+    # 未登录：表单解析后会返回403，提前拒绝时返回413
+    response = client.post("/api/upload/image", files={"file": ("big.png", body, "image/png")})
+    assert response.status_code == 413
+
+def test_oversized_chunked_upload_is_aborted(client):
+    limit = UploadConfig.MAX_FILE_SIZE + MULTIPART_OVERHEAD
+
+    def chunks():
+        # 不声明Content-Length，按实际读取量中止
+        for _ in range(limit // 65536 + 2):
+            yield b"x" * 65536
+
+    response = client.post("/api/upload/image", content=chunks(),
+                           headers={"Content-Type": "multipart/form-data; boundary=abc"})
+    assert response.status_code == 413
+
+def test_small_upload_reaches_the_route(client):
+    response = client.post("/api/upload/image", files={"file": ("small.png", b"x" * 1024, "image/png")})
+    assert response.status_code in (401, 403)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+上传文件维护工具
+    python upload_tools.py variants [--force]   为已上传的图片补生成响应式版本
+    python upload_tools.py gc [--delete]        查找（并删除）不再被任何内容引用的上传文件
+"""
+
+import sys
+import os
+import argparse
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from config.config import UploadConfig
+    from api.models.database import SessionLocal
+    from api.utils.image_variants import backfill_variants, variants_enabled, remove_variants
+    from api.utils.uploads import upload_reference_counts, find_unreferenced_uploads
+except ImportError as e:
+    print(f"❌ 导入错误: {e}")
+    print("请确保在项目根目录运行此脚本，并已安装所有依赖包")
+    sys.exit(1)
+
+def generate_variants_command(args) -> int:
+    """补生成图片版本"""
+    if not variants_enabled():
+        print("❌ 未安装Pillow或配置中已关闭 [image_variants]，无法生成图片版本")
+        return 1
+
+    upload_dir = UploadConfig.UPLOAD_PATH
+    print(f"🔄 正在处理上传目录: {upload_dir}")
+    generated, skipped, failed = backfill_variants(upload_dir, force=args.force)
+
+    print(f"✅ 生成 {generated} 张，跳过 {skipped} 张（已有版本或不支持的图片）")
+    if failed:
+        print(f"❌ 失败 {len(failed)} 张:")
+        for message in failed:
+            print(f"   {message}")
+        return 1
+    return 0
+
+def _remove_empty_dirs(path: str, root: str):
+    """删除文件后逐级清理空的分片目录"""
+    directory = os.path.dirname(path)
+    while os.path.abspath(directory) != os.path.abspath(root):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            break
+        directory = os.path.dirname(directory)
+
+def gc_command(args) -> int:
+    """清理未被引用的上传文件"""
+    upload_dir = UploadConfig.UPLOAD_PATH
+    db = SessionLocal()
+    try:
+        references = upload_reference_counts(db)
+    finally:
+        db.close()
+
+    unreferenced = find_unreferenced_uploads(upload_dir, references, min_age=args.min_age_hours * 3600)
+    print(f"📊 被引用的文件 {len(references)} 个，未被引用的文件 {len(unreferenced)} 个")
+    freed = 0
+    for relative_path in unreferenced:
+        path = os.path.join(upload_dir, relative_path)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        print(f"   {'🗑️ 删除' if args.delete else '📄'} {relative_path} ({size} 字节)")
+        if args.delete:
+            try:
+                os.remove(path)
+                remove_variants(path)
+                _remove_empty_dirs(path, upload_dir)
+            except OSError as e:
+                print(f"   ❌ 删除失败: {e}")
+                continue
+        freed += size
+
+    if args.delete:
+        print(f"✅ 已删除 {len(unreferenced)} 个文件，释放 {freed} 字节（不含图片版本）")
+    elif unreferenced:
+        print(f"ℹ️ 共 {freed} 字节可释放，加 --delete 参数执行删除")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="上传文件维护工具")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    variants_parser = subparsers.add_parser("variants", help="为已上传的图片补生成响应式版本")
+    variants_parser.add_argument("--force", action="store_true", help="重新生成已有版本的图片")
+    variants_parser.set_defaults(handler=generate_variants_command)
+
+    gc_parser = subparsers.add_parser("gc", help="查找不再被任何内容引用的上传文件")
+    gc_parser.add_argument("--delete", action="store_true", help="删除找到的文件（默认只列出）")
+    gc_parser.add_argument("--min-age-hours", type=float, default=24,
+                           help="只处理上传超过该时长的文件，避免删除刚上传尚未保存到内容中的文件（默认24小时）")
+    gc_parser.set_defaults(handler=gc_command)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+if __name__ == "__main__":
+    main()
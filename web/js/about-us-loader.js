@@ -10,6 +10,15 @@ async function loadAboutUsContent() {
         // 获取当前语言
         const currentLang = window.i18n ? window.i18n.getCurrentLanguage() : 'zh';
         
+        // 优先使用首页聚合数据，失败时回退到独立接口
+        if (typeof api !== 'undefined') {
+            const homeData = await api.getHomeData(currentLang).catch(() => null);
+            if (homeData && homeData.about_us) {
+                renderAboutUsContent(homeData.about_us);
+                return;
+            }
+        }
+        
         const apiBase = window.api ? window.api.baseURL : (window.location.hostname === 'localhost' ? 'http://localhost:8000/api' : '/api');
         
         let response;
@@ -37,34 +46,39 @@ async function loadAboutUsContent() {
             data = responseData;
         }
         
-        console.log('About us data loaded:', data);
-        
-        // 更新标题
-        if (data.title) {
-            const titleElement = document.getElementById('about-title');
-            if (titleElement) {
-                titleElement.textContent = data.title;
-            }
-        }
-        
-        // 更新内容
-        if (data.content) {
-            const contentElement = document.getElementById('about-content');
-            if (contentElement) {
-                // 将换行符转换为段落
-                const paragraphs = data.content.split('\n').filter(p => p.trim());
-                contentElement.innerHTML = paragraphs.map(p => `<p>${p.trim()}</p>`).join('');
-            }
-        }
-        
-        // 更新样式
-        updateAboutUsStyles(data);
+        renderAboutUsContent(data);
         
     } catch (error) {
         console.error('Error loading about us content:', error);
     }
 }
 
+// 渲染关于我们内容
+function renderAboutUsContent(data) {
+    console.log('About us data loaded:', data);
+    
+    // 更新标题
+    if (data.title) {
+        const titleElement = document.getElementById('about-title');
+        if (titleElement) {
+            titleElement.textContent = data.title;
+        }
+    }
+    
+    // 更新内容
+    if (data.content) {
+        const contentElement = document.getElementById('about-content');
+        if (contentElement) {
+            // 将换行符转换为段落
+            const paragraphs = data.content.split('\n').filter(p => p.trim());
+            contentElement.innerHTML = paragraphs.map(p => `<p>${p.trim()}</p>`).join('');
+        }
+    }
+    
+    // 更新样式
+    updateAboutUsStyles(data);
+}
+
 // 更新关于我们样式
 function updateAboutUsStyles(data) {
     const aboutSection = document.getElementById('about');
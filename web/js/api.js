@@ -222,6 +222,31 @@ class API {
         return this.delete(`/admin/categories/${id}`, true);
     }
 
+    // === 首页聚合API ===
+
+    // 获取首页聚合数据（顶部信息栏、轮播图、特色产品、分类、关于我们、页脚）
+    // 同一语言只发起一次请求，各模块共享结果
+    getHomeData(lang = 'zh') {
+        if (!this.homeDataPromises) {
+            this.homeDataPromises = {};
+        }
+        if (!this.homeDataPromises[lang]) {
+            this.homeDataPromises[lang] = fetch(`${this.baseURL}/home/?lang=${lang}`)
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP error! status: ${response.status}`);
+                    }
+                    return response.json();
+                })
+                .catch(error => {
+                    // 失败后允许重试，调用方回退到独立接口
+                    delete this.homeDataPromises[lang];
+                    throw error;
+                });
+        }
+        return this.homeDataPromises[lang];
+    }
+
     // === 产品相关API ===
     
     // 获取产品列表（公开API，只返回活跃产品）
@@ -323,3 +348,39 @@ class API {
 
 // 创建全局API实例
 const api = new API();
+
+// 响应式图片：根据接口返回的 image_variants 生成 <picture>/srcset，浏览器按显示尺寸选择合适的版本
+function responsiveImage(url, variants, attrs = '', sizes = '100vw') {
+    if (!variants || !variants.srcset) {
+        return `<img src="${url}" ${attrs}>`;
+    }
+    const sources = (variants.sources || [])
+        .map(source => `<source type="${source.type}" srcset="${source.srcset}" sizes="${sizes}">`)
+        .join('');
+    const img = `<img src="${url}" srcset="${variants.srcset}" sizes="${sizes}" ${attrs}>`;
+    return sources ? `<picture>${sources}${img}</picture>` : img;
+}
+
+// 选择不小于显示宽度的最小版本（用于CSS背景图等无法使用srcset的场景）
+function pickImageVariant(url, variants, displayWidth) {
+    if (!variants || !variants.srcset) {
+        return url;
+    }
+    const target = displayWidth * (window.devicePixelRatio || 1);
+    const webp = (variants.sources || []).find(source => source.type === 'image/webp');
+    const srcset = webp && supportsWebP() ? webp.srcset : variants.srcset;
+    const candidates = srcset.split(',').map(entry => {
+        const [candidateUrl, width] = entry.trim().split(/\s+/);
+        return { url: candidateUrl, width: parseInt(width, 10) };
+    }).sort((a, b) => a.width - b.width);
+    const match = candidates.find(candidate => candidate.width >= target);
+    return (match || candidates[candidates.length - 1]).url;
+}
+
+function supportsWebP() {
+    if (supportsWebP.result === undefined) {
+        const canvas = document.createElement('canvas');
+        supportsWebP.result = canvas.toDataURL && canvas.toDataURL('image/webp').startsWith('data:image/webp');
+    }
+    return supportsWebP.result;
+}
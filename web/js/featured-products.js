@@ -34,6 +34,17 @@ class FeaturedProducts {
             // 获取当前语言
             const currentLang = window.i18n ? window.i18n.getCurrentLanguage() : 'zh';
             
+            // 优先使用首页聚合数据，失败时回退到独立接口
+            if (typeof api !== 'undefined') {
+                const homeData = await api.getHomeData(currentLang).catch(() => null);
+                if (homeData && homeData.featured_products) {
+                    this.featuredProducts = homeData.featured_products;
+                    console.log('📦 获取到特色产品数据:', this.featuredProducts);
+                    this.renderFeaturedProducts();
+                    return;
+                }
+            }
+            
             let response;
             if (currentLang === 'en') {
                 response = await fetch('/api/language/en/featured-products');
@@ -218,7 +229,7 @@ class FeaturedProducts {
                  title="点击查看 ${productName} 详情">
                 <div class="product-image">
                     ${imageUrl ? 
-                        `<img src="${imageUrl}" alt="${productName}" style="width: 100%; height: 200px; object-fit: cover; border-radius: 8px;">` : 
+                        responsiveImage(imageUrl, product.image_variants, `alt="${productName}" loading="lazy" style="width: 100%; height: 200px; object-fit: cover; border-radius: 8px;"`, '(max-width: 768px) 100vw, 400px') : 
                         `<div style="width: 100%; height: 200px; background: #f8f9fa; border-radius: 8px; display: flex; align-items: center; justify-content: center; color: #6c757d; font-size: 14px;">
                             <i class="fas fa-image" style="font-size: 24px;"></i>
                             <span style="margin-left: 8px;">暂无图片</span>
@@ -16,6 +16,17 @@ class FooterLoader {
         try {
             console.log('Loading footer info...');
             
+            // 优先使用首页聚合数据，失败时回退到独立接口
+            if (typeof api !== 'undefined') {
+                const currentLang = window.i18n ? window.i18n.getCurrentLanguage() : 'zh';
+                const homeData = await api.getHomeData(currentLang).catch(() => null);
+                if (homeData && homeData.footer_info) {
+                    this.renderFooter(homeData.footer_info);
+                    this.isLoaded = true;
+                    return;
+                }
+            }
+            
             const response = await fetch(this.apiUrl);
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
@@ -26,6 +26,16 @@ class HeroCarousel {
             // 获取当前语言
             const currentLang = window.i18n ? window.i18n.getCurrentLanguage() : 'zh';
             
+            // 优先使用首页聚合数据，失败时回退到独立接口
+            if (typeof api !== 'undefined') {
+                const homeData = await api.getHomeData(currentLang).catch(() => null);
+                if (homeData && homeData.background_images) {
+                    this.slides = homeData.background_images.filter(item => item.is_active);
+                    console.log('背景图加载成功:', this.slides);
+                    return;
+                }
+            }
+            
             let response;
             if (currentLang === 'en') {
                 // 使用英文API
@@ -144,7 +154,8 @@ class HeroCarousel {
             
             if (slide.image_url && slide.image_url.trim()) {
                 console.log('设置背景图片:', slide.image_url);
-                slideElement.style.backgroundImage = `url(${slide.image_url})`;
+                const imageUrl = pickImageVariant(slide.image_url, slide.image_variants, window.innerWidth);
+                slideElement.style.backgroundImage = `url(${imageUrl})`;
                 slideElement.style.backgroundSize = 'cover';
                 slideElement.style.backgroundPosition = 'center';
                 slideElement.style.backgroundRepeat = 'no-repeat';
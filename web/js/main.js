@@ -214,6 +214,15 @@ async function loadCategories() {
         // 获取当前语言
         const currentLang = window.i18n ? window.i18n.getCurrentLanguage() : 'zh';
         
+        // 优先使用首页聚合数据，失败时回退到独立接口
+        const homeData = await api.getHomeData(currentLang).catch(() => null);
+        if (homeData && homeData.categories) {
+            categoriesCache = homeData.categories;
+            categoriesCacheTime = now;
+            renderCategories(homeData.categories);
+            return homeData.categories;
+        }
+        
         // 获取分类数据 - 根据语言选择API
         let response;
         if (currentLang === 'en') {
@@ -363,7 +372,7 @@ async function loadProducts() {
         
         const params = {
             page: currentPage,
-            limit: 12,
+            size: 12,
             is_active: true
         };
         
@@ -409,9 +418,9 @@ async function loadProducts() {
             
             const responseData = await apiResponse.json();
             
-            // 处理多语言API响应格式: {success: true, data: [...]}
+            // 处理多语言API响应格式: {success: true, data: [...], pagination: {...}}
             if (responseData.success && responseData.data) {
-                response = { items: responseData.data };
+                response = { items: responseData.data, pagination: responseData.pagination };
             } else {
                 response = responseData;
             }
@@ -457,7 +466,7 @@ function renderProducts(products) {
             <div class="product-card" onclick="showProductDetails(${product.id})">
                 <div class="product-image">
                     ${product.image_url 
-                        ? `<img src="${product.image_url}" alt="${product.name}" onerror="this.style.display='none'; this.parentNode.innerHTML='<i class=&quot;fas fa-image&quot;></i>'">`
+                        ? responsiveImage(product.image_url, product.image_variants, `alt="${product.name}" loading="lazy" onerror="this.style.display='none'; this.closest('.product-image').innerHTML='<i class=&quot;fas fa-image&quot;></i>'"`, '(max-width: 768px) 100vw, 400px')
                         : '<i class="fas fa-image"></i>'
                     }
                 </div>
@@ -480,7 +489,7 @@ function renderPagination(response) {
     const container = document.getElementById('pagination');
     if (!container) return;
     
-    const totalPages = response.total_pages || Math.ceil((response.total || response.length) / 12);
+    const totalPages = (response.pagination && response.pagination.pages) || response.total_pages || Math.ceil((response.total || response.length) / 12);
     
     if (totalPages <= 1) {
         container.innerHTML = '';
@@ -691,7 +700,7 @@ function renderProductModal(product) {
     container.innerHTML = `
         <div class="product-detail-image">
             ${product.image_url 
-                ? `<img src="${product.image_url}" alt="${productName}">`
+                ? responsiveImage(product.image_url, product.image_variants, `alt="${productName}"`, '(max-width: 768px) 100vw, 800px')
                 : '<i class="fas fa-image"></i>'
             }
         </div>
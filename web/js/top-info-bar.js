@@ -169,6 +169,16 @@ async function loadTopInfoBarData() {
     try {
         console.log('Loading top info bar data...');
         
+        // 优先使用首页聚合数据，失败时回退到独立接口
+        if (typeof api !== 'undefined') {
+            const currentLang = window.i18n ? window.i18n.getCurrentLanguage() : 'zh';
+            const homeData = await api.getHomeData(currentLang).catch(() => null);
+            if (homeData && homeData.top_info) {
+                updateTopInfoBar(homeData.top_info);
+                return;
+            }
+        }
+        
         // 这里可以从API加载数据，暂时使用默认配置
         const apiBase = window.api ? window.api.baseURL : (window.location.hostname === 'localhost' ? 'http://localhost:8000/api' : '/api');
         const response = await fetch(`${apiBase}/top-info/`);